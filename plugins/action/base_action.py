@@ -25,22 +25,38 @@ from __future__ import annotations
 
 import base64
 import fcntl
+import hashlib
 import importlib
+import importlib.util
 import logging
 import os
 import secrets
 import time
+from contextlib import contextmanager
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 
-import yaml
 from ansible.errors import AnsibleError
 from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
 from ansible.utils.display import Display
 
+from ..plugin_utils.manager.frame_rpc import FrameRPCClient, frame_address
+from ..plugin_utils.manager.metrics import CallStats
+from ..plugin_utils.manager.spool import file_checksum
+from ..plugin_utils.platform.argspec_cache import (
+    build_argspec, load_argspec, source_digest,
+)
+from ..plugin_utils.platform.config_diff import diff_output, lists_differ
+from ..plugin_utils.platform.content_index import ContentIndex
+
 logger = logging.getLogger(__name__)
 display = Display()
 
+# argspec id -> (argspec, ArgumentSpecValidator), reused within a process
+_validators = {}
+
 
 class BaseResourceActionPlugin(ActionBase):
     """Data-driven base action plugin for all Meraki resource modules.
@@ -67,9 +83,19 @@ class BaseResourceActionPlugin(ActionBase):
     VALID_STATES: frozenset = frozenset({
         'merged', 'replaced', 'overridden', 'deleted', 'gathered',
     })
+    AFTER_FROM_RESPONSES: bool = True
+
+    # Keyed gathers with more items than this use one collection listing
+    ITEM_LOOKUP_LIMIT: int = 3
 
     _user_model_cls = None
 
+    # Set per task from the ``meraki_action_batches`` host variable.
+    _action_batches: bool = False
+
+    # Set per task when the ``meraki_task_stats`` host variable is true.
+    _task_stats = None
+
     @property
     def _match_key(self) -> str:
         """The field used to index and match resources.
@@ -99,16 +125,30 @@ class BaseResourceActionPlugin(ActionBase):
             index[k] = item
         return index
 
-    def _match_by_content(self, item, candidates):
+    def _content_index(self, candidates):
+        """Index *candidates* for ``_match_by_content``; built once per run."""
+        return ContentIndex(candidates, self._config_matches)
+
+    def _match_by_content(self, item, index):
         """Content-based fallback for Category C resources.
 
         When no canonical key exists and the user didn't supply the system
         key, find a matching resource by comparing all user-supplied fields.
+        *index* is a ``ContentIndex`` over the candidates, so each lookup
+        is a hash probe rather than a scan of every candidate.
         """
-        for candidate in candidates:
-            if self._config_matches(item, candidate):
-                return candidate
-        return None
+        return index.find(item)
+
+    def _spare_items(self, items, used):
+        """Yield ``(position, item)`` for items whose match key is unused.
+
+        For Category C positional fallback.  Keys only ever join *used*,
+        so one generator serves a whole run without rescanning *items*.
+        """
+        for pos, item in enumerate(items):
+            key = str(item.get(self._match_key, ''))
+            if key and key not in used:
+                yield pos, item
 
     def _prepare_user_data(self, item, current, scope_value, user_cls):
         """Build user_data, injecting the system key from a matched resource.
@@ -151,8 +191,9 @@ class BaseResourceActionPlugin(ActionBase):
         """Lazily resolve USER_MODEL dotted path to a class object.
 
         On first load, syncs resource metadata (MODULE_NAME, SCOPE_PARAM,
-        CANONICAL_KEY, SYSTEM_KEY, SUPPORTS_DELETE, VALID_STATES) from the
-        User Model class onto this action plugin instance.
+        CANONICAL_KEY, SYSTEM_KEY, SUPPORTS_DELETE, VALID_STATES,
+        AFTER_FROM_RESPONSES) from the User Model class onto this action
+        plugin instance.
         """
         if self._user_model_cls is not None:
             return self._user_model_cls
@@ -169,13 +210,63 @@ class BaseResourceActionPlugin(ActionBase):
         type(self)._user_model_cls = cls
 
         for attr in ('MODULE_NAME', 'SCOPE_PARAM', 'CANONICAL_KEY',
-                      'SYSTEM_KEY', 'SUPPORTS_DELETE', 'VALID_STATES'):
+                      'SYSTEM_KEY', 'SUPPORTS_DELETE', 'VALID_STATES',
+                      'AFTER_FROM_RESPONSES'):
             model_val = getattr(cls, attr, None)
             if model_val is not None:
                 setattr(self, attr, model_val)
 
         return cls
 
+    def _module_candidates(self):
+        """Import paths of the sibling module, in lookup order."""
+        # Derive module name from action plugin filename convention
+        action_mod = type(self).__module__            # e.g. ...plugins.action.meraki_appliance_vlan
+        action_leaf = action_mod.rsplit('.', 1)[-1]   # meraki_appliance_vlan
+        module_leaf = action_leaf                      # same filename in modules/
+
+        # Try relative import (..modules.meraki_appliance_vlan)
+        parent_pkg = action_mod.rsplit('.', 2)[0]     # ...plugins
+        return (
+            f'{parent_pkg}.modules.{module_leaf}',
+            f'ansible_collections.cisco.meraki_rm.plugins.modules.{module_leaf}',
+        )
+
+    def _load_argspec(self):
+        """Return the module's argspec, compiled once per module version.
+
+        The argspec is looked up by the SHA-256 of the sibling module's
+        source in the runtime directory (see ``argspec_cache``), so a fork
+        neither imports the module nor parses its DOCUMENTATION YAML
+        unless the module changed.  Falls back to parsing when the
+        source file cannot be located.
+
+        Returns:
+            Argspec dict, or None if the module has no DOCUMENTATION
+        """
+        if not self.MODULE_NAME:
+            return None
+
+        digest = None
+        for candidate in self._module_candidates():
+            try:
+                spec = importlib.util.find_spec(candidate)
+            except (ImportError, ValueError):
+                continue
+            if spec is not None and spec.origin:
+                digest = source_digest(spec.origin)
+                break
+
+        if digest is None:
+            doc = self._get_documentation()
+            return self._build_argspec_from_docs(doc) if doc else None
+
+        try:
+            cache_dir = self._runtime_dir() / 'argspec'
+        except OSError:
+            cache_dir = None
+        return load_argspec(digest, self._get_documentation, cache_dir)
+
     def _get_documentation(self) -> str:
         """Auto-discover DOCUMENTATION from the sibling modules/ package.
 
@@ -187,17 +278,7 @@ class BaseResourceActionPlugin(ActionBase):
         if not self.MODULE_NAME:
             return ''
 
-        # Derive module name from action plugin filename convention
-        action_mod = type(self).__module__            # e.g. ...plugins.action.meraki_appliance_vlan
-        action_leaf = action_mod.rsplit('.', 1)[-1]   # meraki_appliance_vlan
-        module_leaf = action_leaf                      # same filename in modules/
-
-        # Try relative import (..modules.meraki_appliance_vlan)
-        parent_pkg = action_mod.rsplit('.', 2)[0]     # ...plugins
-        for candidate in (
-            f'{parent_pkg}.modules.{module_leaf}',
-            f'ansible_collections.cisco.meraki_rm.plugins.modules.{module_leaf}',
-        ):
+        for candidate in self._module_candidates():
             try:
                 mod = importlib.import_module(candidate)
                 doc = getattr(mod, 'DOCUMENTATION', None)
@@ -214,7 +295,9 @@ class BaseResourceActionPlugin(ActionBase):
         Follows the standard Ansible network resource module pattern:
           1. Gather current state → ``before``
           2. Apply desired mutations based on ``state``
-          3. Gather resulting state → ``after``
+          3. Derive ``after`` from ``before`` and the mutation responses,
+             or gather it again when that is not safe (see
+             ``_after_from_responses``)
           4. ``changed = (before != after)``
 
         Supports ``--check`` (dry-run) and ``--diff`` modes:
@@ -242,33 +325,111 @@ class BaseResourceActionPlugin(ActionBase):
 
         self._manager_socket = None
         self._manager_authkey_b64 = None
+        self._task_started = time.perf_counter()
+        self._task_stats = None
+        if boolean(
+            self._host_var(task_vars, 'meraki_task_stats', False), strict=False,
+        ):
+            self._task_stats = CallStats()
 
         args = self._task.args.copy()
 
         try:
             user_cls = self._get_user_model_class()
 
-            doc = self._get_documentation()
-            if doc:
-                argspec = self._build_argspec_from_docs(doc)
-                validated_args = self._validate_data(args, argspec, 'input')
+            argspec = self._load_argspec()
+            if argspec:
+                with self._measure('validation_seconds'):
+                    validated_args = self._validate_data(
+                        args, argspec, 'input',
+                    )
             else:
-                argspec = None
                 validated_args = args
 
             state = validated_args.get('state', 'merged')
             config = validated_args.get('config', [])
             scope_value = validated_args.get(self.SCOPE_PARAM)
+            scopes = validated_args.get('scopes')
+            gathered_dest = validated_args.get('gathered_dest')
+            if gathered_dest and state != 'gathered':
+                raise AnsibleError(
+                    "gathered_dest is only supported with state: gathered"
+                )
+            # Device-scoped modules with an organization-wide listing
+            # document organization_id as an alternative scope.
+            org_id = None
+            if self.SCOPE_PARAM != 'organization_id':
+                org_id = validated_args.get('organization_id')
+            if org_id and (scope_value or config or state != 'gathered'):
+                raise AnsibleError(
+                    f"organization_id gathers every {self.SCOPE_PARAM} in "
+                    f"the organization: it requires state: gathered, "
+                    f"without {self.SCOPE_PARAM} or config"
+                )
+            if scopes and (scope_value or org_id or gathered_dest):
+                raise AnsibleError(
+                    f"scopes is mutually exclusive with {self.SCOPE_PARAM}, "
+                    f"organization_id and gathered_dest"
+                )
+            if not org_id and not scopes and scope_value in (None, ''):
+                raise AnsibleError(
+                    f"missing required arguments: {self.SCOPE_PARAM}"
+                )
 
             manager = self._get_or_spawn_manager(task_vars)
+            if self._task_stats is not None:
+                manager.enable_stats(self._task_stats)
+            self._action_batches = boolean(
+                self._host_var(task_vars, 'meraki_action_batches', False),
+                strict=False,
+            )
+
+            if scopes:
+                return self._run_scoped(
+                    manager, user_cls, argspec, scopes, state, config,
+                )
 
             # -- gathered: read-only, no before/after -----------------------
+            if org_id:
+                gathered = manager.execute(
+                    'find_org', self.MODULE_NAME, {'organization_id': org_id},
+                )['config']
+                if argspec and gathered:
+                    with self._measure('validation_seconds'):
+                        gathered = self._validate_output(
+                            gathered, argspec, keep=(self.SCOPE_PARAM,),
+                        )
+                self._report_cache_stats(manager)
+                return self._build_result(
+                    failed=False, changed=False,
+                    gathered=gathered, config=gathered,
+                )
+
+            if state == 'gathered' and gathered_dest:
+                queries = [
+                    user_cls(**{self.SCOPE_PARAM: scope_value}, **item)
+                    for item in config or [{}]
+                ]
+                fields = list(
+                    (argspec or {}).get('argument_spec', {})
+                    .get('config', {}).get('suboptions', {})
+                ) or None
+                written, changed = self._gather_to_file(
+                    manager, queries, gathered_dest, fields,
+                )
+                self._report_cache_stats(manager)
+                return self._build_result(
+                    failed=False, changed=changed, gathered_dest=written,
+                )
+
             if state == 'gathered':
                 gathered = self._do_gathered(
                     manager, user_cls, scope_value, config,
                 )
                 if argspec and gathered:
-                    gathered = self._validate_output(gathered, argspec)
+                    with self._measure('validation_seconds'):
+                        gathered = self._validate_output(gathered, argspec)
+                self._report_cache_stats(manager)
                 return self._build_result(
                     failed=False, changed=False,
                     gathered=gathered, config=gathered,
@@ -279,7 +440,8 @@ class BaseResourceActionPlugin(ActionBase):
                 manager, user_cls, scope_value, None,
             )
             if argspec and before:
-                before = self._validate_output(before, argspec)
+                with self._measure('validation_seconds'):
+                    before = self._validate_output(before, argspec)
 
             # -- check mode: predict after without applying -----------------
             if self._task.check_mode:
@@ -297,25 +459,29 @@ class BaseResourceActionPlugin(ActionBase):
                 )
 
             if state == 'deleted':
-                self._apply_deleted(
+                applied = self._apply_deleted(
                     manager, user_cls, scope_value, config, before,
                 )
             elif state == 'overridden':
-                self._apply_overridden(
+                applied = self._apply_overridden(
                     manager, user_cls, scope_value, config, before,
                 )
             else:  # merged, replaced
-                self._apply_merged_or_replaced(
+                applied = self._apply_merged_or_replaced(
                     manager, user_cls, scope_value, config, state, before,
                 )
 
-            after = self._do_gathered(
-                manager, user_cls, scope_value, None,
-            )
+            after = self._after_from_responses(before, applied)
+            if after is None:
+                after = self._do_gathered(
+                    manager, user_cls, scope_value, None,
+                )
             if argspec and after:
-                after = self._validate_output(after, argspec)
+                with self._measure('validation_seconds'):
+                    after = self._validate_output(after, argspec)
 
             changed = self._lists_differ(before, after)
+            self._report_cache_stats(manager)
 
             return self._build_result(
                 failed=False, changed=changed,
@@ -325,9 +491,232 @@ class BaseResourceActionPlugin(ActionBase):
             msg = str(e) or f"{type(e).__name__} (no message)"
             return self._build_result(failed=True, msg=msg)
 
+    def _run_scoped(self, manager, user_cls, argspec, scopes, state, config):
+        """Reconcile the same desired config in every scope of ``scopes``.
+
+        Each phase is one ``execute_scoped`` call carrying the operations
+        of every scope, which the manager runs concurrently: gather
+        ``before`` (or the gathered items), apply the mutations, then
+        gather ``after`` for the scopes whose responses do not describe
+        it.  A scope that fails is reported in its own entry of
+        ``scope_results`` and does not stop the others.
+        """
+        if state in ('deleted', 'overridden') and not self.SUPPORTS_DELETE:
+            raise AnsibleError(
+                f"State '{state}' requires delete capability, but "
+                f"{self.__class__.__name__} has SUPPORTS_DELETE=False."
+            )
+
+        scopes = list(dict.fromkeys(str(scope) for scope in scopes))
+        results = {scope: {self.SCOPE_PARAM: scope} for scope in scopes}
+        current = self._gather_scopes(
+            manager, user_cls, argspec, scopes,
+            config if state == 'gathered' else None, results,
+        )
+
+        if state == 'gathered':
+            for scope, gathered in current.items():
+                results[scope].update(changed=False, gathered=gathered)
+        else:
+            for scope, before in current.items():
+                results[scope]['before'] = before
+            if self._task.check_mode:
+                for scope, before in current.items():
+                    results[scope]['after'] = self._predict_after(
+                        state, before, config,
+                    )
+            else:
+                self._apply_scoped(
+                    manager, user_cls, argspec, state, config, current,
+                    results,
+                )
+
+        for scope, before in current.items():
+            entry = results[scope]
+            if 'after' in entry:
+                entry['changed'] = self._lists_differ(before, entry['after'])
+        self._report_cache_stats(manager)
+
+        scope_results = list(results.values())
+        failed = [r[self.SCOPE_PARAM] for r in scope_results if r.get('failed')]
+        extra = {}
+        if failed:
+            extra['msg'] = (
+                f"{len(failed)} of {len(scopes)} scopes failed: "
+                f"{', '.join(failed)}"
+            )
+        return self._build_result(
+            failed=bool(failed),
+            changed=any(r.get('changed') for r in scope_results),
+            scope_results=scope_results, **extra,
+        )
+
+    def _apply_scoped(self, manager, user_cls, argspec, state, config,
+                      current, results):
+        """Plan and apply each scope's mutations, then set its ``after``."""
+        plans = {}
+        for scope, before in current.items():
+            if state == 'deleted':
+                mutations = self._plan_deleted(user_cls, scope, config, before)
+            elif state == 'overridden':
+                mutations = self._plan_overridden(
+                    user_cls, scope, config, before,
+                )
+            else:  # merged, replaced
+                mutations = self._plan_merged_or_replaced(
+                    user_cls, scope, config, state, before,
+                )
+            plans[scope] = mutations or []
+
+        active = [scope for scope in plans if plans[scope]]
+        display.vvv(
+            f"{self.MODULE_NAME}: {len(active)} of {len(plans)} scopes "
+            f"need changes"
+        )
+        outcomes = dict(zip(active, manager.execute_scoped([
+            [(op, self.MODULE_NAME, data) for op, data in plans[scope]]
+            for scope in active
+        ], self.SCOPE_PARAM))) if active else {}
+
+        regather = []
+        for scope, before in current.items():
+            scope_outcomes = outcomes.get(scope, [])
+            error = next(
+                (o['error'] for o in scope_outcomes if 'error' in o), None,
+            )
+            if error is not None:
+                results[scope].update(
+                    failed=True, msg=f"{self.MODULE_NAME} failed: {error}",
+                )
+                regather.append(scope)
+                continue
+            after = self._after_from_responses(before, [
+                (op, data, outcome['result'])
+                for (op, data), outcome in zip(plans[scope], scope_outcomes)
+            ])
+            if after is None:
+                regather.append(scope)
+                continue
+            if argspec and after:
+                with self._measure('validation_seconds'):
+                    after = self._validate_output(after, argspec)
+            results[scope]['after'] = after
+
+        if regather:
+            for scope, after in self._gather_scopes(
+                manager, user_cls, argspec, regather, None, results,
+            ).items():
+                results[scope]['after'] = after
+
+    def _gather_scopes(self, manager, user_cls, argspec, scopes, config,
+                       results):
+        """Gather the items of every scope in one ``execute_scoped`` call.
+
+        Follows the same plan as ``_do_gathered`` for each scope.  A scope
+        whose gather fails is marked failed in *results* and left out of
+        the returned dict.
+
+        Returns:
+            ``{scope: items}``, in the order of *scopes*
+        """
+        lookup_key = self._listing_lookup_key(config)
+        queries = [{}] if lookup_key else config or [{}]
+        outcomes = manager.execute_scoped([
+            [
+                ('find', self.MODULE_NAME,
+                 user_cls(**{self.SCOPE_PARAM: scope}, **item))
+                for item in queries
+            ]
+            for scope in scopes
+        ], self.SCOPE_PARAM)
+
+        gathered = {}
+        for scope, scope_outcomes in zip(scopes, outcomes):
+            error = next(
+                (o['error'] for o in scope_outcomes if 'error' in o), None,
+            )
+            if error is not None:
+                if not results[scope].get('failed'):
+                    results[scope].update(
+                        failed=True,
+                        msg=f"{self.MODULE_NAME} find failed: {error}",
+                    )
+                continue
+            items = []
+            for outcome in scope_outcomes:
+                result = outcome['result']
+                if isinstance(result, dict) and 'config' in result:
+                    items.extend(result['config'])
+                else:
+                    items.append(result)
+            if lookup_key:
+                by_key = {str(r.get(lookup_key)): r for r in items}
+                items = [
+                    by_key[str(item[lookup_key])] for item in config
+                    if str(item[lookup_key]) in by_key
+                ]
+            if argspec and items:
+                with self._measure('validation_seconds'):
+                    items = self._validate_output(items, argspec)
+            gathered[scope] = items
+        return gathered
+
+    @staticmethod
+    def _report_cache_stats(manager):
+        """Show the manager's response cache counters at -vv."""
+        if display.verbosity < 2:
+            return
+        try:
+            stats = manager.cache_stats()
+        except Exception as e:
+            display.vv(f"Platform Manager: cache stats unavailable: {e}")
+            return
+        display.vv(
+            f"Platform Manager cache: {stats['hits']} hits, "
+            f"{stats['misses']} misses, {stats['invalidations']} "
+            f"invalidated, {stats['size']} entries"
+        )
+
+    @contextmanager
+    def _measure(self, field: str):
+        """Add the block's wall-clock time to *field* of the task stats."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._task_stats is not None:
+                self._task_stats.add(**{field: time.perf_counter() - start})
+
+    def _stats_result(self) -> dict:
+        """The ``meraki_stats`` block: API cost and time split of this task.
+
+        ``seconds.rpc`` is the time spent waiting on manager calls and
+        includes ``seconds.manager``, the time spent inside them.  That
+        in turn includes ``http`` and ``transform``; ``http`` sums
+        concurrent requests, so it can exceed ``manager``.
+        """
+        data = self._task_stats.as_dict()
+        return {
+            'http_calls': data['http_calls'],
+            'pages': int(data['pages']),
+            'bytes_received': int(data['bytes_received']),
+            'cache_hits': int(data['cache_hits']),
+            'rate_limit_wait_seconds': round(data['rate_limit_wait_seconds'], 4),
+            'seconds': {
+                'total': round(time.perf_counter() - self._task_started, 4),
+                'validation': round(data['validation_seconds'], 4),
+                'rpc': round(data['rpc_seconds'], 4),
+                'manager': round(data['manager_seconds'], 4),
+                'http': round(data['http_seconds'], 4),
+                'transform': round(data['transform_seconds'], 4),
+            },
+        }
+
     def _build_result(self, **kwargs):
-        """Build result dict, injecting ansible_facts and optional diff."""
+        """Build result dict, injecting ansible_facts, optional diff and stats."""
         result = dict(kwargs)
+        if self._task_stats is not None:
+            result['meraki_stats'] = self._stats_result()
         if self._manager_socket and self._manager_authkey_b64:
             result['ansible_facts'] = {
                 'platform_manager_socket': self._manager_socket,
@@ -337,14 +726,9 @@ class BaseResourceActionPlugin(ActionBase):
                 and 'before' in result and 'after' in result
                 and result.get('before') is not None
                 and result.get('after') is not None):
-            result['diff'] = {
-                'before': yaml.dump(
-                    result['before'], default_flow_style=False, sort_keys=True,
-                ),
-                'after': yaml.dump(
-                    result['after'], default_flow_style=False, sort_keys=True,
-                ),
-            }
+            result['diff'] = diff_output(
+                result['before'], result['after'], self._match_key,
+            )
         return result
 
     # ------------------------------------------------------------------ #
@@ -352,27 +736,96 @@ class BaseResourceActionPlugin(ActionBase):
     # ------------------------------------------------------------------ #
 
     def _do_gathered(self, manager, user_cls, scope_value, config):
-        """Gather current resource state (read-only)."""
+        """Gather current resource state (read-only).
+
+        One or a few keyed items are fetched with one item lookup each.
+        Beyond ``ITEM_LOOKUP_LIMIT`` items, and only when every item
+        carries the key used in the API path, a single collection listing
+        is filtered locally instead.
+        """
+        lookup_key = self._listing_lookup_key(config)
+        if lookup_key:
+            display.vvv(
+                f"{self.MODULE_NAME}: gather plan: 1 listing filtered "
+                f"by {lookup_key} for {len(config)} items"
+            )
+            listed = self._do_gathered(manager, user_cls, scope_value, None)
+            by_key = {str(r.get(lookup_key)): r for r in listed}
+            return [
+                by_key[str(item[lookup_key])] for item in config
+                if str(item[lookup_key]) in by_key
+            ]
+
+        display.vvv(
+            f"{self.MODULE_NAME}: gather plan: {len(config or [{}])} "
+            f"find call(s)"
+        )
         results = []
-        for item in config or [{}]:
-            user_data = user_cls(**{self.SCOPE_PARAM: scope_value}, **item)
-            result = manager.execute('find', self.MODULE_NAME, user_data)
+        found = self._execute_many(manager, [
+            ('find', user_cls(**{self.SCOPE_PARAM: scope_value}, **item))
+            for item in config or [{}]
+        ])
+        for result in found:
             if isinstance(result, dict) and 'config' in result:
                 results.extend(result['config'])
             else:
                 results.append(result)
         return results
 
+    def _listing_lookup_key(self, config):
+        """Key to filter one collection listing by, instead of item lookups.
+
+        Returns:
+            The key used in the API path, when *config* has more than
+            ``ITEM_LOOKUP_LIMIT`` items that all carry it; else None
+        """
+        lookup_key = self.SYSTEM_KEY or self.CANONICAL_KEY
+        if (config and lookup_key
+                and len(config) > self.ITEM_LOOKUP_LIMIT
+                and all(item.get(lookup_key) not in (None, '')
+                        for item in config)):
+            return lookup_key
+        return None
+
+    def _gather_to_file(self, manager, queries, dest, fields=None):
+        """Have the manager write the items of *queries* to *dest*.
+
+        Used for ``gathered_dest``: items go from the manager straight to
+        a JSON Lines file and only its summary comes back.
+
+        Returns:
+            ``(summary, changed)``; changed when the file content differs
+            from what was there before
+        """
+        path = os.path.abspath(os.path.expanduser(dest))
+        previous = file_checksum(path)
+        written = manager.gather_to_file(self.MODULE_NAME, queries, path, fields)
+        display.vvv(
+            f"{self.MODULE_NAME}: {written['count']} items written to {path}"
+        )
+        return written, written['checksum'] != previous
+
     def _apply_deleted(self, manager, user_cls, scope_value, config, before):
-        """Delete specified resources.
+        """Delete specified resources (see ``_plan_deleted``)."""
+        mutations = self._plan_deleted(user_cls, scope_value, config, before)
+        if mutations is None:
+            return None
+        return self._apply_mutations(manager, mutations)
+
+    def _plan_deleted(self, user_cls, scope_value, config, before):
+        """Mutations deleting the specified resources.
 
         Matches by canonical key (or system key for Category C).
         Skips items not present in ``before`` (already absent).
         Injects the system key from ``before`` when needed for API routing.
+
+        Returns:
+            ``[(operation, user_data), ...]``, or None when the resource
+            has no key to match by
         """
         match_key = self._match_key
         if not match_key:
-            return
+            return None
 
         before_by_key = self._index_by_key(before, match_key)
         before_by_sys = (
@@ -380,14 +833,20 @@ class BaseResourceActionPlugin(ActionBase):
             if self.SYSTEM_KEY else {}
         )
 
+        content = (
+            self._content_index(before)
+            if not self.CANONICAL_KEY and self.SYSTEM_KEY else None
+        )
+
+        mutations = []
         for item in config:
             current = None
             if self.SYSTEM_KEY and item.get(self.SYSTEM_KEY):
                 current = before_by_sys.get(str(item[self.SYSTEM_KEY]))
             elif match_key and item.get(match_key):
                 current = before_by_key.get(str(item[match_key]))
-            elif not self.CANONICAL_KEY and self.SYSTEM_KEY:
-                current = self._match_by_content(item, before)
+            elif content is not None:
+                current = self._match_by_content(item, content)
 
             if current is None:
                 continue
@@ -395,11 +854,20 @@ class BaseResourceActionPlugin(ActionBase):
             user_data = self._prepare_user_data(
                 item, current, scope_value, user_cls,
             )
-            manager.execute('delete', self.MODULE_NAME, user_data)
+            mutations.append(('delete', user_data))
+
+        return mutations
 
     def _apply_merged_or_replaced(self, manager, user_cls, scope_value,
                                    config, state, before):
-        """Create or update resources, skipping items already at desired state.
+        """Create or update resources (see ``_plan_merged_or_replaced``)."""
+        return self._apply_mutations(manager, self._plan_merged_or_replaced(
+            user_cls, scope_value, config, state, before,
+        ))
+
+    def _plan_merged_or_replaced(self, user_cls, scope_value, config, state,
+                                 before):
+        """Mutations creating or updating resources, skipping no-ops.
 
         Uses ``before`` to decide create vs update and to skip no-ops.
         When SYSTEM_KEY is set, injects the resolved system key from
@@ -422,6 +890,10 @@ class BaseResourceActionPlugin(ActionBase):
         )
 
         cat_c_used = set()
+        if cat_c:
+            content = self._content_index(before)
+            spare = self._spare_items(before, cat_c_used)
+        mutations = []
 
         for i, item in enumerate(config):
             current = None
@@ -431,14 +903,11 @@ class BaseResourceActionPlugin(ActionBase):
             elif match_key and item.get(match_key):
                 current = before_by_key.get(str(item[match_key]))
             elif cat_c:
-                current = self._match_by_content(item, before)
+                current = self._match_by_content(item, content)
                 if current is None and state != 'merged':
-                    for b in before:
-                        b_key = str(b.get(match_key, ''))
-                        if b_key and b_key not in cat_c_used:
-                            current = b
-                            cat_c_used.add(b_key)
-                            break
+                    _, current = next(spare, (None, None))
+                    if current is not None:
+                        cat_c_used.add(str(current[match_key]))
                 elif current is not None and current.get(match_key):
                     cat_c_used.add(str(current[match_key]))
 
@@ -459,19 +928,32 @@ class BaseResourceActionPlugin(ActionBase):
             user_data = self._prepare_user_data(
                 item, current, scope_value, user_cls,
             )
-            manager.execute(op, self.MODULE_NAME, user_data)
+            mutations.append((op, user_data))
+
+        return mutations
 
     def _apply_overridden(self, manager, user_cls, scope_value, config,
                            before):
+        """Override resources (see ``_plan_overridden``)."""
+        mutations = self._plan_overridden(user_cls, scope_value, config, before)
+        if mutations is None:
+            return None
+        return self._apply_mutations(manager, mutations)
+
+    def _plan_overridden(self, user_cls, scope_value, config, before):
         """Override: delete extras, then replace each desired item.
 
         Uses ``before`` (already gathered by run()) to determine extras.
         Matches by canonical key; injects system key for API routing.
         Skips replace for items already matching desired state.
+
+        Returns:
+            ``[(operation, user_data), ...]``, or None when the resource
+            has no key to match by
         """
         match_key = self._match_key
         if not match_key:
-            return
+            return None
 
         before_by_key = self._index_by_key(before, match_key)
         desired_keys = set()
@@ -482,11 +964,14 @@ class BaseResourceActionPlugin(ActionBase):
             if key_val is not None:
                 desired_keys.add(str(key_val))
 
+        mutations = []
+
         # Delete extras (current items not in desired set)
         matched_before = set()
         if use_content_match:
+            content = self._content_index(before)
             for item in config:
-                m = self._match_by_content(item, before)
+                m = self._match_by_content(item, content)
                 if m and m.get(match_key):
                     matched_before.add(str(m[match_key]))
 
@@ -500,7 +985,7 @@ class BaseResourceActionPlugin(ActionBase):
             delete_data = self._prepare_user_data(
                 delete_item, current, scope_value, user_cls,
             )
-            manager.execute('delete', self.MODULE_NAME, delete_data)
+            mutations.append(('delete', delete_data))
 
         # Replace each desired item (skip no-ops)
         for item in config:
@@ -508,7 +993,7 @@ class BaseResourceActionPlugin(ActionBase):
             if match_key and item.get(match_key):
                 current = before_by_key.get(str(item[match_key]))
             elif use_content_match:
-                current = self._match_by_content(item, before)
+                current = self._match_by_content(item, content)
 
             if current and self._config_matches(item, current):
                 continue
@@ -517,7 +1002,124 @@ class BaseResourceActionPlugin(ActionBase):
                 item, current, scope_value, user_cls,
             )
             op = 'replace' if current is not None else 'create'
-            manager.execute(op, self.MODULE_NAME, user_data)
+            mutations.append((op, user_data))
+
+        return mutations
+
+    def _apply_mutations(self, manager, mutations):
+        """Send collected ``(operation, user_data)`` pairs to the manager.
+
+        With ``meraki_action_batches`` enabled, two or more mutations go
+        to the manager in one ``execute_batch`` call and are applied as
+        Meraki action batches (atomic per batch, far fewer rate-limited
+        calls).  Otherwise they go in one ``execute_many`` call and are
+        executed individually, in order.
+
+        Returns:
+            ``[(operation, user_data, response), ...]`` for individually
+            executed mutations, or None when they were batched (action
+            batches return no resource bodies)
+        """
+        if self._action_batches and len(mutations) > 1:
+            summary = manager.execute_batch(self.MODULE_NAME, mutations)
+            display.vv(
+                f"{self.MODULE_NAME}: {summary.get('actions')} actions "
+                f"(batched={summary.get('batched')}, "
+                f"batches={summary.get('batches')})"
+            )
+            return None
+        if not mutations:
+            return []
+        results = self._execute_many(manager, mutations)
+        return [
+            (op, user_data, result)
+            for (op, user_data), result in zip(mutations, results)
+        ]
+
+    def _execute_many(self, manager, operations):
+        """Execute ``(operation, user_data)`` pairs in one manager call.
+
+        Returns:
+            The results, in order
+
+        Raises:
+            AnsibleError: With the first failed operation's error; the
+                manager does not attempt mutations after a failure
+        """
+        outcomes = manager.execute_many([
+            (op, self.MODULE_NAME, user_data) for op, user_data in operations
+        ])
+        for (op, _), outcome in zip(operations, outcomes):
+            if 'error' in outcome:
+                raise AnsibleError(
+                    f"{self.MODULE_NAME} {op} failed: {outcome['error']}"
+                )
+        return [outcome['result'] for outcome in outcomes]
+
+    def _after_from_responses(self, before, applied):
+        """Build ``after`` by patching ``before`` with mutation responses.
+
+        Create/update/replace responses come back from the manager already
+        transformed to User Model dicts, so they replace (or are appended
+        to) the matching ``before`` entry; deletes remove it.  This saves
+        the second full gather of every mutating task.
+
+        Returns None — meaning "gather ``after`` instead" — when the
+        responses cannot be trusted to describe the resulting state:
+
+        - the User Model sets ``AFTER_FROM_RESPONSES = False``;
+        - the mutations were sent as action batches (``applied`` is None);
+        - a create/update response was empty or lacks the identifying key;
+        - a deleted resource cannot be located in ``before``;
+        - a keyless resource has more than one current entry to patch.
+        """
+        if not self.AFTER_FROM_RESPONSES or applied is None:
+            return None
+
+        after = list(before)
+        if not self._match_key:
+            if len(before) > 1 or len(applied) > 1:
+                return None
+            for op, _, result in applied:
+                if not result:
+                    return None
+                after = [result]
+            return after
+
+        for op, user_data, result in applied:
+            if op == 'delete':
+                ref = (
+                    asdict(user_data) if is_dataclass(user_data)
+                    else user_data
+                )
+                idx = self._find_resource_index(after, ref)
+                if idx is None:
+                    return None
+                after.pop(idx)
+                continue
+
+            if not isinstance(result, dict) or not result.get(self._match_key):
+                return None
+            idx = self._find_resource_index(after, result)
+            if idx is None:
+                after.append(result)
+            else:
+                after[idx] = result
+        return after
+
+    def _find_resource_index(self, items, ref):
+        """Index of the entry in *items* identifying the same resource as *ref*.
+
+        Prefers SYSTEM_KEY (stable across renames of the canonical key),
+        falling back to the match key.
+        """
+        for key in (self.SYSTEM_KEY, self._match_key):
+            if key and ref.get(key) not in (None, ''):
+                for i, item in enumerate(items):
+                    if str(item.get(key)) == str(ref[key]):
+                        return i
+                return None
+        return None
 
     @staticmethod
     def _config_matches(desired: dict, current: dict) -> bool:
@@ -534,21 +1136,13 @@ class BaseResourceActionPlugin(ActionBase):
                 return False
         return True
 
-    @staticmethod
-    def _lists_differ(before: list, after: list) -> bool:
+    def _lists_differ(self, before: list, after: list) -> bool:
         """Compare two config lists to determine if anything changed.
 
-        Handles None values and type mismatches by normalizing to strings.
+        Items are matched by ``_match_key`` and compared by content hash,
+        so item and key order do not matter (see ``config_diff``).
         """
-        if len(before) != len(after):
-            return True
-        for b, a in zip(
-            sorted(before, key=lambda x: str(x)),
-            sorted(after, key=lambda x: str(x)),
-        ):
-            if b != a:
-                return True
-        return False
+        return lists_differ(before, after, self._match_key)
 
     # ------------------------------------------------------------------ #
     #  Check mode: predict after state from set theory                     #
@@ -591,6 +1185,11 @@ class BaseResourceActionPlugin(ActionBase):
                 if k:
                     result_by_key[k] = item
 
+        content = (
+            self._content_index(result)
+            if not self.CANONICAL_KEY and self.SYSTEM_KEY else None
+        )
+
         for item in config:
             if match_key and item.get(match_key):
                 key = str(item[match_key])
@@ -603,14 +1202,19 @@ class BaseResourceActionPlugin(ActionBase):
                     new_item = dict(item)
                     result.append(new_item)
                     result_by_key[key] = new_item
-            elif not self.CANONICAL_KEY and self.SYSTEM_KEY:
-                existing = self._match_by_content(item, result)
+                    if content is not None:
+                        content.add(new_item)
+            elif content is not None:
+                existing = self._match_by_content(item, content)
                 if existing is not None:
                     for field, val in item.items():
                         if val is not None:
                             existing[field] = val
+                    content.refresh(existing)
                 else:
-                    result.append(dict(item))
+                    new_item = dict(item)
+                    result.append(new_item)
+                    content.add(new_item)
             elif not match_key and before:
                 for field, val in item.items():
                     if val is not None:
@@ -636,32 +1240,42 @@ class BaseResourceActionPlugin(ActionBase):
 
         cat_c = not self.CANONICAL_KEY and self.SYSTEM_KEY
         cat_c_used = set()
+        if cat_c:
+            content = self._content_index(result)
+            spare = self._spare_items(result, cat_c_used)
+
+        def put(idx, new_item):
+            if cat_c:
+                content.replace(result[idx], new_item)
+            result[idx] = new_item
+
+        def append(new_item):
+            result.append(new_item)
+            if cat_c:
+                content.add(new_item)
 
         for i, item in enumerate(config):
             if match_key and item.get(match_key):
                 key = str(item[match_key])
                 idx = result_by_key.get(key)
                 if idx is not None:
-                    result[idx] = dict(item)
+                    put(idx, dict(item))
                 else:
-                    result.append(dict(item))
+                    append(dict(item))
                     result_by_key[key] = len(result) - 1
             elif cat_c:
-                matched = self._match_by_content(item, result)
+                matched = self._match_by_content(item, content)
                 if matched is not None:
-                    idx = result.index(matched)
-                    result[idx] = dict(item)
+                    put(content.position(matched), dict(item))
                     if matched.get(match_key):
                         cat_c_used.add(str(matched[match_key]))
                 else:
-                    for j, r in enumerate(result):
-                        r_key = str(r.get(match_key, ''))
-                        if r_key and r_key not in cat_c_used:
-                            result[j] = dict(item)
-                            cat_c_used.add(r_key)
-                            break
+                    j, r = next(spare, (None, None))
+                    if r is not None:
+                        put(j, dict(item))
+                        cat_c_used.add(str(r[match_key]))
                     else:
-                        result.append(dict(item))
+                        append(dict(item))
             elif not match_key and before:
                 result[0] = dict(item)
             else:
@@ -688,12 +1302,14 @@ class BaseResourceActionPlugin(ActionBase):
                 delete_keys.add(str(k))
 
         if not delete_keys and not self.CANONICAL_KEY and self.SYSTEM_KEY:
-            remaining = list(before)
+            content = self._content_index(before)
+            deleted = set()
             for item in config:
-                matched = self._match_by_content(item, remaining)
+                matched = self._match_by_content(item, content)
                 if matched:
-                    remaining = [r for r in remaining if r is not matched]
-            return [dict(r) for r in remaining]
+                    content.remove(matched)
+                    deleted.add(id(matched))
+            return [dict(r) for r in before if id(r) not in deleted]
 
         return [
             dict(item) for item in before
@@ -704,6 +1320,13 @@ class BaseResourceActionPlugin(ActionBase):
     #  Manager lifecycle                                                   #
     # ------------------------------------------------------------------ #
 
+    @staticmethod
+    def _host_var(task_vars: dict, name: str, default=None):
+        """Return a variable of the current inventory host."""
+        hostvars = task_vars.get('hostvars', {})
+        inventory_hostname = task_vars.get('inventory_hostname', 'localhost')
+        return hostvars.get(inventory_hostname, {}).get(name, default)
+
     @staticmethod
     def _runtime_dir():
         """Return a user-private runtime directory for sockets, keys, PIDs.
@@ -719,6 +1342,47 @@ class BaseResourceActionPlugin(ActionBase):
         d.mkdir(mode=0o700, exist_ok=True)
         return d
 
+    @staticmethod
+    def _manager_stem(inventory_hostname: str, meraki_url: str,
+                      meraki_api_key: str, scope: str = 'host') -> str:
+        """Return the runtime file stem naming a manager.
+
+        ``host`` (default) gives each inventory host its own manager.
+        ``credential`` shares one manager, with one rate budget, cache
+        and session pool, between all hosts using the same dashboard URL
+        and API key.  The key itself never appears in the file name,
+        only a truncated SHA-256 of it.
+        """
+        if scope == 'host':
+            return f'manager_{inventory_hostname}'
+        if scope == 'credential':
+            digest = hashlib.sha256(
+                f'{meraki_url}\0{meraki_api_key}'.encode(),
+            ).hexdigest()
+            return f'manager_{digest[:16]}'
+        raise AnsibleError(
+            f"meraki_manager_scope must be 'host' or 'credential', "
+            f"got {scope!r}"
+        )
+
+    @staticmethod
+    def _connect(meraki_url: str, socket_path: str, authkey: bytes,
+                 transport: str = 'manager'):
+        """Connect to the manager at *socket_path* over *transport*.
+
+        ``manager`` (default) uses the ``multiprocessing.managers``
+        proxy.  ``framed`` uses the framed RPC socket next to it, which
+        needs no handshake and sends each call as one signed frame; a
+        manager without that socket falls back to the proxy.
+        """
+        from ..plugin_utils.manager.rpc_client import ManagerRPCClient
+
+        if transport == 'framed':
+            frame_path = frame_address(socket_path)
+            if Path(frame_path).exists():
+                return FrameRPCClient(meraki_url, frame_path, authkey)
+        return ManagerRPCClient(meraki_url, socket_path, authkey)
+
     def _get_or_spawn_manager(self, task_vars: dict):
         """Get existing manager or spawn a new one.
 
@@ -746,10 +1410,8 @@ class BaseResourceActionPlugin(ActionBase):
         processes so only one process spawns and the others connect.
 
         Returns:
-            ManagerRPCClient instance
+            ManagerRPCClient or FrameRPCClient instance (see _connect)
         """
-        from ..plugin_utils.manager.rpc_client import ManagerRPCClient
-
         hostvars = task_vars.get('hostvars', {})
         inventory_hostname = task_vars.get('inventory_hostname', 'localhost')
         host_vars = hostvars.get(inventory_hostname, {})
@@ -767,10 +1429,19 @@ class BaseResourceActionPlugin(ActionBase):
             )
 
         runtime = self._runtime_dir()
-        stem = f'manager_{inventory_hostname}'
+        stem = self._manager_stem(
+            inventory_hostname, meraki_url, meraki_api_key,
+            host_vars.get('meraki_manager_scope', 'host'),
+        )
         socket_path = str(runtime / f'{stem}.sock')
         keyfile = runtime / f'{stem}.key'
         pidfile = runtime / f'{stem}.pid'
+        transport = host_vars.get('meraki_rpc_transport', 'manager')
+        if transport not in ('manager', 'framed'):
+            raise AnsibleError(
+                f"meraki_rpc_transport must be 'manager' or 'framed', "
+                f"got {transport!r}"
+            )
 
         # ── Tier 1: ansible_facts from a prior task in this playbook ──
         cached_socket = task_vars.get('platform_manager_socket')
@@ -779,7 +1450,9 @@ class BaseResourceActionPlugin(ActionBase):
         if cached_socket and cached_authkey_b64 and Path(cached_socket).exists():
             try:
                 authkey = base64.b64decode(cached_authkey_b64)
-                client = ManagerRPCClient(meraki_url, cached_socket, authkey)
+                client = self._connect(
+                    meraki_url, cached_socket, authkey, transport,
+                )
                 display.v("Platform Manager: Tier-1 reconnect via ansible_facts")
                 return client
             except Exception as e:
@@ -798,7 +1471,9 @@ class BaseResourceActionPlugin(ActionBase):
             if Path(socket_path).exists() and keyfile.exists():
                 try:
                     authkey = keyfile.read_bytes()
-                    client = ManagerRPCClient(meraki_url, socket_path, authkey)
+                    client = self._connect(
+                        meraki_url, socket_path, authkey, transport,
+                    )
                     display.v(
                         f"Platform Manager: Tier-2 reconnect via keyfile "
                         f"at {socket_path}"
@@ -810,6 +1485,7 @@ class BaseResourceActionPlugin(ActionBase):
                         f"(stale): {e}"
                     )
                     Path(socket_path).unlink(missing_ok=True)
+                    Path(frame_address(socket_path)).unlink(missing_ok=True)
                     keyfile.unlink(missing_ok=True)
                     pidfile.unlink(missing_ok=True)
 
@@ -820,21 +1496,80 @@ class BaseResourceActionPlugin(ActionBase):
                 f"(survive={survive})"
             )
 
+            from ..plugin_utils.manager.metrics import (
+                DEFAULT_TEXTFILE_INTERVAL,
+            )
             from ..plugin_utils.manager.platform_manager import (
                 PlatformManager,
                 PlatformService,
+                init_manager_process,
+            )
+            from ..plugin_utils.manager.device_index import DEFAULT_INDEX_TTL
+            from ..plugin_utils.manager.rate_limiter import (
+                DEFAULT_BURST,
+                DEFAULT_RATE_LIMIT,
+            )
+            from ..plugin_utils.manager.response_cache import (
+                DEFAULT_CACHE_SIZE,
+                DEFAULT_CACHE_TTL,
+            )
+            from ..plugin_utils.manager.session_pool import (
+                DEFAULT_MAX_CONNECTIONS,
             )
 
             authkey = secrets.token_bytes(32)
 
-            service = PlatformService(meraki_url, meraki_api_key)
+            service = PlatformService(
+                meraki_url,
+                meraki_api_key,
+                max_connections=int(
+                    host_vars.get(
+                        'meraki_max_connections', DEFAULT_MAX_CONNECTIONS,
+                    )
+                ),
+                rate_limit=float(
+                    host_vars.get('meraki_rate_limit', DEFAULT_RATE_LIMIT)
+                ),
+                rate_burst=int(
+                    host_vars.get('meraki_rate_burst', DEFAULT_BURST)
+                ),
+                cache_ttl=float(
+                    host_vars.get('meraki_cache_ttl', DEFAULT_CACHE_TTL)
+                ),
+                cache_size=int(
+                    host_vars.get('meraki_cache_size', DEFAULT_CACHE_SIZE)
+                ),
+                index_ttl=float(
+                    host_vars.get('meraki_index_ttl', DEFAULT_INDEX_TTL)
+                ),
+            )
             PlatformManager.register(
                 'get_platform_service',
                 callable=lambda: service,
             )
 
+            metrics_path = None
+            if boolean(
+                host_vars.get('meraki_metrics_textfile', False), strict=False,
+            ):
+                metrics_path = str(runtime / f'{stem}.prom')
+
+            # start() returns once the server child has bound its socket
+            # and sent the address back over a pipe; no polling needed.
+            # The initializer also binds the framed transport on
+            # <stem>.fsock, starts the background warm-up and, if
+            # enabled, the metrics textfile writer.
             manager = PlatformManager(address=socket_path, authkey=authkey)
-            manager.start()
+            manager.start(
+                initializer=init_manager_process,
+                initargs=(
+                    service, frame_address(socket_path), authkey,
+                    metrics_path,
+                    float(host_vars.get(
+                        'meraki_metrics_interval', DEFAULT_TEXTFILE_INTERVAL,
+                    )),
+                ),
+            )
 
             # Detach from Python's atexit so the server survives
             # fork-worker exits.
@@ -845,14 +1580,9 @@ class BaseResourceActionPlugin(ActionBase):
             if hasattr(fin, '_key') and fin._key in _finalizer_registry:
                 del _finalizer_registry[fin._key]
 
-            max_wait = 50
-            for _ in range(max_wait):
-                if Path(socket_path).exists():
-                    break
-                time.sleep(0.1)
-            else:
+            if not Path(socket_path).exists():
                 raise RuntimeError(
-                    f"Manager socket not ready after {max_wait * 0.1}s"
+                    f"Manager started but socket {socket_path} is missing"
                 )
 
             # Persist runtime files for Tier-2 reconnection.
@@ -868,7 +1598,7 @@ class BaseResourceActionPlugin(ActionBase):
                 f"at {socket_path}"
             )
 
-            client = ManagerRPCClient(meraki_url, socket_path, authkey)
+            client = self._connect(meraki_url, socket_path, authkey, transport)
 
             self._manager_socket = socket_path
             self._manager_authkey_b64 = base64.b64encode(
@@ -897,18 +1627,7 @@ class BaseResourceActionPlugin(ActionBase):
         Raises:
             ValueError: If documentation cannot be parsed
         """
-        try:
-            doc_data = yaml.safe_load(documentation)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse DOCUMENTATION: {e}") from e
-
-        return {
-            'argument_spec': doc_data.get('options', {}),
-            'mutually_exclusive': doc_data.get('mutually_exclusive', []),
-            'required_together': doc_data.get('required_together', []),
-            'required_one_of': doc_data.get('required_one_of', []),
-            'required_if': doc_data.get('required_if', []),
-        }
+        return build_argspec(documentation)
 
     def _validate_data(
         self,
@@ -933,13 +1652,19 @@ class BaseResourceActionPlugin(ActionBase):
         Raises:
             AnsibleError: If validation fails
         """
-        validator = ArgumentSpecValidator(
-            argspec['argument_spec'],
-            mutually_exclusive=argspec.get('mutually_exclusive', []),
-            required_together=argspec.get('required_together', []),
-            required_one_of=argspec.get('required_one_of', []),
-            required_if=argspec.get('required_if', []),
-        )
+        cached = _validators.get(id(argspec))
+        if cached is not None and cached[0] is argspec:
+            validator = cached[1]
+        else:
+            validator = ArgumentSpecValidator(
+                argspec['argument_spec'],
+                mutually_exclusive=argspec.get('mutually_exclusive', []),
+                required_together=argspec.get('required_together', []),
+                required_one_of=argspec.get('required_one_of', []),
+                required_if=argspec.get('required_if', []),
+            )
+            # Keep the argspec referenced so its id() is not reused
+            _validators[id(argspec)] = (argspec, validator)
         result = validator.validate(data)
 
         if result.error_messages:
@@ -951,7 +1676,12 @@ class BaseResourceActionPlugin(ActionBase):
 
         return result.validated_parameters
 
-    def _validate_output(self, results: list, argspec: dict) -> list:
+    def _validate_output(
+        self,
+        results: list,
+        argspec: dict,
+        keep: tuple = ()
+    ) -> list:
         """Validate return data against the config suboptions schema.
 
         Ensures the contract with the user: what we return in ``config``
@@ -961,6 +1691,8 @@ class BaseResourceActionPlugin(ActionBase):
 
         This catches bugs where the reverse transform (API → User) produces
         field names or types that don't match the documented interface.
+        Keys in *keep* are allowed as well (the scope key of items gathered
+        across an organization).
         """
         config_spec = argspec.get('argument_spec', {}).get('config', {})
         suboptions = config_spec.get('suboptions', {})
@@ -968,7 +1700,7 @@ class BaseResourceActionPlugin(ActionBase):
         if not suboptions:
             return results
 
-        valid_keys = set(suboptions.keys())
+        valid_keys = set(suboptions.keys()) | set(keep)
         validated = []
 
         for item in results:
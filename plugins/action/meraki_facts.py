@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from ansible.errors import AnsibleError
+
 from .base_action import BaseResourceActionPlugin
 
 
@@ -21,12 +23,34 @@ class ActionModule(BaseResourceActionPlugin):
             network_id = args.get('network_id')
 
             manager = self._get_or_spawn_manager(task_vars)
+            if self._task_stats is not None:
+                manager.enable_stats(self._task_stats)
 
             facts_args = {
                 'gather_subset': list(gather_subset),
                 'organization_id': org_id,
                 'network_id': network_id,
             }
+
+            gathered_dest = args.get('gathered_dest')
+            if gathered_dest:
+                if len(gather_subset) != 1 or 'all' in gather_subset:
+                    raise AnsibleError(
+                        "gathered_dest requires a single gather_subset "
+                        "other than 'all'"
+                    )
+                written, changed = self._gather_to_file(
+                    manager, [facts_args], gathered_dest,
+                )
+                result = {
+                    'failed': False,
+                    'changed': changed,
+                    'gathered_dest': written,
+                }
+                if self._task_stats is not None:
+                    result['meraki_stats'] = self._stats_result()
+                return result
+
             result = manager.execute('find', self.MODULE_NAME, facts_args)
 
             ansible_facts = {}
@@ -34,11 +58,17 @@ class ActionModule(BaseResourceActionPlugin):
             ansible_facts['meraki_networks'] = result.get('networks', [])
             ansible_facts['meraki_devices'] = result.get('devices', [])
             ansible_facts['meraki_inventory'] = result.get('inventory', [])
+            for subset in ('device_statuses', 'uplinks'):
+                if subset in result:
+                    ansible_facts[f'meraki_{subset}'] = result[subset]
 
-            return {
+            result = {
                 'failed': False,
                 'changed': False,
                 'ansible_facts': ansible_facts,
             }
+            if self._task_stats is not None:
+                result['meraki_stats'] = self._stats_result()
+            return result
         except Exception as e:
             return {'failed': True, 'msg': str(e)}
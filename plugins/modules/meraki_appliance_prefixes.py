@@ -25,9 +25,18 @@ author:
 
 options:
   network_id:
-    description: The network ID.
+    description:
+      - The network ID.
+      - Required unless O(scopes) is given.
     type: str
-    required: true
+
+  scopes:
+    description:
+      - Apply the task to each of these network IDs instead of one O(network_id).
+      - The scopes are reconciled concurrently and reported in RV(scope_results).
+      - Mutually exclusive with O(network_id).
+    type: list
+    elements: str
 
   state:
     description: The state of the resource.
@@ -227,4 +236,13 @@ config:
   description: The resulting resource configuration.
   type: list
   returned: always
+
+scope_results:
+  description:
+    - One entry per scope when O(scopes) is given.
+    - Each entry has the scope key, C(changed), and C(before) and C(after) or C(gathered);
+      a scope that failed also has C(failed) and C(msg).
+  type: list
+  returned: when O(scopes) is given
+  elements: dict
 '''
@@ -12,6 +12,7 @@ short_description: Gather facts about Meraki Dashboard resources
 description:
   - Gather facts about organizations, networks, devices, and inventory
     from the Meraki Dashboard API.
+  - The requested subsets are gathered concurrently.
   - This is a gather-only module that collects information without
     making changes.
 
@@ -22,7 +23,11 @@ author:
 
 options:
   gather_subset:
-    description: What to gather.
+    description:
+      - What to gather.
+      - C(all) covers C(organizations), C(networks), C(devices) and
+        C(inventory). Device and uplink statuses change on every run, so
+        C(device_statuses) and C(uplinks) must be requested by name.
     type: list
     elements: str
     default: [all]
@@ -32,14 +37,31 @@ options:
       - networks
       - devices
       - inventory
+      - device_statuses
+      - uplinks
 
   organization_id:
     description: Scope to a specific organization.
     type: str
 
   network_id:
-    description: Scope to a specific network.
+    description:
+      - Scope to a specific network.
+      - Networks, devices and statuses are filtered by the Dashboard, so
+        only that network's items are transferred. Inventory stays
+        organization-wide.
     type: str
+
+  gathered_dest:
+    description:
+      - Write the gathered items to this file instead of returning them as
+        facts, one JSON object per line (gzip compressed when the path ends
+        in C(.gz)).
+      - Requires a single O(gather_subset) other than C(all), so that every
+        line is the same kind of item.
+      - The result then holds only RV(gathered_dest), with the path, item
+        count and SHA-256 checksum of the file.
+    type: path
 '''
 
 EXAMPLES = r'''
@@ -75,4 +97,18 @@ ansible_facts:
   description: Gathered facts about Meraki resources.
   type: dict
   returned: always
+gathered_dest:
+  description: The file written for O(gathered_dest).
+  type: dict
+  returned: when O(gathered_dest) is set
+  contains:
+    path:
+      description: Absolute path of the file.
+      type: str
+    count:
+      description: Number of items written.
+      type: int
+    checksum:
+      description: SHA-256 of the file.
+      type: str
 '''
@@ -25,9 +25,18 @@ author:
 
 options:
   organization_id:
-    description: The organization ID.
+    description:
+      - The organization ID.
+      - Required unless O(scopes) is given.
     type: str
-    required: true
+
+  scopes:
+    description:
+      - Apply the task to each of these organization IDs instead of one O(organization_id).
+      - The scopes are reconciled concurrently and reported in RV(scope_results).
+      - Mutually exclusive with O(organization_id).
+    type: list
+    elements: str
 
   state:
     description: The state of the resource.
@@ -40,6 +49,17 @@ options:
       - gathered
     default: merged
 
+  gathered_dest:
+    description:
+      - With O(state=gathered), write the gathered items to this file instead
+        of returning them, one JSON object per line (gzip compressed when the
+        path ends in C(.gz)).
+      - The items are written as they are gathered, so memory use does not
+        grow with the size of the organization.
+      - The result then holds only RV(gathered_dest), with the path, item
+        count and SHA-256 checksum of the file.
+    type: path
+
   config:
     description: List of admin configurations.
     type: list
@@ -290,4 +310,27 @@ config:
   description: The resulting resource configuration.
   type: list
   returned: always
+gathered_dest:
+  description: The file written for O(gathered_dest).
+  type: dict
+  returned: when O(gathered_dest) is set
+  contains:
+    path:
+      description: Absolute path of the file.
+      type: str
+    count:
+      description: Number of items written.
+      type: int
+    checksum:
+      description: SHA-256 of the file.
+      type: str
+
+scope_results:
+  description:
+    - One entry per scope when O(scopes) is given.
+    - Each entry has the scope key, C(changed), and C(before) and C(after) or C(gathered);
+      a scope that failed also has C(failed) and C(msg).
+  type: list
+  returned: when O(scopes) is given
+  elements: dict
 '''
@@ -25,9 +25,18 @@ author:
 
 options:
   organization_id:
-    description: The organization ID.
+    description:
+      - The organization ID.
+      - Required unless O(scopes) is given.
     type: str
-    required: true
+
+  scopes:
+    description:
+      - Apply the task to each of these organization IDs instead of one O(organization_id).
+      - The scopes are reconciled concurrently and reported in RV(scope_results).
+      - Mutually exclusive with O(organization_id).
+    type: list
+    elements: str
 
   state:
     description: The state of the resource.
@@ -235,4 +244,13 @@ config:
   description: The resulting resource configuration.
   type: list
   returned: always
+
+scope_results:
+  description:
+    - One entry per scope when O(scopes) is given.
+    - Each entry has the scope key, C(changed), and C(before) and C(after) or C(gathered);
+      a scope that failed also has C(failed) and C(msg).
+  type: list
+  returned: when O(scopes) is given
+  elements: dict
 '''
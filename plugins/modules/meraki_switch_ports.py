@@ -12,6 +12,10 @@ short_description: Manage Meraki switch port configuration
 description:
   - Manage per-device switch port configuration for Meraki switches.
   - Device-scoped (uses serial number, not network_id).
+  - With O(organization_id) and O(state=gathered), gathers the ports of
+    every switch in the organization from one organization-wide listing.
+    Later tasks on those switches are answered from it by the Platform
+    Manager instead of the Dashboard.
   - Supports merged, replaced, deleted, and gathered states.
 
 version_added: "0.1.0"
@@ -21,9 +25,25 @@ author:
 
 options:
   serial:
-    description: Device serial number.
+    description:
+      - Device serial number.
+      - Required unless O(organization_id) or O(scopes) is given.
+    type: str
+
+  scopes:
+    description:
+      - Apply the task to each of these device serials instead of one O(serial).
+      - The scopes are reconciled concurrently and reported in RV(scope_results).
+      - Mutually exclusive with O(serial) and O(organization_id).
+    type: list
+    elements: str
+
+  organization_id:
+    description:
+      - Gather the ports of every switch in this organization instead of
+        one device. Each gathered item carries its C(serial).
+      - Only with O(state=gathered), and without O(serial) or O(config).
     type: str
-    required: true
 
   state:
     description: The state of the resource.
@@ -272,4 +292,13 @@ config:
   description: The resulting resource configuration.
   type: list
   returned: always
+
+scope_results:
+  description:
+    - One entry per scope when O(scopes) is given.
+    - Each entry has the scope key, C(changed), and C(before) and C(after) or C(gathered);
+      a scope that failed also has C(failed) and C(msg).
+  type: list
+  returned: when O(scopes) is given
+  elements: dict
 '''
@@ -24,6 +24,8 @@ class APIFacts_v1(FactsTransformMixin_v1):
     networks: Optional[List[Dict[str, Any]]] = None
     devices: Optional[List[Dict[str, Any]]] = None
     inventory: Optional[List[Dict[str, Any]]] = None
+    device_statuses: Optional[List[Dict[str, Any]]] = None
+    uplinks: Optional[List[Dict[str, Any]]] = None
 
     @classmethod
     def _get_api_class(cls):
@@ -0,0 +1,199 @@
+"""Meraki Action Batch submission for multi-resource mutations.
+
+An action batch (``POST /organizations/{organizationId}/actionBatches``)
+applies a list of create/update/destroy actions atomically in one
+request, instead of one rate-limited call per resource.
+
+Dashboard limits:
+
+- synchronous batches may hold at most 20 actions and return once the
+  batch has run;
+- asynchronous batches may hold at most 100 actions and must be polled
+  via ``GET /organizations/{organizationId}/actionBatches/{id}``.
+
+Larger sets are therefore split into consecutive asynchronous batches.
+Each batch is atomic; batches are submitted one at a time and a failed
+batch stops the rest, so actions are applied in order.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .metrics import labelled
+
+logger = logging.getLogger(__name__)
+
+SYNC_ACTION_LIMIT = 20
+ASYNC_ACTION_LIMIT = 100
+
+# Endpoint labels of the submit and poll calls, so batch IDs do not end
+# up in metric label values
+_BATCHES_ENDPOINT = '/organizations/{organizationId}/actionBatches'
+_BATCH_ENDPOINT = _BATCHES_ENDPOINT + '/{actionBatchId}'
+
+# HTTP method of an EndpointOperation -> action batch operation
+_BATCH_OPERATIONS = {
+    'POST': 'create',
+    'PUT': 'update',
+    'PATCH': 'update',
+    'DELETE': 'destroy',
+}
+
+
+class ActionBatchError(RuntimeError):
+    """An action batch was rejected or failed on the Dashboard."""
+
+
+def to_action(method: str, path: str, body: Optional[dict]) -> Optional[dict]:
+    """
+    Build one batch action from a resolved API call.
+
+    Args:
+        method: HTTP method of the endpoint operation
+        path: Resolved resource path (no base URL)
+        body: Request body, if any
+
+    Returns:
+        Action dict, or None if the method cannot be batched
+    """
+    operation = _BATCH_OPERATIONS.get(method.upper())
+    if operation is None:
+        return None
+    action: Dict[str, Any] = {'resource': path, 'operation': operation}
+    if body and operation != 'destroy':
+        action['body'] = body
+    return action
+
+
+def plan_batches(actions: List[dict]) -> List[Tuple[List[dict], bool]]:
+    """
+    Split actions into Dashboard-sized batches.
+
+    Args:
+        actions: Ordered list of batch actions
+
+    Returns:
+        List of (actions, synchronous) tuples, in submission order
+    """
+    if len(actions) <= SYNC_ACTION_LIMIT:
+        return [(actions, True)] if actions else []
+    return [
+        (actions[i:i + ASYNC_ACTION_LIMIT], False)
+        for i in range(0, len(actions), ASYNC_ACTION_LIMIT)
+    ]
+
+
+class ActionBatchRunner:
+    """
+    Submits action batches for one organization and waits for them.
+
+    Attributes:
+        poll_interval: Seconds between status polls of an async batch
+        timeout: Seconds to wait for one async batch before giving up
+    """
+
+    def __init__(
+        self,
+        api_call: Callable[..., Any],
+        base_url: str,
+        poll_interval: float = 1.0,
+        timeout: float = 300.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            api_call: ``PlatformService._api_call``-compatible callable
+                (must accept ``use_cache``)
+            base_url: Dashboard base URL
+            poll_interval: Seconds between status polls
+            timeout: Maximum seconds to wait for one async batch
+            sleep: Sleep function (overridable for tests)
+        """
+        self._api_call = api_call
+        self._base_url = base_url
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._sleep = sleep
+
+    def run(self, org_id: str, actions: List[dict]) -> List[dict]:
+        """
+        Apply *actions* to *org_id* in as few batches as allowed.
+
+        Returns:
+            The completed batch records, in submission order
+
+        Raises:
+            ActionBatchError: If any batch fails or times out
+        """
+        completed = []
+        for chunk, synchronous in plan_batches(actions):
+            batch = self._submit(org_id, chunk, synchronous)
+            if not self._status(batch).get('completed'):
+                batch = self._wait(org_id, batch)
+            completed.append(batch)
+        return completed
+
+    def _submit(self, org_id: str, actions: List[dict], synchronous: bool) -> dict:
+        url = f'{self._base_url}/organizations/{org_id}/actionBatches'
+        logger.info(
+            f"Submitting {'sync' if synchronous else 'async'} action batch "
+            f"with {len(actions)} actions to org {org_id}"
+        )
+        with labelled(endpoint=_BATCHES_ENDPOINT):
+            response = self._api_call('POST', url, json={
+                'confirmed': True,
+                'synchronous': synchronous,
+                'actions': actions,
+            })
+        if not response.ok:
+            raise ActionBatchError(
+                f"Action batch rejected ({response.status_code}): "
+                f"{_errors(response)}"
+            )
+        batch = response.json()
+        self._raise_if_failed(batch)
+        return batch
+
+    def _wait(self, org_id: str, batch: dict) -> dict:
+        url = (
+            f"{self._base_url}/organizations/{org_id}"
+            f"/actionBatches/{batch['id']}"
+        )
+        deadline = time.monotonic() + self.timeout
+        while True:
+            self._sleep(self.poll_interval)
+            with labelled(endpoint=_BATCH_ENDPOINT):
+                response = self._api_call('GET', url, use_cache=False)
+            response.raise_for_status()
+            batch = response.json()
+            self._raise_if_failed(batch)
+            if self._status(batch).get('completed'):
+                return batch
+            if time.monotonic() > deadline:
+                raise ActionBatchError(
+                    f"Action batch {batch.get('id')} did not complete "
+                    f"within {self.timeout}s"
+                )
+
+    @staticmethod
+    def _status(batch: dict) -> dict:
+        return batch.get('status') or {}
+
+    def _raise_if_failed(self, batch: dict) -> None:
+        status = self._status(batch)
+        if status.get('failed'):
+            raise ActionBatchError(
+                f"Action batch {batch.get('id')} failed: "
+                f"{status.get('errors') or 'no details'}"
+            )
+
+
+def _errors(response) -> Any:
+    """Best-effort error payload of a failed Dashboard response."""
+    try:
+        return response.json().get('errors', response.text)
+    except (ValueError, AttributeError):
+        return response.text
@@ -0,0 +1,163 @@
+"""Colocated tests for action batch planning and submission."""
+
+import pytest
+
+from .action_batch import (
+    ASYNC_ACTION_LIMIT,
+    SYNC_ACTION_LIMIT,
+    ActionBatchError,
+    ActionBatchRunner,
+    plan_batches,
+    to_action,
+)
+from .metrics import current_labels
+
+
+class _Response:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+        self.text = str(body)
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise RuntimeError(self.status_code)
+
+
+def _actions(n):
+    return [{'resource': f'/networks/N1/appliance/vlans/{i}',
+             'operation': 'destroy'} for i in range(n)]
+
+
+class TestToAction:
+    """to_action maps HTTP methods to batch operations."""
+
+    def test_create_with_body(self):
+        assert to_action('POST', '/networks/N1/appliance/vlans', {'id': '10'}) == {
+            'resource': '/networks/N1/appliance/vlans',
+            'operation': 'create',
+            'body': {'id': '10'},
+        }
+
+    def test_destroy_drops_body(self):
+        assert to_action('DELETE', '/x/1', {'a': 1}) == {
+            'resource': '/x/1', 'operation': 'destroy',
+        }
+
+    def test_get_not_batchable(self):
+        assert to_action('GET', '/x', None) is None
+
+
+class TestPlanBatches:
+    """plan_batches respects the Dashboard's batch size limits."""
+
+    def test_empty(self):
+        assert plan_batches([]) == []
+
+    def test_small_set_is_one_sync_batch(self):
+        plan = plan_batches(_actions(SYNC_ACTION_LIMIT))
+        assert [(len(a), sync) for a, sync in plan] == [(SYNC_ACTION_LIMIT, True)]
+
+    def test_large_set_is_chunked_async(self):
+        plan = plan_batches(_actions(250))
+        assert [(len(a), sync) for a, sync in plan] == [
+            (ASYNC_ACTION_LIMIT, False), (ASYNC_ACTION_LIMIT, False), (50, False),
+        ]
+
+    def test_order_preserved(self):
+        actions = _actions(150)
+        plan = plan_batches(actions)
+        assert [a for chunk, _ in plan for a in chunk] == actions
+
+
+class TestActionBatchRunner:
+    """ActionBatchRunner submits, polls and reports failures."""
+
+    def test_sync_batch_needs_no_poll(self):
+        calls = []
+
+        def api_call(method, url, **kwargs):
+            calls.append((method, url, kwargs.get('json')))
+            return _Response(201, {'id': 'b1', 'status': {'completed': True}})
+
+        runner = ActionBatchRunner(api_call, 'https://dash/api')
+        batches = runner.run('O1', _actions(3))
+        assert [b['id'] for b in batches] == ['b1']
+        assert len(calls) == 1
+        method, url, body = calls[0]
+        assert (method, url) == ('POST', 'https://dash/api/organizations/O1/actionBatches')
+        assert body['synchronous'] is True and body['confirmed'] is True
+
+    def test_async_batch_polled_until_complete(self):
+        polls = iter([
+            {'id': 'b1', 'status': {'completed': False}},
+            {'id': 'b1', 'status': {'completed': True}},
+        ])
+
+        def api_call(method, url, **kwargs):
+            if method == 'POST':
+                return _Response(201, {'id': 'b1', 'status': {'completed': False}})
+            return _Response(200, next(polls))
+
+        runner = ActionBatchRunner(api_call, 'https://dash/api', sleep=lambda s: None)
+        assert runner.run('O1', _actions(30))[0]['status']['completed']
+
+    def test_calls_labelled_with_endpoint_template(self):
+        endpoints = []
+        polls = iter([
+            {'id': 'b1', 'status': {'completed': False}},
+            {'id': 'b1', 'status': {'completed': True}},
+        ])
+
+        def api_call(method, url, **kwargs):
+            endpoints.append(current_labels().get('endpoint'))
+            if method == 'POST':
+                return _Response(201, {'id': 'b1', 'status': {'completed': False}})
+            return _Response(200, next(polls))
+
+        runner = ActionBatchRunner(api_call, 'https://dash/api', sleep=lambda s: None)
+        runner.run('O1', _actions(30))
+        assert endpoints == [
+            '/organizations/{organizationId}/actionBatches',
+            '/organizations/{organizationId}/actionBatches/{actionBatchId}',
+            '/organizations/{organizationId}/actionBatches/{actionBatchId}',
+        ]
+
+    def test_failed_batch_raises(self):
+        def api_call(method, url, **kwargs):
+            return _Response(201, {'id': 'b1', 'status': {
+                'completed': False, 'failed': True, 'errors': ['bad vlan'],
+            }})
+
+        runner = ActionBatchRunner(api_call, 'https://dash/api')
+        with pytest.raises(ActionBatchError, match='bad vlan'):
+            runner.run('O1', _actions(2))
+
+    def test_rejected_batch_raises(self):
+        def api_call(method, url, **kwargs):
+            return _Response(400, {'errors': ['Too many actions']})
+
+        runner = ActionBatchRunner(api_call, 'https://dash/api')
+        with pytest.raises(ActionBatchError, match='Too many actions'):
+            runner.run('O1', _actions(2))
+
+    def test_failure_stops_later_batches(self):
+        posts = []
+
+        def api_call(method, url, **kwargs):
+            posts.append(kwargs['json'])
+            return _Response(201, {'id': 'b1', 'status': {
+                'completed': False, 'failed': True, 'errors': ['x'],
+            }})
+
+        runner = ActionBatchRunner(api_call, 'https://dash/api')
+        with pytest.raises(ActionBatchError):
+            runner.run('O1', _actions(250))
+        assert len(posts) == 1
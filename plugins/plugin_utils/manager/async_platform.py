@@ -0,0 +1,535 @@
+"""Asyncio Platform Service for SDK consumers (MCP server, scripts).
+
+``PlatformService`` runs behind the Platform Manager and gets its
+concurrency from threads: one per RPC connection, plus a pool for
+independent calls.  That suits Ansible workers.  An asyncio program such
+as the MCP server can only use it by blocking its event loop or by
+borrowing threads.
+
+``AsyncPlatformService`` has the same ``execute(operation, module_name,
+user_data_dict)`` contract and the same module classes, operation plans
+and transforms.  The I/O is native asyncio:
+
+- One ``httpx.AsyncClient`` pools keep-alive connections; a semaphore
+  caps in-flight requests at ``max_connections`` while any number of
+  operations wait their turn.
+- Requests are paced by the same per-organization token buckets, with
+  ``await asyncio.sleep`` instead of a blocking sleep; 429 responses
+  penalize the org's bucket and are retried.
+- Paginated listings are async generators following the Link header.
+- The waves of an operation plan run with ``asyncio.gather``.
+
+Hundreds of operations can run concurrently on one thread, e.g.
+``await asyncio.gather(*(svc.execute(...) for ...))``.
+
+``httpx`` is optional (``pip install meraki-rm-sdk[async]``).  There is
+no response cache or device index here; those serve repeated Ansible
+tasks in the long-lived manager process.
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict, is_dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..platform.loader import DynamicClassLoader
+from ..platform.operation_plan import CompiledOperation, OperationPlan
+from ..platform.registry import APIVersionRegistry
+from .platform_manager import (
+    _DEFAULT_MAX_RETRIES,
+    _DEFAULT_RETRY_WAIT,
+    _PER_PAGE_MAX,
+    _SCOPE_RE,
+    PlatformService,
+)
+from .rate_limiter import DEFAULT_BURST, DEFAULT_RATE_LIMIT, OrgRateLimiter
+from .session_pool import DEFAULT_MAX_CONNECTIONS
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    httpx = None
+    HAS_HTTPX = False
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TIMEOUT = 60.0
+
+
+class AsyncPlatformService:
+    """
+    Asyncio platform service for the Meraki Dashboard API.
+
+    Use as an async context manager, or call ``aclose()`` when done, to
+    release the pooled connections.
+
+    Attributes:
+        base_url: Meraki Dashboard base URL
+        client: Async HTTP client (``httpx.AsyncClient`` or compatible)
+        rate_limiter: Per-organization request pacing
+        api_version: API version (always '1' for Meraki)
+        registry: Version registry
+        loader: Class loader
+        cache: Lookup cache (network/device -> owning org, etc.)
+    """
+
+    # Request planning is shared with the threaded service
+    _path_template = PlatformService._path_template
+    _with_per_page = PlatformService._with_per_page
+    _parse_next_link = staticmethod(PlatformService._parse_next_link)
+    _plan_find = PlatformService._plan_find
+    _build_request = PlatformService._build_request
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_BURST,
+        client: Optional[Any] = None,
+    ):
+        """
+        Initialize the service with Meraki credentials.
+
+        Args:
+            base_url: Meraki Dashboard base URL
+                (e.g., 'https://api.meraki.com/api/v1')
+            api_key: Meraki API key
+            max_connections: Maximum concurrent in-flight HTTP requests
+            rate_limit: Requests per second per organization (0 disables
+                pacing; 429 responses are still retried)
+            rate_burst: Requests an idle organization may send at once
+            client: Optional async client with httpx's ``request()``
+                signature, used as is (tests pass an in-process fake)
+
+        Raises:
+            ImportError: If no client is given and httpx is not installed
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        if client is None:
+            if not HAS_HTTPX:
+                raise ImportError(
+                    "AsyncPlatformService requires httpx: "
+                    "pip install meraki-rm-sdk[async]"
+                )
+            client = httpx.AsyncClient(
+                headers={
+                    'X-Cisco-Meraki-API-Key': api_key,
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/json',
+                    'User-Agent': 'cisco.meraki_rm SDK',
+                },
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=_DEFAULT_TIMEOUT,
+            )
+        self.client = client
+        self.max_connections = max_connections
+        self.rate_limiter = OrgRateLimiter(rate_limit, rate_burst)
+        self._slots = asyncio.Semaphore(max_connections)
+
+        self.api_version = '1'
+        self.registry = APIVersionRegistry()
+        self.loader = DynamicClassLoader(self.registry)
+
+        self.cache: Dict[str, Any] = {}
+        self._lookups: Dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self) -> 'AsyncPlatformService':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        await self.client.aclose()
+
+    async def _org_for_url(self, url: str) -> Optional[str]:
+        """
+        Determine the organization that owns a request URL.
+
+        As ``PlatformService._org_for_url``.  Concurrent operations on
+        the same network or device share one owner lookup.
+        """
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        match = _SCOPE_RE.match(path)
+        if not match:
+            return None
+        kind, ident = match.groups()
+        if kind == 'organizations':
+            return ident
+        if kind == 'networks':
+            return await self._org_for_network(ident)
+        return await self._org_for_device(ident)
+
+    async def _org_for_network(self, network_id: str) -> Optional[str]:
+        """Resolve (and cache) the organization owning a network."""
+        async def _resolve():
+            net = await self._lookup_owner(f'{self.base_url}/networks/{network_id}')
+            return net.get('organizationId')
+
+        return await self._cached(f'net_org:{network_id}', _resolve)
+
+    async def _org_for_device(self, serial: str) -> Optional[str]:
+        """Resolve (and cache) the organization owning a device."""
+        async def _resolve():
+            dev = await self._lookup_owner(f'{self.base_url}/devices/{serial}')
+            network_id = dev.get('networkId')
+            return await self._org_for_network(network_id) if network_id else None
+
+        return await self._cached(f'device_org:{serial}', _resolve)
+
+    async def _cached(self, key: str, resolve) -> Any:
+        """
+        ``self.cache[key]``, resolving it once however many tasks ask.
+
+        Only resolved owners are cached; after a failed lookup (None)
+        the next request looks the owner up again.
+        """
+        if key in self.cache:
+            return self.cache[key]
+        future = self._lookups.get(key)
+        if future is None:
+            future = asyncio.ensure_future(resolve())
+            self._lookups[key] = future
+        try:
+            value = await asyncio.shield(future)
+        finally:
+            if future.done() and self._lookups.get(key) is future:
+                del self._lookups[key]
+        if value is not None:
+            self.cache[key] = value
+        return value
+
+    async def _lookup_owner(self, url: str) -> dict:
+        """GET a network/device record for org resolution; {} on failure."""
+        try:
+            response = await self._request('GET', url, None)
+            if response.status_code == 200:
+                data = response.json()
+                return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.debug(f"Org lookup failed for {url}: {e}")
+        return {}
+
+    async def _api_call(self, method: str, url: str, **kwargs) -> Any:
+        """Make an API call paced by the owning organization's rate limit."""
+        org_id = await self._org_for_url(url) if self.rate_limiter.enabled else None
+        return await self._request(method, url, org_id, **kwargs)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        org_id: Optional[str],
+        **kwargs
+    ) -> Any:
+        """Send one request charged to *org_id*, retrying on 429."""
+        for attempt in range(_DEFAULT_MAX_RETRIES):
+            if self.rate_limiter.enabled:
+                delay = self.rate_limiter.bucket(org_id).reserve()
+                if delay > 0:
+                    logger.debug(f"Pacing org {org_id}: waiting {delay:.3f}s")
+                    await asyncio.sleep(delay)
+            async with self._slots:
+                response = await self.client.request(method, url, **kwargs)
+            if response.status_code != 429:
+                return response
+
+            retry_after = float(
+                response.headers.get('Retry-After', _DEFAULT_RETRY_WAIT)
+            )
+            logger.warning(
+                f"Rate limited (org {org_id}). Retrying after {retry_after}s"
+            )
+            if self.rate_limiter.enabled:
+                self.rate_limiter.penalize(org_id, retry_after)
+            else:
+                await asyncio.sleep(retry_after)
+        raise RuntimeError(
+            f"Rate limit exceeded after {_DEFAULT_MAX_RETRIES} retries for {method} {url}"
+        )
+
+    async def _iter_pages(self, url: str) -> AsyncIterator[List[dict]]:
+        """
+        Yield the items of a paginated GET one page at a time.
+
+        As ``PlatformService._iter_pages``: the first request asks for
+        the endpoint's largest page and later pages follow the Link
+        header.  Each page is fetched once the previous one is consumed.
+        """
+        current_url: Optional[str] = self._with_per_page(url)
+        while current_url:
+            response = await self._api_call('GET', current_url)
+            response.raise_for_status()
+            current_url = self._parse_next_link(response.headers.get('Link'))
+            data = response.json()
+            yield data if isinstance(data, list) else [data]
+
+    async def _paginated_get(self, url: str) -> List[dict]:
+        """GET with automatic pagination, all pages combined."""
+        return [item async for page in self._iter_pages(url) for item in page]
+
+    async def execute(
+        self,
+        operation: str,
+        module_name: str,
+        user_data_dict: dict
+    ) -> dict:
+        """
+        Execute a generic operation on any resource.
+
+        Args:
+            operation: Operation type ('create', 'update', 'replace',
+                'delete' or 'find')
+            module_name: Module name (e.g., 'vlan', 'ssid')
+            user_data_dict: User Model dataclass as dict
+
+        Returns:
+            Result as dict (User Model format)
+
+        Raises:
+            ValueError: If operation is unknown or execution fails
+        """
+        logger.info(f"Executing {operation} on {module_name}")
+        UserClass, APIClass, MixinClass = self.loader.load_classes_for_module(
+            module_name,
+            self.api_version
+        )
+        user_instance = UserClass(**user_data_dict)
+        context = {
+            'manager': self,
+            'cache': self.cache,
+            'api_version': self.api_version,
+            'base_url': self.base_url
+        }
+
+        try:
+            if operation == 'create':
+                return await self._write_resource(
+                    'create', user_instance, MixinClass, APIClass, context
+                )
+            if operation in ('update', 'replace'):
+                return await self._write_resource(
+                    'update', user_instance, MixinClass, APIClass, context
+                )
+            if operation == 'delete':
+                api_data = user_instance.to_api(context)
+                plan = self.loader.load_operation_plan(MixinClass, 'delete')
+                await self._execute_operations(plan, api_data, user_instance)
+                return {}
+            if operation == 'find':
+                return await self._find_resource(
+                    user_instance, MixinClass, APIClass, context
+                )
+            raise ValueError(f"Unknown operation: {operation}")
+        except Exception as e:
+            logger.error(f"Operation {operation} on {module_name} failed: {e}")
+            raise
+
+    async def execute_many(
+        self,
+        operations: list,
+        stop_on_error: bool = True
+    ) -> list:
+        """
+        Execute an ordered list of operations, as ``PlatformService.execute_many``.
+
+        Identical finds are executed once and consecutive finds run
+        concurrently; mutations run one at a time, in order.
+
+        Args:
+            operations: Ordered list of ``(operation, module_name,
+                user_data_dict)`` tuples
+            stop_on_error: Skip the mutations that follow a failed one
+
+        Returns:
+            One dict per operation, in order: ``{'result': ...}``,
+            ``{'error': message, 'error_type': name}`` or
+            ``{'skipped': True}``
+        """
+        outcomes: List[Optional[dict]] = [None] * len(operations)
+        failed = False
+        i = 0
+        while i < len(operations):
+            if failed and stop_on_error:
+                outcomes[i] = {'skipped': True}
+                i += 1
+                continue
+
+            if operations[i][0] != 'find':
+                outcomes[i] = await self._execute_outcome(*operations[i])
+                failed = failed or 'error' in outcomes[i]
+                i += 1
+                continue
+
+            j = i
+            while j < len(operations) and operations[j][0] == 'find':
+                j += 1
+            unique: Dict[str, tuple] = {}
+            keys = []
+            for op in operations[i:j]:
+                key = repr((op[1], sorted(op[2].items())))
+                unique.setdefault(key, op)
+                keys.append(key)
+            results = dict(zip(unique, await asyncio.gather(*(
+                self._execute_outcome(*op) for op in unique.values()
+            ))))
+            for k, key in enumerate(keys):
+                outcomes[i + k] = results[key]
+            i = j
+
+        return outcomes
+
+    async def _execute_outcome(
+        self,
+        operation: str,
+        module_name: str,
+        user_data_dict: dict
+    ) -> dict:
+        """Run ``execute()`` and capture its result or error as a dict."""
+        try:
+            return {
+                'result': await self.execute(operation, module_name, user_data_dict)
+            }
+        except Exception as e:
+            return {
+                'error': str(e) or type(e).__name__,
+                'error_type': type(e).__name__,
+            }
+
+    async def _write_resource(
+        self,
+        plan_name: str,
+        user_data: Any,
+        mixin_class: type,
+        api_class: type,
+        context: dict
+    ) -> dict:
+        """Create or update a resource with transformation."""
+        api_data = user_data.to_api(context)
+        plan = self.loader.load_operation_plan(mixin_class, plan_name)
+        api_result = await self._execute_operations(plan, api_data, user_data)
+        if api_result:
+            return api_class.to_ansible_many([api_result], context)[0]
+        return {}
+
+    async def _find_resource(
+        self,
+        user_data: Any,
+        mixin_class: type,
+        api_class: type,
+        context: dict
+    ) -> dict:
+        """Find/get resource with transformation (see ``PlatformService``)."""
+        api_data = user_data.to_api(context)
+        api_data_dict = asdict(api_data) if is_dataclass(api_data) else api_data
+        user_data_dict = asdict(user_data) if is_dataclass(user_data) else user_data
+
+        operations = self.loader.load_operation_plan(mixin_class, 'find')
+        plan = self._plan_find(operations, api_data_dict, user_data_dict)
+        if not plan:
+            return {'config': []}
+
+        endpoint_op, path = plan[0]
+        url = f"{self.base_url}{path}"
+        logger.debug(f"Calling {endpoint_op.method} {url}")
+        paginated = endpoint_op.method == 'GET' and (
+            not endpoint_op.param_sources
+            or endpoint_op.op.path in _PER_PAGE_MAX
+        )
+        if paginated:
+            config = []
+            async for page in self._iter_pages(url):
+                config.extend(api_class.to_ansible_many(page, context))
+            return {'config': config}
+
+        response = await self._api_call(endpoint_op.method, url)
+        if response.status_code == 404:
+            logger.debug(f"Resource not found (404) for {endpoint_op.name}")
+            return {'config': []}
+        response.raise_for_status()
+        result = response.json()
+        if isinstance(result, list):
+            return {'config': api_class.to_ansible_many(result, context)}
+        if result:
+            return api_class.to_ansible_many([result], context)[0]
+        return {'config': []}
+
+    async def _execute_operations(
+        self,
+        operations: OperationPlan,
+        api_data: Any,
+        user_data: Any
+    ) -> dict:
+        """
+        Execute a mutating operation plan, one wave after another.
+
+        The calls within a wave are independent and run concurrently.
+        If any fails, the first error (in wave order) is raised once the
+        whole wave has finished.
+        """
+        if not operations:
+            return {}
+
+        api_data_dict = asdict(api_data) if is_dataclass(api_data) else api_data
+        user_data_dict = asdict(user_data) if is_dataclass(user_data) else user_data
+
+        results = {}
+        for wave in operations.waves:
+            calls = []
+            for endpoint_op in wave:
+                request = self._build_request(
+                    endpoint_op, api_data_dict, user_data_dict, results
+                )
+                if request is None:
+                    logger.debug(
+                        f"Skipping {endpoint_op.name} - missing path params"
+                    )
+                    continue
+                calls.append((endpoint_op, *request))
+
+            wave_results = await asyncio.gather(
+                *(self._call_operation(*call) for call in calls),
+                return_exceptions=True,
+            )
+            for result_data in wave_results:
+                if isinstance(result_data, BaseException):
+                    raise result_data
+            for (endpoint_op, _, _), result_data in zip(calls, wave_results):
+                results[endpoint_op.name] = result_data
+                if isinstance(result_data, dict) and 'id' in result_data:
+                    results['id'] = result_data['id']
+
+        return (
+            results.get('create')
+            or results.get('update')
+            or results.get('main')
+            or {}
+        )
+
+    async def _call_operation(
+        self,
+        endpoint_op: CompiledOperation,
+        path: str,
+        request_data: dict
+    ) -> Any:
+        """Call one resolved mutating endpoint and return its JSON body."""
+        url = f"{self.base_url}{path}"
+        if endpoint_op.method == 'DELETE':
+            response = await self._api_call(endpoint_op.method, url)
+        else:
+            response = await self._api_call(
+                endpoint_op.method, url, json=request_data if request_data else None
+            )
+        response.raise_for_status()
+        try:
+            return response.json()
+        except ValueError:
+            return {}
@@ -0,0 +1,219 @@
+"""Colocated tests for AsyncPlatformService (in-process fake client)."""
+
+import asyncio
+from urllib.parse import urlparse
+
+import pytest
+
+from .async_platform import AsyncPlatformService
+
+
+class _FakeResponse:
+
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeClient:
+    """Async client answering from a {(method, path): [responses]} table.
+
+    A route's last response is repeated once the others are used up.
+    Each request takes ``latency`` seconds, to observe concurrency.
+    """
+
+    def __init__(self, routes, latency=0.0):
+        self.routes = {key: list(value) for key, value in routes.items()}
+        self.latency = latency
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self.closed = False
+
+    async def request(self, method, url, **kwargs):
+        parsed = urlparse(url)
+        self.calls.append((method, parsed.path[len('/api'):], parsed.query))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        queue = self.routes.get((method, parsed.path[len('/api'):]))
+        if not queue:
+            return _FakeResponse(404, {})
+        return _FakeResponse(*(queue.pop(0) if len(queue) > 1 else queue[0]))
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _service(routes, latency=0.0, **kwargs):
+    client = _FakeClient(routes, latency)
+    svc = AsyncPlatformService(
+        'https://dash.example/api', 'key', client=client, **kwargs,
+    )
+    return svc, client
+
+
+class TestRequests:
+
+    def test_pagination_follows_link_header(self):
+        svc, client = _service({
+            ('GET', '/organizations/O1/networks'): [
+                (200, [{'id': 'N1'}], {
+                    'Link': '<https://dash.example/api/organizations/O1/'
+                            'networks?startingAfter=N1>; rel=next',
+                }),
+                (200, [{'id': 'N2'}]),
+            ],
+        })
+        items = asyncio.run(svc._paginated_get(
+            f'{svc.base_url}/organizations/O1/networks'
+        ))
+        assert items == [{'id': 'N1'}, {'id': 'N2'}]
+        assert client.calls[0][2] == 'perPage=100000'
+        assert client.calls[1][2] == 'startingAfter=N1'
+
+    def test_429_retried(self):
+        svc, client = _service({
+            ('GET', '/organizations/O1/admins'): [
+                (429, {}, {'Retry-After': '0'}),
+                (200, [{'id': 'A1'}]),
+            ],
+        })
+        response = asyncio.run(svc._api_call(
+            'GET', f'{svc.base_url}/organizations/O1/admins'
+        ))
+        assert response.json() == [{'id': 'A1'}]
+        assert len(client.calls) == 2
+
+    def test_429_gives_up(self):
+        svc, _ = _service({
+            ('GET', '/organizations/O1/admins'): [(429, {}, {'Retry-After': '0'})],
+        })
+        with pytest.raises(RuntimeError, match='Rate limit exceeded'):
+            asyncio.run(svc._api_call(
+                'GET', f'{svc.base_url}/organizations/O1/admins'
+            ))
+
+    def test_owner_lookup_shared_by_concurrent_requests(self):
+        svc, client = _service({
+            ('GET', '/networks/N1'): [(200, {'organizationId': 'O1'})],
+        }, latency=0.01)
+
+        async def _resolve_all():
+            url = f'{svc.base_url}/networks/N1/appliance/vlans'
+            return await asyncio.gather(*(svc._org_for_url(url) for _ in range(20)))
+
+        assert asyncio.run(_resolve_all()) == ['O1'] * 20
+        assert client.calls == [('GET', '/networks/N1', '')]
+
+    def test_failed_owner_lookup_not_cached(self):
+        svc, client = _service({
+            ('GET', '/networks/N1'): [(404, {}), (200, {'organizationId': 'O1'})],
+        })
+        url = f'{svc.base_url}/networks/N1/appliance/vlans'
+        assert asyncio.run(svc._org_for_url(url)) is None
+        assert asyncio.run(svc._org_for_url(url)) == 'O1'
+        assert asyncio.run(svc._org_for_url(url)) == 'O1'
+        assert len(client.calls) == 2
+
+    def test_in_flight_requests_capped(self):
+        svc, client = _service({
+            ('GET', '/organizations/O1/admins'): [(200, [])],
+        }, latency=0.01, max_connections=4, rate_limit=0)
+
+        async def _many():
+            url = f'{svc.base_url}/organizations/O1/admins'
+            await asyncio.gather(*(svc._api_call('GET', url) for _ in range(50)))
+
+        asyncio.run(_many())
+        assert len(client.calls) == 50
+        assert client.peak == 4
+
+    def test_context_manager_closes_client(self):
+        svc, client = _service({})
+
+        async def _use():
+            async with svc:
+                pass
+
+        asyncio.run(_use())
+        assert client.closed
+
+
+class TestExecute:
+
+    ROUTES = {
+        ('GET', '/networks/N1'): [(200, {'organizationId': 'O1'})],
+        ('GET', '/networks/N1/appliance/vlans'): [
+            (200, [{'id': '10', 'name': 'data'}, {'id': '20', 'name': 'voice'}]),
+        ],
+        ('GET', '/networks/N1/appliance/vlans/10'): [
+            (200, {'id': '10', 'name': 'data'}),
+        ],
+        ('PUT', '/networks/N1/appliance/vlans/10'): [
+            (200, {'id': '10', 'name': 'renamed'}),
+        ],
+    }
+
+    def test_find_collection(self):
+        svc, _ = _service(self.ROUTES)
+        result = asyncio.run(svc.execute('find', 'vlan', {'network_id': 'N1'}))
+        assert [item['name'] for item in result['config']] == ['data', 'voice']
+
+    def test_find_item(self):
+        svc, _ = _service(self.ROUTES)
+        result = asyncio.run(
+            svc.execute('find', 'vlan', {'network_id': 'N1', 'vlan_id': '10'})
+        )
+        assert result['name'] == 'data'
+
+    def test_update(self):
+        svc, client = _service(self.ROUTES)
+        result = asyncio.run(svc.execute(
+            'update', 'vlan',
+            {'network_id': 'N1', 'vlan_id': '10', 'name': 'renamed'},
+        ))
+        assert result['name'] == 'renamed'
+        assert ('PUT', '/networks/N1/appliance/vlans/10', '') in client.calls
+
+    def test_unknown_operation(self):
+        svc, _ = _service(self.ROUTES)
+        with pytest.raises(ValueError, match='Unknown operation'):
+            asyncio.run(svc.execute('explode', 'vlan', {'network_id': 'N1'}))
+
+    def test_hundreds_of_concurrent_operations(self):
+        svc, client = _service(
+            self.ROUTES, latency=0.01, max_connections=50, rate_limit=0,
+        )
+
+        async def _many():
+            return await asyncio.gather(*(
+                svc.execute('find', 'vlan', {'network_id': 'N1', 'vlan_id': '10'})
+                for _ in range(300)
+            ))
+
+        results = asyncio.run(_many())
+        assert all(result['name'] == 'data' for result in results)
+        assert client.peak == 50
+
+    def test_execute_many_stops_after_failed_mutation(self):
+        svc, _ = _service(self.ROUTES)
+        outcomes = asyncio.run(svc.execute_many([
+            ('find', 'vlan', {'network_id': 'N1'}),
+            ('update', 'vlan', {'network_id': 'N1', 'vlan_id': '99', 'name': 'x'}),
+            ('update', 'vlan', {'network_id': 'N1', 'vlan_id': '10', 'name': 'y'}),
+        ]))
+        assert len(outcomes[0]['result']['config']) == 2
+        assert 'error' in outcomes[1]
+        assert outcomes[2] == {'skipped': True}
@@ -0,0 +1,129 @@
+"""Per-device listings served from one organization-wide listing.
+
+Device-scoped modules (switch ports) read ``/devices/{serial}/...`` once
+per switch, so converging an org of 2,000 switches costs 2,000 listings
+plus an item GET per port.  The Dashboard also lists the same items for
+every device of an organization in one paginated call (for example
+``/organizations/{organizationId}/switch/ports/bySwitch``).
+
+``PlatformService`` stores each device's items from that call here,
+under the path of the per-device listing.  Later GETs of that listing,
+or of one item below it, are answered from the index instead of the
+network.  Entries expire after ``ttl`` seconds, and writes invalidate
+them by path as in the response cache.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .response_cache import _path_of
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_TTL = 300.0
+
+
+class DeviceIndex:
+    """
+    Thread-safe TTL index of per-device item listings.
+
+    A ``ttl`` of 0 disables the index.
+
+    Attributes:
+        ttl: Seconds an entry stays valid
+        hits: Lookups answered from the index
+        invalidations: Entries dropped because of a write
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_INDEX_TTL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.hits = 0
+        self.invalidations = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        # listing path -> (expires, items, {item ID: item})
+        self._entries: Dict[str, Tuple[float, List[dict], Dict[str, dict]]] = {}
+
+    def put(self, url: str, items: List[dict], id_key: str) -> None:
+        """Store *items* as the listing at *url*, keyed by *id_key*."""
+        if self.ttl <= 0:
+            return
+        by_id = {
+            str(item[id_key]): item for item in items if id_key in item
+        }
+        with self._lock:
+            self._entries[_path_of(url)] = (self._clock() + self.ttl, items, by_id)
+
+    def get(self, url: str) -> Optional[Any]:
+        """
+        Look up the listing at *url*, or one item in a listing.
+
+        Returns:
+            The item list, the item dict, or None when not indexed
+        """
+        if not self._entries:
+            return None
+        path = _path_of(url)
+        parent, _, item_id = path.rpartition('/')
+        with self._lock:
+            found = self._fresh(path)
+            if found is not None:
+                result = found[1]
+            else:
+                found = self._fresh(parent)
+                result = found[2].get(item_id) if found is not None else None
+            if result is not None:
+                self.hits += 1
+        return result
+
+    def _fresh(self, path: str):
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[path]
+            return None
+        return entry
+
+    def invalidate(self, url: str) -> int:
+        """
+        Drop entries affected by a write to *url*: the listing itself,
+        its ancestors and anything below it.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self._entries:
+            return 0
+        path = _path_of(url)
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key == path
+                or key.startswith(path + '/')
+                or path.startswith(key + '/')
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} indexed listings for {path}")
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return index counters.
+
+        Returns:
+            Dict with hits, invalidations and size (listings held)
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+            }
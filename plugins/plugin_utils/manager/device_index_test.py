@@ -0,0 +1,52 @@
+"""Colocated tests for the per-device listing index."""
+
+from .device_index import DeviceIndex
+
+BASE = 'https://dash.example/api/v1'
+PORTS = f'{BASE}/devices/Q1/switch/ports'
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _index(ttl=60.0):
+    clock = _Clock()
+    return DeviceIndex(ttl, clock), clock
+
+
+class TestDeviceIndex:
+    """Listings and their items are served until they expire or are written."""
+
+    def test_listing_and_item_lookup(self):
+        index, _ = _index()
+        index.put(PORTS, [{'portId': '1'}, {'portId': '2'}], 'portId')
+        assert index.get(PORTS) == [{'portId': '1'}, {'portId': '2'}]
+        assert index.get(f'{PORTS}/2') == {'portId': '2'}
+        assert index.get(f'{PORTS}/9') is None
+        assert index.get(f'{BASE}/devices/Q2/switch/ports') is None
+        assert index.stats() == {'hits': 2, 'invalidations': 0, 'size': 1}
+
+    def test_entries_expire(self):
+        index, clock = _index(ttl=10)
+        index.put(PORTS, [{'portId': '1'}], 'portId')
+        clock.now = 10
+        assert index.get(PORTS) is None
+        assert index.stats()['size'] == 0
+
+    def test_write_invalidates_listing(self):
+        index, _ = _index()
+        index.put(PORTS, [{'portId': '1'}], 'portId')
+        index.put(f'{BASE}/devices/Q2/switch/ports', [], 'portId')
+        assert index.invalidate(f'{PORTS}/1') == 1
+        assert index.get(f'{PORTS}/1') is None
+        assert index.get(f'{BASE}/devices/Q2/switch/ports') == []
+
+    def test_disabled(self):
+        index, _ = _index(ttl=0)
+        index.put(PORTS, [{'portId': '1'}], 'portId')
+        assert index.get(PORTS) is None
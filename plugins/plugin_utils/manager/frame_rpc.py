@@ -0,0 +1,439 @@
+"""Framed RPC transport for the Platform Manager.
+
+The default transport is ``multiprocessing.managers``.  Connecting to it
+costs several round-trips per task: the two-way HMAC challenge, the
+``get_platform_service`` proxy creation and its own handshake.  Every
+call after that is a pickled proxy message.
+
+This module provides a lighter alternative, served by the manager process
+next to its BaseManager socket (``<stem>.fsock`` beside ``<stem>.sock``):
+
+- Connecting is a plain ``connect()``; there is no handshake.
+- Each call is one request frame and one response frame.
+- Every frame carries an HMAC-SHA256 of its payload keyed with the
+  manager's authkey, the same secret as in the ``.key`` file, so
+  neither side accepts frames from a process without the key.
+- Requests also carry a random ID and a timestamp.  The server rejects
+  requests older than ``MAX_REQUEST_AGE`` and IDs it has already seen
+  within that window, so a captured request frame cannot be replayed.
+  Responses echo the ID.
+- Payloads are JSON, or msgpack when the optional ``msgpack`` package
+  is installed.  Each frame names its codec.  JSON frames are encoded
+  with ``orjson`` when it is installed; the bytes are plain JSON either
+  way.
+- Large ``config`` lists in results are sent in chunks of
+  ``STREAM_CHUNK`` items.  The result is complete in the server's memory
+  before it is sent, but it is encoded one chunk at a time rather than
+  as one huge frame, and the client decodes the chunks as they arrive.
+
+Frame layout::
+
+    >I length | 1-byte codec | 32-byte HMAC(codec + body) | body
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from .metrics import CallStats
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+FRAME_SUFFIX = '.fsock'
+STREAM_CHUNK = 500
+MAX_FRAME = 256 * 1024 * 1024
+# Accepted clock skew / age of a request, in seconds
+MAX_REQUEST_AGE = 60.0
+
+_HEADER = struct.Struct('>I')
+_MAC_SIZE = 32
+CODEC_JSON = b'j'
+CODEC_MSGPACK = b'm'
+
+
+class FrameRPCError(RuntimeError):
+    """A framed RPC call failed, remotely or on the wire."""
+
+
+def frame_address(manager_address: str) -> str:
+    """Framed transport socket path for a BaseManager socket path."""
+    return str(Path(manager_address).with_suffix(FRAME_SUFFIX))
+
+
+def _encode(codec: bytes, obj: Any) -> bytes:
+    if codec == CODEC_MSGPACK:
+        return msgpack.packb(obj, use_bin_type=True)
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _decode(codec: bytes, body: bytes) -> Any:
+    if codec == CODEC_MSGPACK:
+        if not HAS_MSGPACK:
+            raise FrameRPCError("msgpack frame received but msgpack is not installed")
+        return msgpack.unpackb(body, raw=False)
+    if codec == CODEC_JSON:
+        return orjson.loads(body) if HAS_ORJSON else json.loads(body)
+    raise FrameRPCError(f"Unknown frame codec {codec!r}")
+
+
+def _mac(authkey: bytes, data: bytes) -> bytes:
+    return hmac.new(authkey, data, hashlib.sha256).digest()
+
+
+def send_frame(sock: socket.socket, authkey: bytes, codec: bytes, obj: Any) -> None:
+    """Encode, sign and send one frame."""
+    body = _encode(codec, obj)
+    payload = codec + body
+    sock.sendall(
+        _HEADER.pack(len(payload) + _MAC_SIZE)
+        + codec + _mac(authkey, payload) + body
+    )
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_frame(sock: socket.socket, authkey: bytes) -> Optional[tuple]:
+    """
+    Receive and verify one frame.
+
+    Returns:
+        ``(codec, decoded object)``, or None if the peer closed the socket
+
+    Raises:
+        FrameRPCError: On an oversized, truncated or badly signed frame
+    """
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if not 1 + _MAC_SIZE <= size <= MAX_FRAME:
+        raise FrameRPCError(f"Invalid frame size {size}")
+    data = _recv_exact(sock, size)
+    if data is None:
+        raise FrameRPCError("Connection closed mid-frame")
+    codec, mac, body = data[:1], data[1:1 + _MAC_SIZE], data[1 + _MAC_SIZE:]
+    if not hmac.compare_digest(mac, _mac(authkey, codec + body)):
+        raise FrameRPCError("Frame authentication failed")
+    return codec, _decode(codec, body)
+
+
+# ---------------------------------------------------------------------- #
+#  Server (runs inside the manager process)                                #
+# ---------------------------------------------------------------------- #
+
+
+class _FrameHandler(socketserver.BaseRequestHandler):
+    """Serves framed calls on one client connection until it closes."""
+
+    def handle(self):
+        server = self.server
+        while True:
+            try:
+                received = recv_frame(self.request, server.authkey)
+            except FrameRPCError as e:
+                logger.warning(f"Framed RPC: dropping connection: {e}")
+                return
+            if received is None:
+                return
+            codec, request = received
+            if not self._fresh(request):
+                logger.warning("Framed RPC: dropping stale or malformed request")
+                return
+            if not server.first_use(request['id'], request['ts']):
+                logger.warning("Framed RPC: dropping replayed request")
+                return
+            self._dispatch(codec, request)
+
+    @staticmethod
+    def _fresh(request) -> bool:
+        return (
+            isinstance(request, dict)
+            and isinstance(request.get('id'), str)
+            and isinstance(request.get('ts'), (int, float))
+            and abs(time.time() - request['ts']) <= MAX_REQUEST_AGE
+        )
+
+    def _dispatch(self, codec: bytes, request: dict) -> None:
+        server = self.server
+        request_id = request['id']
+        method = request.get('method')
+        try:
+            if (not isinstance(method, str) or method.startswith('_')
+                    or not callable(getattr(server.service, method, None))):
+                raise AttributeError(f"Unknown method {method!r}")
+            result = getattr(server.service, method)(*request.get('args', ()))
+        except Exception as e:
+            send_frame(self.request, server.authkey, codec, {
+                'id': request_id, 'ok': False,
+                'error': str(e) or type(e).__name__,
+                'error_type': type(e).__name__,
+            })
+            return
+
+        streamed = None
+        if (isinstance(result, dict)
+                and isinstance(result.get('config'), list)
+                and len(result['config']) > STREAM_CHUNK):
+            items = result['config']
+            for i in range(0, len(items), STREAM_CHUNK):
+                send_frame(self.request, server.authkey, codec, {
+                    'id': request_id, 'chunk': items[i:i + STREAM_CHUNK],
+                })
+            result = dict(result, config=[])
+            streamed = 'config'
+        send_frame(self.request, server.authkey, codec, {
+            'id': request_id, 'ok': True, 'result': result,
+            'streamed': streamed,
+        })
+
+
+class FrameServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Framed RPC server exposing a PlatformService's public methods.
+
+    Attributes:
+        service: The PlatformService being served
+        authkey: Shared secret used to sign frames
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: str, service: Any, authkey: bytes):
+        self.service = service
+        self.authkey = authkey
+        # Request IDs accepted within MAX_REQUEST_AGE: id -> expiry,
+        # plus (expiry, id) in arrival order for pruning
+        self._seen: Dict[str, float] = {}
+        self._expiries: Deque[Tuple[float, str]] = deque()
+        self._seen_lock = threading.Lock()
+        Path(address).unlink(missing_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(address, _FrameHandler)
+        finally:
+            os.umask(old_umask)
+
+
+    def first_use(self, request_id: str, ts: float) -> bool:
+        """
+        Record *request_id*; False if it was already used.
+
+        IDs are kept until their request would be rejected as stale
+        anyway, ``MAX_REQUEST_AGE`` after its timestamp.
+        """
+        now = time.time()
+        with self._seen_lock:
+            while self._expiries and self._expiries[0][0] < now:
+                self._seen.pop(self._expiries.popleft()[1], None)
+            if request_id in self._seen:
+                return False
+            expiry = ts + MAX_REQUEST_AGE
+            self._seen[request_id] = expiry
+            self._expiries.append((expiry, request_id))
+        return True
+
+
+def serve_frames(address: str, service: Any, authkey: bytes) -> FrameServer:
+    """
+    Start a FrameServer on a daemon thread.
+
+    Used as the BaseManager ``initializer`` so it runs inside the
+    manager process, next to the BaseManager listener.
+
+    Returns:
+        The running server
+    """
+    server = FrameServer(address, service, authkey)
+    threading.Thread(
+        target=server.serve_forever, name='frame-rpc', daemon=True,
+    ).start()
+    logger.info(f"Framed RPC listening on {address}")
+    return server
+
+
+# ---------------------------------------------------------------------- #
+#  Client                                                                  #
+# ---------------------------------------------------------------------- #
+
+
+class FrameRPCClient:
+    """
+    Framed-transport counterpart of ManagerRPCClient.
+
+    Offers the same methods, so action plugins can use either client.
+
+    Attributes:
+        base_url: Meraki Dashboard base URL
+        socket_path: Path to the framed transport socket
+        codec: Frame codec in use (msgpack when available, else JSON)
+        stats: Cost of the calls made so far, once enable_stats() is called
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        socket_path: str,
+        authkey: bytes,
+        codec: Optional[bytes] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Connect to the framed transport socket.
+
+        Args:
+            base_url: Meraki Dashboard base URL
+            socket_path: Path to the ``.fsock`` socket
+            authkey: The manager's authkey
+            codec: Force CODEC_JSON or CODEC_MSGPACK (default: best available)
+            timeout: Socket timeout in seconds (default: none)
+        """
+        self.base_url = base_url
+        self.socket_path = socket_path
+        self.codec = codec or (CODEC_MSGPACK if HAS_MSGPACK else CODEC_JSON)
+        self._authkey = authkey
+        self.stats: Optional[CallStats] = None
+        self._lock = threading.Lock()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(socket_path)
+        logger.debug(f"Connected to framed RPC at {socket_path}")
+
+    def call(self, method: str, *args) -> Any:
+        """
+        Call a PlatformService method in one round-trip.
+
+        Raises:
+            FrameRPCError: If the call fails remotely or on the wire
+        """
+        request_id = secrets.token_hex(8)
+        with self._lock:
+            send_frame(self._sock, self._authkey, self.codec, {
+                'id': request_id, 'ts': time.time(),
+                'method': method, 'args': list(args),
+            })
+            chunks = []
+            while True:
+                received = recv_frame(self._sock, self._authkey)
+                if received is None:
+                    raise FrameRPCError("Manager closed the connection")
+                _, response = received
+                if not isinstance(response, dict) or response.get('id') != request_id:
+                    raise FrameRPCError("Response does not match request")
+                if 'chunk' in response:
+                    chunks.extend(response['chunk'])
+                    continue
+                break
+
+        if not response.get('ok'):
+            raise FrameRPCError(
+                f"{response.get('error_type')}: {response.get('error')}"
+            )
+        result = response.get('result')
+        if response.get('streamed'):
+            result[response['streamed']] = chunks
+        return result
+
+    def enable_stats(self, stats: Optional[CallStats] = None) -> CallStats:
+        """Collect the cost of every later execute call into ``stats``."""
+        self.stats = stats if stats is not None else CallStats()
+        return self.stats
+
+    def _invoke(self, method: str, *args) -> Any:
+        """Call a service method, through call_with_stats if enabled."""
+        if self.stats is None:
+            return self.call(method, *args)
+        start = time.perf_counter()
+        reply = self.call('call_with_stats', method, list(args))
+        self.stats.merge(reply['stats'])
+        self.stats.add(rpc_seconds=time.perf_counter() - start)
+        return reply['result']
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._sock.close()
+
+    def execute(self, operation: str, module_name: str, user_data: Any) -> Any:
+        """Execute one operation (see ManagerRPCClient.execute)."""
+        return self._invoke(
+            'execute', operation, module_name, _as_dict(user_data),
+        )
+
+    def execute_many(self, operations: list, stop_on_error: bool = True) -> list:
+        """Execute several operations (see ManagerRPCClient.execute_many)."""
+        payload = [
+            [op, module, _as_dict(data)] for op, module, data in operations
+        ]
+        return self._invoke('execute_many', payload, stop_on_error)
+
+    def execute_scoped(self, groups: list, scope_param: str) -> list:
+        """Execute per-scope operations (see ManagerRPCClient.execute_scoped)."""
+        payload = [
+            [[op, module, _as_dict(data)] for op, module, data in operations]
+            for operations in groups
+        ]
+        return self._invoke('execute_scoped', payload, scope_param)
+
+    def execute_batch(self, module_name: str, mutations: list) -> dict:
+        """Apply mutations as action batches (see ManagerRPCClient.execute_batch)."""
+        payload = [[op, _as_dict(data)] for op, data in mutations]
+        return self._invoke('execute_batch', module_name, payload)
+
+    def gather_to_file(
+        self,
+        module_name: str,
+        queries: list,
+        path: str,
+        fields: Optional[list] = None
+    ) -> dict:
+        """Gather into a JSONL file (see ManagerRPCClient.gather_to_file)."""
+        payload = [_as_dict(q) for q in queries]
+        return self._invoke('gather_to_file', module_name, payload, path, fields)
+
+    def cache_stats(self) -> dict:
+        """Get the manager's response cache counters."""
+        return self.call('cache_stats')
+
+    def stats(self) -> dict:
+        """Get the manager's metrics (see PlatformService.stats)."""
+        return self.call('stats')
+
+
+def _as_dict(data: Any) -> Any:
+    return asdict(data) if is_dataclass(data) else data
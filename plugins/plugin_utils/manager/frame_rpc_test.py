@@ -0,0 +1,174 @@
+"""Colocated tests for the framed RPC transport."""
+
+import socket
+import time
+
+import pytest
+
+from . import frame_rpc
+from .frame_rpc import (
+    CODEC_JSON,
+    CODEC_MSGPACK,
+    FrameRPCClient,
+    FrameRPCError,
+    FrameServer,
+    frame_address,
+    recv_frame,
+    send_frame,
+    serve_frames,
+)
+
+KEY = b'k' * 32
+
+
+class _Service:
+    """Stands in for PlatformService."""
+
+    def execute(self, operation, module_name, user_data):
+        if operation == 'boom':
+            raise ValueError('bad input')
+        if operation == 'find' and user_data.get('count'):
+            return {'config': [{'i': i} for i in range(user_data['count'])]}
+        return {'operation': operation, 'module': module_name, **user_data}
+
+    def execute_many(self, operations, stop_on_error=True):
+        return [{'result': list(op)} for op in operations]
+
+    def cache_stats(self):
+        return {'hits': 1}
+
+    def call_with_stats(self, method, args):
+        return {
+            'result': getattr(self, method)(*args),
+            'stats': {'http_calls': {'GET': 1}, 'pages': 1},
+        }
+
+    def _private(self):
+        return 'secret'
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = serve_frames(str(tmp_path / 'm.fsock'), _Service(), KEY)
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _client(server, key=KEY, codec=CODEC_JSON):
+    return FrameRPCClient('https://x', server.server_address, key, codec, timeout=5)
+
+
+class TestFrameRPC:
+    """Calls round-trip in one signed frame each way."""
+
+    def test_frame_address(self):
+        assert frame_address('/run/m/manager_h.sock') == '/run/m/manager_h.fsock'
+
+    def test_execute_roundtrip(self, server):
+        client = _client(server)
+        assert client.execute('find', 'vlan', {'vlan_id': 10}) == {
+            'operation': 'find', 'module': 'vlan', 'vlan_id': 10,
+        }
+        # Connection is persistent across calls
+        assert client.cache_stats() == {'hits': 1}
+        assert client.execute_many([('find', 'vlan', {})]) == [
+            {'result': ['find', 'vlan', {}]},
+        ]
+        client.close()
+
+    def test_remote_error_raised(self, server):
+        client = _client(server)
+        with pytest.raises(FrameRPCError, match='ValueError: bad input'):
+            client.execute('boom', 'vlan', {})
+        # The connection survives a failed call
+        assert client.cache_stats() == {'hits': 1}
+
+    def test_private_methods_not_exposed(self, server):
+        client = _client(server)
+        with pytest.raises(FrameRPCError, match='AttributeError'):
+            client.call('_private')
+
+    def test_large_config_streamed(self, server, monkeypatch):
+        monkeypatch.setattr(frame_rpc, 'STREAM_CHUNK', 10)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(server.server_address)
+        send_frame(sock, KEY, CODEC_JSON, {
+            'id': 'r1', 'ts': time.time(), 'method': 'execute',
+            'args': ['find', 'vlan', {'count': 25}],
+        })
+        frames = []
+        while True:
+            _, frame = recv_frame(sock, KEY)
+            frames.append(frame)
+            if 'ok' in frame:
+                break
+        sock.close()
+        assert [len(f['chunk']) for f in frames[:-1]] == [10, 10, 5]
+        assert frames[-1]['result'] == {'config': []}
+
+        client = _client(server)
+        result = client.execute('find', 'vlan', {'count': 25})
+        assert result['config'] == [{'i': i} for i in range(25)]
+
+    def test_wrong_key_rejected(self, server):
+        client = _client(server, key=b'x' * 32)
+        with pytest.raises((FrameRPCError, OSError)):
+            client.cache_stats()
+
+    def test_stale_request_rejected(self, server):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        sock.connect(server.server_address)
+        send_frame(sock, KEY, CODEC_JSON, {
+            'id': 'r1', 'ts': time.time() - 3600,
+            'method': 'cache_stats', 'args': [],
+        })
+        assert recv_frame(sock, KEY) is None
+        sock.close()
+
+    def test_replayed_request_rejected(self, server):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        sock.connect(server.server_address)
+        request = {
+            'id': 'r1', 'ts': time.time(), 'method': 'cache_stats', 'args': [],
+        }
+        send_frame(sock, KEY, CODEC_JSON, request)
+        assert recv_frame(sock, KEY)[1]['result'] == {'hits': 1}
+        send_frame(sock, KEY, CODEC_JSON, request)
+        assert recv_frame(sock, KEY) is None
+        sock.close()
+
+    def test_seen_ids_pruned_after_max_age(self, server):
+        assert server.first_use('old', time.time() - 2 * frame_rpc.MAX_REQUEST_AGE)
+        assert server.first_use('new', time.time())
+        assert not server.first_use('new', time.time())
+        assert list(server._seen) == ['new']
+
+    def test_stale_socket_replaced(self, tmp_path):
+        path = tmp_path / 'm.fsock'
+        path.write_text('')
+        srv = FrameServer(str(path), _Service(), KEY)
+        assert path.stat().st_mode & 0o077 == 0
+        srv.server_close()
+
+    def test_stdlib_json_fallback(self, server, monkeypatch):
+        monkeypatch.setattr(frame_rpc, 'HAS_ORJSON', False)
+        client = _client(server)
+        assert client.execute('find', 'vlan', {'n': 1})['n'] == 1
+
+    def test_stats_accumulate(self, server):
+        client = _client(server)
+        stats = client.enable_stats()
+        client.execute('find', 'vlan', {})
+        client.execute_many([('find', 'vlan', {})])
+        data = stats.as_dict()
+        assert data['http_calls'] == {'GET': 2}
+        assert data['pages'] == 2
+        assert data['rpc_seconds'] > 0
+
+    @pytest.mark.skipif(not frame_rpc.HAS_MSGPACK, reason='msgpack not installed')
+    def test_msgpack_codec(self, server):
+        client = _client(server, codec=CODEC_MSGPACK)
+        assert client.execute('find', 'vlan', {'n': 1})['n'] == 1
@@ -0,0 +1,326 @@
+"""In-process metrics for PlatformService.
+
+The manager is long-lived and shared by every task, so it is the one
+place that sees the whole run.  ``Metrics`` keeps labelled counters and
+histograms in memory.  They are returned by the ``stats()`` RPC and can
+be rendered in the Prometheus text exposition format, for example into
+a file for the node_exporter textfile collector.
+
+Labels describing the current call come from a context variable set
+with ``labelled()``.  ``execute()`` sets ``module`` and ``operation``,
+and the endpoint call sets ``endpoint``.  Everything recorded inside,
+including HTTP requests made from worker threads that copied the
+context, is attributed to them.  This shows which modules spend the
+rate budget.
+
+``CallStats`` is a second, per-call view of the same work.  It is
+collected only inside ``collecting()`` and is returned to the client
+with the call's result, for the ``meraki_stats`` task result.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds; suits Dashboard round-trips from a few ms to a slow paginated page
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_TEXTFILE_INTERVAL = 15.0
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+_context_labels: ContextVar[Dict[str, str]] = ContextVar(
+    'meraki_metric_labels', default={},
+)
+
+
+@contextmanager
+def labelled(**labels: str) -> Iterator[None]:
+    """Attribute metrics recorded in this context to *labels*."""
+    token = _context_labels.set({**_context_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _context_labels.reset(token)
+
+
+def current_labels() -> Dict[str, str]:
+    """Labels set by the enclosing ``labelled()`` blocks."""
+    return dict(_context_labels.get())
+
+
+class CallStats:
+    """
+    Cost of one task's RPC calls, reported as ``meraki_stats``.
+
+    The manager fills one per call in ``call_with_stats()``.  Threads
+    working on the call copy the context that holds it, so updates are
+    locked.  Clients merge the per-call dicts into one per task.
+
+    Attributes:
+        http_calls: HTTP requests sent, by method
+        values: Summed amounts, keyed by FIELDS
+    """
+
+    FIELDS = (
+        'pages', 'bytes_received', 'cache_hits', 'rate_limit_wait_seconds',
+        'http_seconds', 'transform_seconds', 'manager_seconds',
+        'rpc_seconds', 'validation_seconds',
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.http_calls: Dict[str, int] = {}
+        self.values: Dict[str, float] = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, **amounts: float) -> None:
+        """Add to the named FIELDS."""
+        with self._lock:
+            for field, amount in amounts.items():
+                self.values[field] += amount
+
+    def add_call(self, method: str, seconds: float, size: int) -> None:
+        """Record one HTTP request."""
+        with self._lock:
+            self.http_calls[method] = self.http_calls.get(method, 0) + 1
+            self.values['http_seconds'] += seconds
+            self.values['bytes_received'] += size
+
+    def merge(self, data: dict) -> None:
+        """Add a dict produced by ``as_dict()``."""
+        with self._lock:
+            for method, count in data.get('http_calls', {}).items():
+                self.http_calls[method] = self.http_calls.get(method, 0) + count
+            for field in self.FIELDS:
+                self.values[field] += data.get(field, 0)
+
+    def as_dict(self) -> dict:
+        """Plain-data copy (RPC and JSON safe)."""
+        with self._lock:
+            return {'http_calls': dict(self.http_calls), **self.values}
+
+
+_call_stats: ContextVar[Optional[CallStats]] = ContextVar(
+    'meraki_call_stats', default=None,
+)
+
+
+@contextmanager
+def collecting() -> Iterator[CallStats]:
+    """Collect the cost of everything run in this context."""
+    stats = CallStats()
+    token = _call_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _call_stats.reset(token)
+
+
+def call_stats() -> Optional[CallStats]:
+    """The collector of the enclosing ``collecting()`` block, if any."""
+    return _call_stats.get()
+
+
+@contextmanager
+def timed(field: str) -> Iterator[None]:
+    """Add the block's wall-clock time to *field* of the current collector."""
+    stats = _call_stats.get()
+    if stats is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add(**{field: time.perf_counter() - start})
+
+
+class Metrics:
+    """
+    Thread-safe registry of labelled counters and histograms.
+
+    Series are created on first use.  Each sample carries the labels of
+    the current ``labelled()`` context plus any passed explicitly.
+
+    Attributes:
+        buckets: Histogram bucket upper bounds
+        started: Wall-clock time the registry was created
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, _Labels], float] = {}
+        # [per-bucket counts..., sum, count]
+        self._histograms: Dict[Tuple[str, _Labels], list] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> Tuple[str, _Labels]:
+        merged = {**_context_labels.get(), **labels}
+        return name, tuple(sorted((k, str(v)) for k, v in merged.items()))
+
+    def inc(self, name: str, value: float = 1.0, /, **labels: str) -> None:
+        """Add *value* to counter *name*."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, /, **labels: str) -> None:
+        """Record *value* in histogram *name*."""
+        key = self._key(name, labels)
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Return all series as plain data (RPC and JSON safe).
+
+        Returns:
+            Dict with ``uptime_seconds``, ``counters`` (list of
+            ``{name, labels, value}``) and ``histograms`` (list of
+            ``{name, labels, buckets, sum, count}``, where ``buckets`` is
+            ``[[upper bound, cumulative count], ...]``)
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            histograms = [(k, list(v)) for k, v in self._histograms.items()]
+
+        result = {
+            'uptime_seconds': time.time() - self.started,
+            'counters': [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(counters)
+            ],
+            'histograms': [],
+        }
+        for (name, labels), series in sorted(histograms, key=lambda h: h[0]):
+            cumulative, buckets = 0, []
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                buckets.append([bound, cumulative])
+            result['histograms'].append({
+                'name': name, 'labels': dict(labels), 'buckets': buckets,
+                'sum': series[-2], 'count': series[-1],
+            })
+        return result
+
+    def render(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        """
+        Render all series in the Prometheus text exposition format.
+
+        Args:
+            gauges: Point-in-time values (name -> value) to include,
+                such as in-flight requests
+
+        Returns:
+            Exposition text ending in a newline
+        """
+        snap = self.snapshot()
+        lines = []
+        for name, value in sorted((gauges or {}).items()):
+            lines += [f'# TYPE {name} gauge', f'{name} {_number(value)}']
+
+        seen = set()
+        for sample in snap['counters']:
+            name = sample['name']
+            if name not in seen:
+                seen.add(name)
+                lines.append(f'# TYPE {name} counter')
+            lines.append(
+                f"{name}{_labels(sample['labels'])} {_number(sample['value'])}"
+            )
+
+        for sample in snap['histograms']:
+            name, labels = sample['name'], sample['labels']
+            if name not in seen:
+                seen.add(name)
+                lines.append(f'# TYPE {name} histogram')
+            for bound, count in sample['buckets']:
+                lines.append(
+                    f"{name}_bucket{_labels({**labels, 'le': _number(bound)})} "
+                    f"{count}"
+                )
+            lines.append(
+                f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} "
+                f"{sample['count']}"
+            )
+            lines.append(f"{name}_sum{_labels(labels)} {_number(sample['sum'])}")
+            lines.append(f"{name}_count{_labels(labels)} {sample['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(
+        self,
+        path: str,
+        gauges: Optional[Dict[str, float]] = None
+    ) -> None:
+        """Write ``render()`` to *path* atomically (rename into place)."""
+        directory = os.path.dirname(path) or '.'
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.render(gauges))
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    parts = []
+    for key, value in sorted(labels.items()):
+        value = (
+            str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n')
+        )
+        parts.append(f'{key}="{value}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def start_textfile_writer(
+    metrics: Metrics,
+    path: str,
+    interval: float = DEFAULT_TEXTFILE_INTERVAL,
+    gauges: Optional[Callable[[], Dict[str, float]]] = None
+) -> threading.Thread:
+    """
+    Rewrite *path* from *metrics* every *interval* seconds.
+
+    Runs on a daemon thread for the life of the process.  Write errors
+    are logged and retried on the next interval.
+
+    Returns:
+        The started thread
+    """
+    def _loop():
+        while True:
+            try:
+                metrics.write_textfile(path, gauges() if gauges else None)
+            except OSError as e:
+                logger.warning(f"Metrics textfile {path} not written: {e}")
+            time.sleep(interval)
+
+    thread = threading.Thread(target=_loop, name='metrics-textfile', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,114 @@
+"""Colocated tests for the manager metrics registry."""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+from .metrics import (
+    CallStats,
+    Metrics,
+    call_stats,
+    collecting,
+    labelled,
+    timed,
+)
+
+
+class TestMetrics:
+    """Counters and histograms pick up context labels."""
+
+    def test_context_labels(self):
+        metrics = Metrics()
+        with labelled(module='vlan'):
+            with labelled(operation='find'):
+                metrics.inc('calls_total', status='200')
+            metrics.inc('calls_total')
+        metrics.inc('calls_total', 2)
+
+        counters = {
+            tuple(sorted(c['labels'].items())): c['value']
+            for c in metrics.snapshot()['counters']
+        }
+        assert counters == {
+            (('module', 'vlan'), ('operation', 'find'), ('status', '200')): 1.0,
+            (('module', 'vlan'),): 1.0,
+            (): 2.0,
+        }
+
+    def test_labels_follow_copied_context(self):
+        metrics = Metrics()
+        with labelled(module='ssid'):
+            with ThreadPoolExecutor(2) as pool:
+                for _ in range(2):
+                    pool.submit(copy_context().run, metrics.inc, 'calls_total')
+        [sample] = metrics.snapshot()['counters']
+        assert sample['labels'] == {'module': 'ssid'}
+        assert sample['value'] == 2.0
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = Metrics(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            metrics.observe('latency_seconds', value)
+        [hist] = metrics.snapshot()['histograms']
+        assert hist['buckets'] == [[0.1, 1], [1.0, 2]]
+        assert hist['count'] == 3
+        assert hist['sum'] == 5.55
+
+    def test_render_exposition(self):
+        metrics = Metrics(buckets=(1.0,))
+        metrics.inc('requests_total', endpoint='/networks/{networkId}', status='200')
+        metrics.observe('latency_seconds', 0.5, method='GET')
+        text = metrics.render({'in_flight': 3})
+
+        assert text.endswith('\n')
+        lines = text.splitlines()
+        assert '# TYPE in_flight gauge' in lines
+        assert 'in_flight 3' in lines
+        assert '# TYPE requests_total counter' in lines
+        assert (
+            'requests_total{endpoint="/networks/{networkId}",status="200"} 1.0'
+            in lines
+        )
+        assert '# TYPE latency_seconds histogram' in lines
+        assert 'latency_seconds_bucket{le="1.0",method="GET"} 1' in lines
+        assert 'latency_seconds_bucket{le="+Inf",method="GET"} 1' in lines
+        assert 'latency_seconds_count{method="GET"} 1' in lines
+
+    def test_label_values_escaped(self):
+        metrics = Metrics()
+        metrics.inc('x_total', name='a"b\\c')
+        assert 'x_total{name="a\\"b\\\\c"} 1.0' in metrics.render()
+
+    def test_write_textfile(self, tmp_path):
+        metrics = Metrics()
+        metrics.inc('x_total')
+        path = tmp_path / 'manager.prom'
+        metrics.write_textfile(str(path))
+        assert 'x_total 1.0' in path.read_text()
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestCallStats:
+    """Per-call cost collection."""
+
+    def test_collecting_and_merge(self):
+        with collecting() as stats:
+            call_stats().add_call('GET', 0.25, 100)
+            call_stats().add(pages=1)
+            with timed('transform_seconds'):
+                pass
+        assert call_stats() is None
+
+        total = CallStats()
+        total.merge(stats.as_dict())
+        total.merge(stats.as_dict())
+        data = total.as_dict()
+        assert data['http_calls'] == {'GET': 2}
+        assert data['bytes_received'] == 200
+        assert data['pages'] == 2
+        assert data['http_seconds'] == 0.5
+        assert data['transform_seconds'] >= 0
+
+    def test_timed_without_collector(self):
+        with timed('transform_seconds'):
+            pass
+        assert call_stats() is None
@@ -9,25 +9,48 @@ This module provides:
 Adapted from the NovaCom reference pattern for the Meraki Dashboard API.
 Key Meraki-specific changes:
 - X-Cisco-Meraki-API-Key authentication header
-- Rate limit handling (429 + Retry-After)
+- Per-organization request pacing (token bucket) plus 429 + Retry-After
 - Automatic pagination via Link header
+- Read-through cache of GET responses, invalidated by writes
+- Request, rate-limit and cache metrics per module and operation
 - Base URL: https://api.meraki.com/api/v1
 - Single API version (v1)
 """
 
+import json
 import requests
 import logging
 import threading
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 from multiprocessing.managers import BaseManager
 from socketserver import ThreadingMixIn
-from typing import Any, Dict, Optional, List
-from dataclasses import asdict, fields, is_dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List
+from urllib.parse import urlencode
+from dataclasses import asdict, is_dataclass
 
 from ..platform.registry import APIVersionRegistry
 from ..platform.loader import DynamicClassLoader
-from ..platform.types import EndpointOperation
+from ..platform.operation_plan import CompiledOperation, OperationPlan
+from .action_batch import ActionBatchRunner, to_action
+from .device_index import DEFAULT_INDEX_TTL, DeviceIndex
+from .frame_rpc import serve_frames
+from .metrics import (
+    DEFAULT_TEXTFILE_INTERVAL,
+    Metrics,
+    call_stats,
+    collecting,
+    current_labels,
+    labelled,
+    start_textfile_writer,
+    timed,
+)
+from .rate_limiter import DEFAULT_BURST, DEFAULT_RATE_LIMIT, OrgRateLimiter
+from .response_cache import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL, ResponseCache
+from .session_pool import DEFAULT_MAX_CONNECTIONS, SessionPool
+from .spool import Spool, current_spool, spooling
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +58,69 @@ logger = logging.getLogger(__name__)
 _DEFAULT_MAX_RETRIES = 5
 _DEFAULT_RETRY_WAIT = 1
 
+# Seconds before a failed network/device -> org lookup is retried
+_OWNER_RETRY_AFTER = 30.0
+
+# Methods whose cost call_with_stats() may report
+_MEASURED_METHODS = (
+    'execute', 'execute_many', 'execute_batch', 'gather_to_file',
+    'execute_scoped',
+)
+
+# Within execute_scoped(): the scope parameter and the API data already
+# transformed for each (User Model class, fields other than the scope).
+_shared_transforms: ContextVar[Optional[tuple]] = ContextVar(
+    'meraki_shared_transforms', default=None,
+)
+
+# Leading path segment -> kind of ID it carries, used to find the org
+# that owns a request.
+_SCOPE_RE = re.compile(r'^/(organizations|networks|devices)/([^/?#]+)')
+_SCOPE_PARAMS = {
+    'organizations': '{organizationId}',
+    'networks': '{networkId}',
+    'devices': '{serial}',
+}
+
+# Largest perPage accepted by paginated list endpoints, by path template.
+# Fewer, larger pages mean fewer requests against the per-org rate limit.
+_PER_PAGE_MAX = {
+    '/organizations': 9000,
+    '/organizations/{organizationId}/networks': 100000,
+    '/organizations/{organizationId}/devices': 1000,
+    '/organizations/{organizationId}/inventory/devices': 1000,
+    '/organizations/{organizationId}/policyObjects': 5000,
+    '/organizations/{organizationId}/devices/statuses': 1000,
+    '/organizations/{organizationId}/uplinks/statuses': 1000,
+    '/organizations/{organizationId}/switch/ports/bySwitch': 50,
+}
+
+# Module -> organization-wide listing of its per-device items, used by
+# the 'find_org' operation: (org listing path, per-device listing path,
+# key of the items in each device entry, item ID key).
+_ORG_LISTINGS = {
+    'switch_port': (
+        '/organizations/{organizationId}/switch/ports/bySwitch',
+        '/devices/{serial}/switch/ports', 'ports', 'portId',
+    ),
+}
+
+# meraki_facts gather_subset -> (listing path, item key holding the
+# network ID or None if the subset is not narrowed by network_id,
+# included in 'all').  Statuses are opt-in: they change on every run.
+_FACT_SUBSETS = {
+    'organizations': ('/organizations', None, True),
+    'networks': ('/organizations/{organizationId}/networks', 'id', True),
+    'devices': ('/organizations/{organizationId}/devices', 'networkId', True),
+    'inventory': ('/organizations/{organizationId}/inventory/devices', None, True),
+    'device_statuses': (
+        '/organizations/{organizationId}/devices/statuses', 'networkId', False,
+    ),
+    'uplinks': (
+        '/organizations/{organizationId}/uplinks/statuses', 'networkId', False,
+    ),
+}
+
 
 class PlatformService:
     """
@@ -46,14 +132,29 @@ class PlatformService:
 
     Attributes:
         base_url: Meraki Dashboard base URL
-        session: Persistent HTTP session with Meraki auth
+        sessions: Pool of persistent HTTP sessions with Meraki auth
+        rate_limiter: Per-organization request pacing
+        response_cache: Cache of GET responses shared by all tasks
+        device_index: Per-device listings from organization-wide ones
+        metrics: Request, rate-limit, cache and operation metrics
         api_version: Detected/cached API version (always '1' for Meraki)
         registry: Version registry
         loader: Class loader
         cache: Lookup cache (org names <-> IDs, network names <-> IDs, etc.)
     """
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        session_factory: Optional[Callable[[], requests.Session]] = None,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_BURST,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        index_ttl: float = DEFAULT_INDEX_TTL,
+    ):
         """
         Initialize platform service with Meraki credentials.
 
@@ -61,18 +162,29 @@ class PlatformService:
             base_url: Meraki Dashboard base URL
                 (e.g., 'https://api.meraki.com/api/v1')
             api_key: Meraki API key
+            max_connections: Maximum concurrent in-flight HTTP requests
+            session_factory: Optional callable creating the underlying
+                ``requests.Session`` (tests mount in-process adapters)
+            rate_limit: Requests per second per organization (0 disables
+                pacing; 429 responses are still retried)
+            rate_burst: Requests an idle organization may send at once
+            cache_ttl: Seconds a cached GET response stays valid
+                (0 disables the response cache)
+            cache_size: Maximum number of cached GET responses
+            index_ttl: Seconds per-device listings from a ``find_org``
+                stay valid (0 disables the index)
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
-        self._session_lock = threading.Lock()
+        self._session_factory = session_factory or requests.Session
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-Cisco-Meraki-API-Key': api_key,
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'User-Agent': 'cisco.meraki_rm Ansible Collection',
-        })
+        self.sessions = SessionPool(self._new_session, max_connections)
+        self.rate_limiter = OrgRateLimiter(rate_limit, rate_burst)
+        self.response_cache = ResponseCache(cache_size, cache_ttl)
+        self.device_index = DeviceIndex(index_ttl)
+        self.metrics = Metrics()
+        self._executing = 0
+        self._executing_lock = threading.Lock()
 
         self.api_version = self._detect_version()
         logger.info(f"PlatformService initialized with API v{self.api_version}")
@@ -81,6 +193,19 @@ class PlatformService:
         self.loader = DynamicClassLoader(self.registry)
 
         self.cache: Dict[str, Any] = {}
+        # Owner lookup cache key -> time after which a failed lookup is retried
+        self._owner_failures: Dict[str, float] = {}
+
+    def _new_session(self) -> requests.Session:
+        """Create one authenticated session for the pool."""
+        session = self._session_factory()
+        session.headers.update({
+            'X-Cisco-Meraki-API-Key': self.api_key,
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'User-Agent': 'cisco.meraki_rm Ansible Collection',
+        })
+        return session
 
     def _detect_version(self) -> str:
         """
@@ -91,34 +216,152 @@ class PlatformService:
         """
         return '1'
 
-    def _handle_rate_limit(self, response: requests.Response) -> bool:
+    def _handle_rate_limit(
+        self,
+        response: requests.Response,
+        org_id: Optional[str] = None
+    ) -> bool:
         """
         Handle 429 rate limit response from Meraki.
 
+        With pacing enabled the org's bucket is blocked for
+        ``Retry-After`` so every thread working on that org backs off
+        together; the retry then waits in ``_request``.
+
         Args:
             response: HTTP response
+            org_id: Organization the request was charged to
 
         Returns:
             True if rate limited (caller should retry), False otherwise
         """
         if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', _DEFAULT_RETRY_WAIT))
-            logger.warning(f"Rate limited. Retrying after {retry_after}s")
-            time.sleep(retry_after)
+            retry_after = float(
+                response.headers.get('Retry-After', _DEFAULT_RETRY_WAIT)
+            )
+            logger.warning(
+                f"Rate limited (org {org_id}). Retrying after {retry_after}s"
+            )
+            self.metrics.inc('meraki_rate_limited_total')
+            self.metrics.inc('meraki_retry_after_seconds_total', retry_after)
+            if self.rate_limiter.enabled:
+                self.rate_limiter.penalize(org_id, retry_after)
+            else:
+                with timed('rate_limit_wait_seconds'):
+                    time.sleep(retry_after)
             return True
         return False
 
-    def _api_call(self, method: str, url: str, **kwargs) -> requests.Response:
+    def _org_for_url(self, url: str) -> Optional[str]:
         """
-        Make API call with rate limit retry.
+        Determine the organization that owns a request URL.
+
+        ``/organizations/{id}`` paths carry it directly.  Network and
+        device paths are resolved once via ``GET /networks/{id}`` or
+        ``GET /devices/{serial}`` and cached in ``self.cache``.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Organization ID, or None when the URL is not org-scoped or
+            the owner cannot be determined
+        """
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        match = _SCOPE_RE.match(path)
+        if not match:
+            return None
+        kind, ident = match.groups()
+        if kind == 'organizations':
+            return ident
+        if kind == 'networks':
+            return self._org_for_network(ident)
+        return self._org_for_device(ident)
+
+    def _org_for_network(self, network_id: str) -> Optional[str]:
+        """Resolve (and cache) the organization owning a network."""
+        def _resolve():
+            net = self._lookup_owner(f'{self.base_url}/networks/{network_id}')
+            return net.get('organizationId')
+
+        return self._resolve_owner(f'net_org:{network_id}', _resolve)
+
+    def _org_for_device(self, serial: str) -> Optional[str]:
+        """Resolve (and cache) the organization owning a device."""
+        def _resolve():
+            dev = self._lookup_owner(f'{self.base_url}/devices/{serial}')
+            network_id = dev.get('networkId')
+            return self._org_for_network(network_id) if network_id else None
+
+        return self._resolve_owner(f'device_org:{serial}', _resolve)
+
+    def _resolve_owner(
+        self,
+        cache_key: str,
+        resolve: Callable[[], Optional[str]]
+    ) -> Optional[str]:
+        """
+        Org ID under *cache_key* in ``self.cache``, resolving it if needed.
+
+        Only resolved owners are cached.  A failed lookup (429 after all
+        retries, timeout, unknown network) is retried once
+        ``_OWNER_RETRY_AFTER`` seconds have passed; until then requests
+        share the ``None`` bucket.
+        """
+        if cache_key in self.cache:
+            return self.cache[cache_key]
+        if self._owner_failures.get(cache_key, 0.0) > time.monotonic():
+            return None
+        org_id = resolve()
+        if org_id is None:
+            self._owner_failures[cache_key] = time.monotonic() + _OWNER_RETRY_AFTER
+        else:
+            self.cache[cache_key] = org_id
+            self._owner_failures.pop(cache_key, None)
+        return org_id
+
+    def _lookup_owner(self, url: str) -> dict:
+        """GET a network/device record for org resolution; {} on failure."""
+        try:
+            with labelled(endpoint=self._path_template(url)):
+                response = self._request('GET', url, None)
+            if response.ok:
+                data = response.json()
+                return data if isinstance(data, dict) else {}
+        except (requests.RequestException, ValueError, RuntimeError) as e:
+            logger.debug(f"Org lookup failed for {url}: {e}")
+        return {}
+
+    def _remember_network_orgs(self, org_id: str, networks: List[dict]) -> None:
+        """Seed the network -> org cache from an org network listing."""
+        for net in networks:
+            if isinstance(net, dict) and net.get('id'):
+                self.cache[f'net_org:{net["id"]}'] = org_id
+
+    def _api_call(
+        self,
+        method: str,
+        url: str,
+        use_cache: bool = True,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Make API call paced by the owning organization's rate limit.
+
+        Successful GETs are answered from ``device_index`` or from / into
+        ``response_cache``; any other method invalidates the entries it
+        affects in both (see ``_invalidate``).
 
         Thread-safe: PlatformManager uses ThreadingMixIn so multiple worker
         connections are served concurrently.  requests.Session is not
-        thread-safe, so all HTTP I/O is serialized through _session_lock.
+        thread-safe, so each request borrows a session from the pool;
+        up to ``max_connections`` requests are in flight at once.
 
         Args:
             method: HTTP method
             url: Full URL
+            use_cache: Whether a GET may be answered from / stored in
+                the response cache (False for status polling)
             **kwargs: Passed to requests.Session.request
 
         Returns:
@@ -127,10 +370,235 @@ class PlatformService:
         Raises:
             RuntimeError: If rate limit exceeded after max retries
         """
+        use_cache = use_cache and method == 'GET'
+        if use_cache:
+            indexed = self.device_index.get(url)
+            if indexed is not None:
+                self.metrics.inc('meraki_cache_lookups_total', result='index')
+                stats = call_stats()
+                if stats is not None:
+                    stats.add(cache_hits=1)
+                response = requests.Response()
+                response.status_code = 200
+                response._content = json.dumps(indexed).encode()
+                response.url = url
+                return response
+
+            cached = self.response_cache.get(url)
+            self.metrics.inc(
+                'meraki_cache_lookups_total',
+                result='miss' if cached is None else 'hit',
+            )
+            if cached is not None:
+                stats = call_stats()
+                if stats is not None:
+                    stats.add(cache_hits=1)
+                return cached
+
+        org_id = self._org_for_url(url) if self.rate_limiter.enabled else None
+        token = self.response_cache.token()
+        try:
+            response = self._request(method, url, org_id, **kwargs)
+        finally:
+            if method != 'GET':
+                self._invalidate(url, org_id)
+
+        if use_cache:
+            self.response_cache.put(url, response, token)
+        return response
+
+    def _invalidate(self, url: str, org_id: Optional[str]) -> None:
+        """
+        Drop cached responses and indexed listings a write to *url* affects.
+
+        Besides the path rules of ``ResponseCache.invalidate``, every
+        cached listing of the owning organization is dropped: org-wide
+        listings (devices, inventory, switch ports by switch) embed
+        items written under ``/networks`` and ``/devices`` paths.  When
+        the owner is not known (pacing disabled, or not resolvable),
+        the listings of every organization are dropped instead.
+        """
+        self.response_cache.invalidate(url)
+        org_path = '/organizations' if org_id is None else f'/organizations/{org_id}'
+        self.response_cache.invalidate(f"{self.base_url}{org_path}", ancestors=False)
+        self.device_index.invalidate(url)
+
+    def cache_stats(self) -> dict:
+        """
+        Return response cache counters (exposed via RPC).
+
+        ``hits`` is the number of Dashboard calls the cache has saved
+        since the manager started.
+
+        Returns:
+            Dict with hits, misses, evictions, invalidations and size
+        """
+        return self.response_cache.stats()
+
+    def stats(self) -> dict:
+        """
+        Return manager metrics (exposed via RPC).
+
+        Counters and histograms are labelled with the ``module`` and
+        ``operation`` of the ``execute()`` call that caused them, and
+        HTTP series also with ``method``, ``endpoint`` (path template)
+        and ``status``:
+
+        - ``meraki_http_requests_total``, ``meraki_http_request_duration_seconds``
+        - ``meraki_pages_total``: pages fetched by paginated GETs
+        - ``meraki_rate_limited_total``, ``meraki_retry_after_seconds_total``
+        - ``meraki_rate_limit_wait_seconds_total``: time spent pacing
+        - ``meraki_cache_lookups_total`` (``result`` hit/miss, or index
+          for ``device_index`` hits)
+        - ``meraki_operations_total`` (``outcome`` ok/error),
+          ``meraki_operation_duration_seconds``
+
+        Returns:
+            ``Metrics.snapshot()`` plus ``gauges`` (point-in-time
+            values), ``cache`` (response cache counters) and ``index``
+            (device index counters)
+        """
+        snapshot = self.metrics.snapshot()
+        snapshot['gauges'] = self._gauges()
+        snapshot['cache'] = self.response_cache.stats()
+        snapshot['index'] = self.device_index.stats()
+        return snapshot
+
+    def call_with_stats(self, method: str, args: list) -> dict:
+        """
+        Call ``execute``, ``execute_many`` or ``execute_batch`` and report its cost.
+
+        Used by clients with stats enabled, for the ``meraki_stats``
+        task result.
+
+        Args:
+            method: Name of the method to call
+            args: Its positional arguments
+
+        Returns:
+            ``{'result': <method result>, 'stats': CallStats.as_dict()}``
+
+        Raises:
+            ValueError: If *method* is not one that can be measured
+        """
+        if method not in _MEASURED_METHODS:
+            raise ValueError(f"Cannot measure method: {method}")
+        with collecting() as stats:
+            with timed('manager_seconds'):
+                result = getattr(self, method)(*args)
+        return {'result': result, 'stats': stats.as_dict()}
+
+    def _gauges(self) -> Dict[str, float]:
+        """Point-in-time values for ``stats()`` and the textfile."""
+        return {
+            'meraki_http_in_flight': self.sessions.in_flight,
+            'meraki_http_sessions': self.sessions.created,
+            'meraki_operations_in_flight': self._executing,
+            'meraki_manager_threads': threading.active_count(),
+            'meraki_cache_entries': self.response_cache.stats()['size'],
+        }
+
+    def _endpoint_label(self, url: str) -> str:
+        """
+        Endpoint template for a request URL.
+
+        Calls made for an endpoint operation carry its path template in
+        the ``endpoint`` label already.  Other calls, such as org lookups
+        and facts, get their leading organization, network or device ID
+        replaced by a placeholder, to keep the label set small.
+        """
+        return current_labels().get('endpoint') or self._path_template(url)
+
+    def _path_template(self, url: str) -> str:
+        """*url* as a path with its leading scope ID replaced by a placeholder."""
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        path = path.split('?', 1)[0]
+        return _SCOPE_RE.sub(
+            lambda m: f'/{m.group(1)}/{_SCOPE_PARAMS[m.group(1)]}', path,
+        )
+
+    def warm_up(self) -> dict:
+        """
+        Preload module classes and open a Dashboard connection.
+
+        Runs on a background thread once the manager process is up (see
+        init_manager_process), so that the first task for each module
+        skips the imports, the operation plan compilation and the TLS
+        handshake.  It can also be called via RPC.  Failures are logged
+        and skipped; the task that needs the module reports them.
+
+        Returns:
+            Dict with counts of modules loaded and failed, and seconds taken
+        """
+        start = time.monotonic()
+        try:
+            with self.sessions.session() as session:
+                session.head(self.base_url, timeout=10)
+        except requests.RequestException as e:
+            logger.debug(f"Warm-up: Dashboard connection not opened: {e}")
+
+        loaded = failed = 0
+        for module_name in self.registry.get_modules_for_version(
+            self.api_version,
+        ):
+            if module_name.endswith('_test'):
+                continue
+            try:
+                _, _, mixin_class = self.loader.load_classes_for_module(
+                    module_name, self.api_version,
+                )
+                for operation in ('find', 'create', 'update', 'delete'):
+                    self.loader.load_operation_plan(mixin_class, operation)
+                loaded += 1
+            except Exception as e:
+                failed += 1
+                logger.debug(f"Warm-up: {module_name} not preloaded: {e}")
+
+        elapsed = time.monotonic() - start
+        logger.info(
+            f"Warm-up: preloaded {loaded} modules ({failed} failed) "
+            f"in {elapsed:.2f}s"
+        )
+        return {'loaded': loaded, 'failed': failed, 'seconds': elapsed}
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        org_id: Optional[str],
+        **kwargs
+    ) -> requests.Response:
+        """Send one request charged to *org_id*, retrying on 429."""
+        endpoint = self._endpoint_label(url)
         for attempt in range(_DEFAULT_MAX_RETRIES):
-            with self._session_lock:
-                response = self.session.request(method, url, **kwargs)
-            if not self._handle_rate_limit(response):
+            stats = call_stats()
+            waited = self.rate_limiter.acquire(org_id)
+            if waited:
+                self.metrics.inc('meraki_rate_limit_wait_seconds_total', waited)
+                if stats is not None:
+                    stats.add(rate_limit_wait_seconds=waited)
+            start = time.monotonic()
+            status = 'error'
+            try:
+                with self.sessions.session() as session:
+                    response = session.request(method, url, **kwargs)
+                status = str(response.status_code)
+                if stats is not None:
+                    stats.add_call(
+                        method, time.monotonic() - start,
+                        len(response.content or b''),
+                    )
+            finally:
+                self.metrics.inc(
+                    'meraki_http_requests_total',
+                    method=method, endpoint=endpoint, status=status,
+                )
+                self.metrics.observe(
+                    'meraki_http_request_duration_seconds',
+                    time.monotonic() - start,
+                    method=method, endpoint=endpoint,
+                )
+            if not self._handle_rate_limit(response, org_id):
                 return response
         raise RuntimeError(
             f"Rate limit exceeded after {_DEFAULT_MAX_RETRIES} retries for {method} {url}"
@@ -140,9 +608,6 @@ class PlatformService:
         """
         GET with automatic pagination via Link header.
 
-        Meraki list endpoints return paginated results with Link headers
-        containing rel=next for the next page URL.
-
         Args:
             url: Initial GET URL
             **kwargs: Passed to requests.Session.request
@@ -150,23 +615,96 @@ class PlatformService:
         Returns:
             Combined list of all pages
         """
-        results = []
-        current_url: Optional[str] = url
+        return [item for page in self._iter_pages(url, **kwargs) for item in page]
+
+    def _iter_pages(self, url: str, **kwargs) -> Iterator[List[dict]]:
+        """
+        Yield the items of a paginated GET one page at a time.
+
+        Meraki list endpoints return paginated results with Link headers
+        containing rel=next for the next page URL.  The first request
+        asks for the largest ``perPage`` the endpoint allows (see
+        ``_PER_PAGE_MAX``); later pages keep it through the Link URL.
+
+        Each page is fetched when the previous one has been consumed, so
+        callers that transform or filter as they go hold one page of raw
+        items at a time instead of the whole listing.
+
+        Args:
+            url: Initial GET URL
+            **kwargs: Passed to requests.Session.request
+
+        Yields:
+            List of items on each page (a non-list body as a one-item list)
+        """
+        endpoint = self._endpoint_label(url)
+        current_url: Optional[str] = self._with_per_page(url)
 
         while current_url:
             response = self._api_call('GET', current_url, **kwargs)
             response.raise_for_status()
-
-            data = response.json()
-            if isinstance(data, list):
-                results.extend(data)
-            else:
-                results.append(data)
+            self.metrics.inc('meraki_pages_total', endpoint=endpoint)
+            stats = call_stats()
+            if stats is not None:
+                stats.add(pages=1)
 
             current_url = self._parse_next_link(
                 response.headers.get('Link')
             )
+            data = response.json()
+            del response
+            yield data if isinstance(data, list) else [data]
+
+    def _with_per_page(self, url: str) -> str:
+        """*url* asking for the endpoint's largest page, if it is known."""
+        per_page = _PER_PAGE_MAX.get(self._path_template(url))
+        if per_page is None or 'perPage=' in url:
+            return url
+        return f"{url}{'&' if '?' in url else '?'}perPage={per_page}"
+
+    def _transform_pages(
+        self,
+        api_class: type,
+        url: str,
+        context: dict
+    ) -> List[dict]:
+        """
+        Transform a paginated listing page by page.
+
+        Raw items are dropped once transformed, so only the User Model
+        list is kept whole (or nothing, when spooling).
+        """
+        def _transform(page):
+            with timed('transform_seconds'):
+                return api_class.to_ansible_many(page, context)
+
+        return self._collect(self._iter_pages(url), _transform)
+
+    @staticmethod
+    def _collect(
+        pages: Iterable[List[dict]],
+        convert: Optional[Callable[[List[dict]], List[dict]]] = None
+    ) -> List[dict]:
+        """
+        Gather *pages* into one list, or into the current spool.
+
+        Args:
+            pages: Lists of items, e.g. from ``_iter_pages``
+            convert: Applied to each page (transform or filter)
 
+        Returns:
+            All converted items, or an empty list when a ``spooling()``
+            block is active and the items went to its file instead
+        """
+        spool = current_spool()
+        results = []
+        for page in pages:
+            if convert is not None:
+                page = convert(page)
+            if spool is not None:
+                spool.write(page)
+            else:
+                results.extend(page)
         return results
 
     @staticmethod
@@ -198,11 +736,16 @@ class PlatformService:
         Execute a generic operation on any resource.
 
         This is the main entry point called by action plugins via RPC.
+        Metrics recorded during the call are labelled with
+        *module_name* and *operation*.
 
         Args:
-            operation: Operation type ('create', 'update', 'replace', 'delete', 'find')
+            operation: Operation type ('create', 'update', 'replace',
+                'delete', 'find', or 'find_org' for device-scoped modules
+                listed in ``_ORG_LISTINGS``)
             module_name: Module name (e.g., 'vlan', 'ssid')
             user_data_dict: User Model dataclass as dict
+                (``{'organization_id': ...}`` for 'find_org')
 
         Returns:
             Result as dict (User Model format)
@@ -210,11 +753,39 @@ class PlatformService:
         Raises:
             ValueError: If operation is unknown or execution fails
         """
+        with self._executing_lock:
+            self._executing += 1
+        start = time.monotonic()
+        outcome = 'error'
+        with labelled(module=module_name, operation=operation):
+            try:
+                result = self._execute(operation, module_name, user_data_dict)
+                outcome = 'ok'
+                return result
+            finally:
+                with self._executing_lock:
+                    self._executing -= 1
+                self.metrics.inc('meraki_operations_total', outcome=outcome)
+                self.metrics.observe(
+                    'meraki_operation_duration_seconds',
+                    time.monotonic() - start,
+                )
+
+    def _execute(
+        self,
+        operation: str,
+        module_name: str,
+        user_data_dict: dict
+    ) -> dict:
+        """Run one operation; ``execute`` adds metrics around it."""
         thread_id = threading.get_ident()
         logger.info(
             f"Executing {operation} on {module_name} [Thread: {thread_id}]"
         )
 
+        if operation == 'find_org':
+            return self._find_org(module_name, user_data_dict)
+
         if module_name == 'facts' and operation == 'find':
             result = self._gather_facts(user_data_dict)
             logger.info(
@@ -232,7 +803,6 @@ class PlatformService:
 
         context = {
             'manager': self,
-            'session': self.session,
             'cache': self.cache,
             'api_version': self.api_version,
             'base_url': self.base_url
@@ -272,61 +842,290 @@ class PlatformService:
             )
             raise
 
+    def execute_many(
+        self,
+        operations: list,
+        stop_on_error: bool = True
+    ) -> list:
+        """
+        Execute a task's whole list of operations in one RPC call.
+
+        Called by action plugins instead of one ``execute()`` round-trip
+        per item.  Seeing the full list lets the manager schedule it:
+
+        - identical ``find`` operations are executed once;
+        - consecutive ``find`` operations run concurrently (they are
+          read-only and independent);
+        - mutations run one at a time, in the given order, since later
+          ones may depend on earlier ones (e.g. delete before create).
+
+        Args:
+            operations: Ordered list of ``(operation, module_name,
+                user_data_dict)`` tuples
+            stop_on_error: Skip the mutations that follow a failed one
+
+        Returns:
+            One dict per operation, in order: ``{'result': ...}`` on
+            success, ``{'error': message, 'error_type': name}`` on
+            failure, or ``{'skipped': True}`` if not attempted
+        """
+        outcomes: List[Optional[dict]] = [None] * len(operations)
+        failed = False
+        i = 0
+        while i < len(operations):
+            if failed and stop_on_error:
+                outcomes[i] = {'skipped': True}
+                i += 1
+                continue
+
+            if operations[i][0] != 'find':
+                outcomes[i] = self._execute_outcome(*operations[i])
+                failed = failed or 'error' in outcomes[i]
+                i += 1
+                continue
+
+            # Run of consecutive finds: dedupe, then fan out
+            j = i
+            while j < len(operations) and operations[j][0] == 'find':
+                j += 1
+            unique: Dict[str, tuple] = {}
+            keys = []
+            for op in operations[i:j]:
+                key = repr((op[1], sorted(op[2].items())))
+                unique.setdefault(key, op)
+                keys.append(key)
+            results = dict(zip(unique, self._map_concurrent(
+                lambda op: self._execute_outcome(*op), list(unique.values())
+            )))
+            for k, key in enumerate(keys):
+                outcomes[i + k] = results[key]
+            i = j
+
+        return outcomes
+
+    def execute_scoped(self, groups: list, scope_param: str) -> list:
+        """
+        Execute one task's operations for several scopes in one RPC call.
+
+        Used when a task targets a list of networks, organizations or
+        devices (``scopes``).  Each group holds the operations of one
+        scope and is run like ``execute_many``; the groups run
+        concurrently, their requests paced by the per-org rate limiter
+        like any others.
+
+        The operations of every scope carry the same desired config, so
+        the User Model to API transform is done once per distinct item
+        and reused for the other scopes.  The scope parameter is never
+        part of the API data (it only fills the request path).
+
+        Args:
+            groups: One ordered list of ``(operation, module_name,
+                user_data_dict)`` tuples per scope
+            scope_param: User Model field holding the scope
+                (e.g. ``network_id``)
+
+        Returns:
+            One list of outcome dicts per group (see ``execute_many``);
+            a failure stops only the rest of its own group
+        """
+        token = _shared_transforms.set((scope_param, {}))
+        try:
+            return self._map_concurrent(self.execute_many, groups)
+        finally:
+            _shared_transforms.reset(token)
+
+    @staticmethod
+    def _to_api(user_data: Any, context: dict) -> Any:
+        """Transform *user_data* to API data, shared within execute_scoped."""
+        shared = _shared_transforms.get()
+        if shared is None or not is_dataclass(user_data):
+            return user_data.to_api(context)
+        scope_param, transformed = shared
+        key = (type(user_data), repr(sorted(
+            (k, v) for k, v in asdict(user_data).items() if k != scope_param
+        )))
+        api_data = transformed.get(key)
+        if api_data is None:
+            api_data = transformed.setdefault(key, user_data.to_api(context))
+        return api_data
+
+    def _execute_outcome(
+        self,
+        operation: str,
+        module_name: str,
+        user_data_dict: dict
+    ) -> dict:
+        """Run ``execute()`` and capture its result or error as a dict."""
+        try:
+            return {'result': self.execute(operation, module_name, user_data_dict)}
+        except Exception as e:
+            return {
+                'error': str(e) or type(e).__name__,
+                'error_type': type(e).__name__,
+            }
+
+    def gather_to_file(
+        self,
+        module_name: str,
+        queries: list,
+        path: str,
+        fields: Optional[list] = None
+    ) -> dict:
+        """
+        Run ``find`` for each query and write the items to a JSONL file.
+
+        Backs ``gathered_dest``.  Paginated listings are written page by
+        page as they arrive; other results once returned.  ``facts``
+        writes the items of every subset gathered.
+
+        Args:
+            module_name: Module name (e.g., 'admin', 'facts')
+            queries: ``user_data_dict`` per find, in order
+            path: Destination file; gzip compressed if it ends in ``.gz``
+            fields: Keys to keep from each item (the documented config
+                suboptions); None keeps all
+
+        Returns:
+            Dict with ``path``, ``count`` and ``checksum`` (SHA-256 of
+            the file)
+        """
+        with Spool(path, fields) as spool, spooling(spool):
+            for query in queries:
+                result = self.execute('find', module_name, query)
+                if module_name == 'facts':
+                    continue
+                if isinstance(result, dict) and 'config' in result:
+                    spool.write(result['config'])
+                elif result:
+                    spool.write([result])
+        logger.info(
+            f"Gathered {spool.count} {module_name} items to {path}"
+        )
+        return spool.summary()
+
     def _gather_facts(self, user_data_dict: dict) -> dict:
         """
-        Gather facts about organizations, networks, devices, and inventory.
+        Gather facts about organizations, networks, devices and more.
 
         Called when module_name == 'facts' and operation == 'find'.
-        Makes direct API calls based on gather_subset.
+        The subsets in gather_subset (see ``_FACT_SUBSETS``) are listed
+        concurrently; their requests share the org's rate limit as
+        usual.  Subsets scoped to an organization are skipped without
+        organization_id.
 
         Args:
             user_data_dict: Dict with gather_subset, organization_id, network_id
 
         Returns:
-            Dict with organizations, networks, devices, inventory lists
+            Dict of subset name -> list of items
         """
         gather_subset = set(user_data_dict.get('gather_subset', ['all']))
         org_id = user_data_dict.get('organization_id')
         network_id = user_data_dict.get('network_id')
 
-        result = {}
+        subsets = [
+            name for name, (path, _, in_all) in _FACT_SUBSETS.items()
+            if (name in gather_subset or (in_all and 'all' in gather_subset))
+            and (org_id or '{organizationId}' not in path)
+        ]
+        gathered = self._map_concurrent(
+            lambda name: self._gather_subset(name, org_id, network_id),
+            subsets,
+        )
+        return dict(zip(subsets, gathered))
 
-        if 'all' in gather_subset or 'organizations' in gather_subset:
-            orgs = self._paginated_get(f'{self.base_url}/organizations')
-            result['organizations'] = orgs
+    def _gather_subset(
+        self,
+        name: str,
+        org_id: Optional[str],
+        network_id: Optional[str]
+    ) -> List[dict]:
+        """
+        List one facts subset, narrowed to *network_id* if given.
 
-        if org_id:
-            if 'all' in gather_subset or 'networks' in gather_subset:
-                nets = self._paginated_get(
-                    f'{self.base_url}/organizations/{org_id}/networks'
-                )
-                if network_id:
-                    nets = [n for n in nets if n.get('id') == network_id]
-                result['networks'] = nets
+        The Dashboard filters org-wide device listings itself
+        (``networkIds[]``), so only the network's items are transferred;
+        they are still checked locally.  A single network is fetched
+        directly rather than picked out of the org's networks.
+        """
+        path, network_key, _ = _FACT_SUBSETS[name]
+        url = f"{self.base_url}{path.format(organizationId=org_id)}"
+        if network_id and name == 'networks':
+            url = f'{self.base_url}/networks/{network_id}'
+        elif network_id and network_key == 'networkId':
+            url = f"{url}?{urlencode({'networkIds[]': network_id})}"
+
+        def _convert(page):
+            if name == 'networks':
+                self._remember_network_orgs(org_id, page)
+            if not network_id or network_key is None:
+                return page
+            return [item for item in page if item.get(network_key) == network_id]
+
+        return self._collect(self._iter_pages(url), _convert)
+
+    def _find_org(self, module_name: str, user_data_dict: dict) -> dict:
+        """
+        Find a device-scoped resource on every device of an organization.
 
-            if 'all' in gather_subset or 'devices' in gather_subset:
-                devs = self._paginated_get(
-                    f'{self.base_url}/organizations/{org_id}/devices'
-                )
-                if network_id:
-                    devs = [d for d in devs if d.get('networkId') == network_id]
-                result['devices'] = devs
+        Pages through the module's organization-wide listing once
+        (see ``_ORG_LISTINGS``).  Each device's items are stored in
+        ``device_index`` under its per-device listing path, so later
+        per-device finds are answered without a request, and are
+        transformed like a per-device find with the device's serial
+        added.
 
-            if 'all' in gather_subset or 'inventory' in gather_subset:
-                inv = self._paginated_get(
-                    f'{self.base_url}/organizations/{org_id}/inventory/devices'
-                )
-                result['inventory'] = inv
+        Args:
+            module_name: Module name (e.g., 'switch_port')
+            user_data_dict: Dict with organization_id
 
-        return result
+        Returns:
+            Dict with ``config``: User Model dicts for every device
+        """
+        listing = _ORG_LISTINGS.get(module_name)
+        if listing is None:
+            raise ValueError(
+                f"No organization-wide listing for module '{module_name}'"
+            )
+        org_path, device_path, items_key, id_key = listing
+        org_id = user_data_dict.get('organization_id')
+        if not org_id:
+            raise ValueError("find_org requires organization_id")
 
-    @staticmethod
-    def _safe_construct(cls: type, data: dict) -> Any:
-        """Construct a dataclass filtering out unknown keys."""
-        if is_dataclass(cls):
-            valid = {f.name for f in fields(cls)}
-            data = {k: v for k, v in data.items() if k in valid}
-        return cls(**data)
+        UserClass, APIClass, _ = self.loader.load_classes_for_module(
+            module_name, self.api_version,
+        )
+        context = {
+            'manager': self,
+            'cache': self.cache,
+            'api_version': self.api_version,
+            'base_url': self.base_url
+        }
+        scope = UserClass.SCOPE_PARAM
+
+        def _convert(page):
+            found = []
+            for device in page:
+                serial = device.get('serial')
+                items = device.get(items_key) or []
+                self.device_index.put(
+                    f"{self.base_url}{device_path.format(serial=serial)}",
+                    items, id_key,
+                )
+                with timed('transform_seconds'):
+                    found.extend(
+                        {**item, scope: serial}
+                        for item in APIClass.to_ansible_many(items, context)
+                    )
+            return found
+
+        # Not cached: writes go to per-device paths, which do not
+        # invalidate the org-wide listing, and a stale page would be
+        # re-indexed for every device on it.
+        url = f"{self.base_url}{org_path.format(organizationId=org_id)}"
+        with labelled(endpoint=org_path):
+            pages = self._iter_pages(url, use_cache=False)
+            return {'config': self._collect(pages, _convert)}
 
     def _create_resource(
         self,
@@ -336,16 +1135,16 @@ class PlatformService:
         context: dict
     ) -> dict:
         """Create resource with transformation."""
-        api_data = user_data.to_api(context)
-        operations = self._get_endpoint_operations(mixin_class, 'create')
+        with timed('transform_seconds'):
+            api_data = self._to_api(user_data, context)
+        operations = self.loader.load_operation_plan(mixin_class, 'create')
         api_result = self._execute_operations(
             operations, api_data, context, user_data
         )
 
         if api_result:
-            api_result_instance = self._safe_construct(api_class, api_result)
-            user_result = api_result_instance.to_ansible(context)
-            return asdict(user_result)
+            with timed('transform_seconds'):
+                return api_class.to_ansible_many([api_result], context)[0]
 
         return {}
 
@@ -357,16 +1156,16 @@ class PlatformService:
         context: dict
     ) -> dict:
         """Update resource with transformation."""
-        api_data = user_data.to_api(context)
-        operations = self._get_endpoint_operations(mixin_class, 'update')
+        with timed('transform_seconds'):
+            api_data = self._to_api(user_data, context)
+        operations = self.loader.load_operation_plan(mixin_class, 'update')
         api_result = self._execute_operations(
             operations, api_data, context, user_data
         )
 
         if api_result:
-            api_result_instance = self._safe_construct(api_class, api_result)
-            user_result = api_result_instance.to_ansible(context)
-            return asdict(user_result)
+            with timed('transform_seconds'):
+                return api_class.to_ansible_many([api_result], context)[0]
 
         return {}
 
@@ -377,8 +1176,9 @@ class PlatformService:
         context: dict
     ) -> dict:
         """Delete resource."""
-        api_data = user_data.to_api(context)
-        operations = self._get_endpoint_operations(mixin_class, 'delete')
+        with timed('transform_seconds'):
+            api_data = self._to_api(user_data, context)
+        operations = self.loader.load_operation_plan(mixin_class, 'delete')
         self._execute_operations(
             operations, api_data, context, user_data
         )
@@ -392,110 +1192,112 @@ class PlatformService:
         context: dict
     ) -> dict:
         """Find/get resource with transformation."""
-        api_data = user_data.to_api(context)
+        with timed('transform_seconds'):
+            api_data = self._to_api(user_data, context)
         api_data_dict = asdict(api_data) if is_dataclass(api_data) else api_data
         user_data_dict = asdict(user_data) if is_dataclass(user_data) else user_data
 
-        operations = self._get_endpoint_operations(mixin_class, 'find')
-        sorted_ops = self._sort_operations(operations)
-
-        results = {}
-        for op_name in sorted_ops:
-            endpoint_op = operations[op_name]
-            path = endpoint_op.path
-            skip_op = False
-            if endpoint_op.path_params:
-                for param in endpoint_op.path_params:
-                    val = self._resolve_path_param(
-                        param, endpoint_op, api_data_dict,
-                        user_data_dict, results
-                    )
-                    if val is not None:
-                        path = path.replace(f'{{{param}}}', str(val))
-                    else:
-                        skip_op = True
-                        break
+        operations = self.loader.load_operation_plan(mixin_class, 'find')
+        plan = self._plan_find(operations, api_data_dict, user_data_dict)
 
-            if skip_op or '{' in path:
-                logger.debug(f"Skipping {op_name} - missing path params")
-                continue
+        names = [endpoint_op.name for endpoint_op, _ in plan]
+        planned_main = next(
+            (name for name in ('find', 'main') if name in names),
+            names[0] if names else None,
+        )
 
+        results = {}
+        streamed = set()
+        for endpoint_op, path in plan:
+            op_name = endpoint_op.name
             url = f"{self.base_url}{path}"
             logger.debug(f"Calling {endpoint_op.method} {url}")
 
-            if endpoint_op.method == 'GET' and not endpoint_op.path_params:
-                result_data = self._paginated_get(url)
-            else:
-                response = self._api_call(endpoint_op.method, url)
-                if response.status_code == 404:
-                    logger.debug(f"Resource not found (404) for {op_name}")
-                    continue
-                response.raise_for_status()
-                result_data = response.json()
+            with labelled(endpoint=endpoint_op.op.path):
+                paginated = endpoint_op.method == 'GET' and (
+                    not endpoint_op.param_sources
+                    or endpoint_op.op.path in _PER_PAGE_MAX
+                )
+                if paginated and op_name == planned_main:
+                    # Transformed as pages arrive; raw items are not kept
+                    result_data = self._transform_pages(api_class, url, context)
+                    streamed.add(op_name)
+                elif paginated:
+                    result_data = self._paginated_get(url)
+                else:
+                    response = self._api_call(endpoint_op.method, url)
+                    if response.status_code == 404:
+                        logger.debug(f"Resource not found (404) for {op_name}")
+                        continue
+                    response.raise_for_status()
+                    result_data = response.json()
 
             results[op_name] = result_data
 
-        main_result = results.get('find')
-        if main_result is None:
-            main_result = results.get('main')
-        if main_result is None and results:
-            main_result = list(results.values())[0]
-
-        if isinstance(main_result, list):
-            user_results = []
-            for item in main_result:
-                api_inst = self._safe_construct(api_class, item)
-                user_inst = api_inst.to_ansible(context)
-                user_results.append(asdict(user_inst))
-            return {'config': user_results}
-        elif main_result:
-            api_result_instance = self._safe_construct(api_class, main_result)
-            user_result = api_result_instance.to_ansible(context)
-            return asdict(user_result)
+        main_name = next(
+            (name for name in ('find', 'main') if results.get(name) is not None),
+            next(iter(results), None),
+        )
+        main_result = results.get(main_name)
+        if main_name in streamed:
+            return {'config': main_result}
+
+        with timed('transform_seconds'):
+            if isinstance(main_result, list):
+                return {'config': api_class.to_ansible_many(main_result, context)}
+            elif main_result:
+                return api_class.to_ansible_many([main_result], context)[0]
 
         return {'config': []}
 
-    def _resolve_path_param(
+    def _plan_find(
         self,
-        param: str,
-        endpoint_op: EndpointOperation,
+        operations: OperationPlan,
         api_data_dict: dict,
-        user_data_dict: dict,
-        results: dict
-    ) -> Optional[Any]:
-        """Resolve a path parameter value, including aliases for snake_case."""
-        if param in results:
-            r = results[param]
-            return r.get('id', r) if isinstance(r, dict) else r
-        val = api_data_dict.get(param) or user_data_dict.get(param)
-        if val is not None:
-            return val
-        aliases = (endpoint_op.path_param_aliases or {}).get(param, [])
-        for alt in aliases:
-            val = api_data_dict.get(alt) or user_data_dict.get(alt)
-            if val is not None:
-                return val
-        return None
-
-    def _get_endpoint_operations(
-        self,
-        mixin_class: type,
-        required_for: str
-    ) -> Dict[str, EndpointOperation]:
-        """Get endpoint operations from mixin, filtered by operation type."""
-        if hasattr(mixin_class, 'get_endpoint_operations'):
-            all_ops = mixin_class.get_endpoint_operations()
-        else:
-            return {}
+        user_data_dict: dict
+    ) -> List[tuple]:
+        """
+        Choose the endpoint calls needed to answer one find.
 
-        return {
-            name: op for name, op in all_ops.items()
-            if op.required_for is None or op.required_for == required_for
-        }
+        Only one result is ever used: ``find``, else ``main``, else the
+        first op to run.  So only that op is called, among the ops whose
+        path parameters can be resolved.  When the caller supplied the
+        key, the item GET wins and the collection listing is skipped.
+        Otherwise the item op is unresolvable and the collection GET is
+        used.
+
+        Args:
+            operations: Compiled find plan of the module
+            api_data_dict: API-format request data
+            user_data_dict: User-format request data
+
+        Returns:
+            List of ``(CompiledOperation, resolved_path)`` to call, in order
+        """
+        resolved = {}
+        for compiled in operations:
+            path = compiled.resolve_path(api_data_dict, user_data_dict, {})
+            if path is not None:
+                resolved[compiled.name] = (compiled, path)
+
+        chosen = next(
+            (name for name in ('find', 'main') if name in resolved),
+            next(iter(resolved), None),
+        )
+        skipped = sorted(name for name in operations.names() if name != chosen)
+        if chosen is None:
+            logger.debug(f"Find plan: no resolvable op; skipped {skipped}")
+            return []
+        compiled, path = resolved[chosen]
+        logger.debug(
+            f"Find plan: {chosen} ({compiled.method} {path}); "
+            f"skipped {skipped}"
+        )
+        return [resolved[chosen]]
 
     def _execute_operations(
         self,
-        operations: Dict[str, EndpointOperation],
+        operations: OperationPlan,
         api_data: Any,
         context: dict,
         user_data: Any
@@ -504,41 +1306,48 @@ class PlatformService:
         if not operations:
             return {}
 
-        sorted_ops = self._sort_operations(operations)
         api_data_dict = asdict(api_data) if is_dataclass(api_data) else api_data
         user_data_dict = asdict(user_data) if is_dataclass(user_data) else user_data
 
         results = {}
-        for op_name in sorted_ops:
-            endpoint_op = operations[op_name]
-
-            request_data = {}
-            for field_name in endpoint_op.fields:
-                if field_name in api_data_dict and api_data_dict[field_name] is not None:
-                    request_data[field_name] = api_data_dict[field_name]
-                elif field_name in user_data_dict and user_data_dict[field_name] is not None:
-                    request_data[field_name] = user_data_dict[field_name]
-
-            path = endpoint_op.path
-            skip_op = False
-            if endpoint_op.path_params:
-                for param in endpoint_op.path_params:
-                    val = self._resolve_path_param(
-                        param, endpoint_op, api_data_dict,
-                        user_data_dict, results
+        for wave in operations.waves:
+            calls = []
+            for endpoint_op in wave:
+                request = self._build_request(
+                    endpoint_op, api_data_dict, user_data_dict, results
+                )
+                if request is None:
+                    logger.debug(
+                        f"Skipping {endpoint_op.name} - missing path params"
                     )
-                    if val is not None:
-                        path = path.replace(f'{{{param}}}', str(val))
-                    else:
-                        skip_op = True
-                        break
+                    continue
+                calls.append((endpoint_op, *request))
 
-            if skip_op or '{' in path:
-                logger.debug(f"Skipping {op_name} - missing path params")
-                continue
+            wave_results = self._map_concurrent(
+                lambda call: self._call_operation(*call), calls
+            )
+            for (endpoint_op, _, _), result_data in zip(calls, wave_results):
+                results[endpoint_op.name] = result_data
+                if isinstance(result_data, dict) and 'id' in result_data:
+                    results['id'] = result_data['id']
 
-            url = f"{self.base_url}{path}"
+        return (
+            results.get('create')
+            or results.get('update')
+            or results.get('main')
+            or {}
+        )
 
+    def _call_operation(
+        self,
+        endpoint_op: CompiledOperation,
+        path: str,
+        request_data: dict
+    ) -> Any:
+        """Call one resolved mutating endpoint and return its JSON body."""
+        url = f"{self.base_url}{path}"
+
+        with labelled(endpoint=endpoint_op.op.path):
             if endpoint_op.method == 'DELETE':
                 response = self._api_call(endpoint_op.method, url)
             else:
@@ -548,49 +1357,160 @@ class PlatformService:
                     json=request_data if request_data else None
                 )
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            try:
-                result_data = response.json()
-            except ValueError:
-                result_data = {}
+        try:
+            return response.json()
+        except ValueError:
+            return {}
 
-            results[op_name] = result_data
-            if isinstance(result_data, dict) and 'id' in result_data:
-                results['id'] = result_data['id']
+    def _map_concurrent(self, func: Callable, items: list) -> list:
+        """
+        Apply *func* to *items* concurrently, returning results in order.
+
+        Used for independent API calls.  Concurrency is capped at the
+        session pool size; every call still goes through ``_api_call``,
+        so rate limiting and connection limits apply as usual.  A single
+        item runs inline.  If any call raises, the first exception (in
+        item order) is re-raised after all calls have finished.  Each call
+        runs in a copy of the caller's context, so metric labels carry over.
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
 
-        return (
-            results.get('create')
-            or results.get('update')
-            or results.get('main')
-            or {}
-        )
+        workers = min(len(items), self.sessions.max_connections)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(copy_context().run, func, item) for item in items
+            ]
+        return [f.result() for f in futures]
 
-    def _sort_operations(
+    def _build_request(
         self,
-        operations: Dict[str, EndpointOperation]
-    ) -> List[str]:
-        """Sort operations by dependencies and order."""
-        sorted_ops: List[str] = []
-        remaining = dict(operations)
-
-        while remaining:
-            ready = [
-                name for name, op in remaining.items()
-                if op.depends_on is None or op.depends_on in sorted_ops
-            ]
+        endpoint_op: CompiledOperation,
+        api_data_dict: dict,
+        user_data_dict: dict,
+        results: dict
+    ) -> Optional[tuple]:
+        """
+        Resolve the path and body of one mutating endpoint operation.
 
-            if not ready:
-                raise ValueError(
-                    f"Circular dependency in operations: "
-                    f"{list(remaining.keys())}"
-                )
+        Returns:
+            ``(path, request_data)``, or None when a path parameter
+            cannot be resolved
+        """
+        path = endpoint_op.resolve_path(api_data_dict, user_data_dict, results)
+        if path is None:
+            return None
+        return path, endpoint_op.build_body(api_data_dict, user_data_dict)
+
+    def execute_batch(self, module_name: str, mutations: list) -> dict:
+        """
+        Apply several mutations of one module as Meraki action batches.
 
-            ready.sort(key=lambda name: remaining[name].order)
-            sorted_ops.append(ready[0])
-            remaining.pop(ready[0])
+        Called by action plugins (via RPC) instead of one ``execute()``
+        per resource.  Every endpoint operation involved must be
+        ``batch_eligible`` with fully resolvable path parameters, and all
+        resources must belong to one organization; otherwise the
+        mutations are executed one by one as before.
 
-        return sorted_ops
+        Args:
+            module_name: Module name (e.g., 'vlan')
+            mutations: Ordered list of ``(operation, user_data_dict)``
+                pairs; operation is 'create', 'update', 'replace' or
+                'delete'
+
+        Returns:
+            Summary dict with ``batched`` (bool), ``actions`` (int) and
+            ``batches`` (list of batch IDs)
+
+        Raises:
+            ActionBatchError: If a submitted batch fails
+        """
+        with labelled(module=module_name, operation='batch'):
+            return self._execute_batch(module_name, mutations)
+
+    def _execute_batch(self, module_name: str, mutations: list) -> dict:
+        """Plan and run ``execute_batch`` (see there)."""
+        UserClass, APIClass, MixinClass = self.loader.load_classes_for_module(
+            module_name,
+            self.api_version
+        )
+        context = {
+            'manager': self,
+            'cache': self.cache,
+            'api_version': self.api_version,
+            'base_url': self.base_url
+        }
+
+        actions = []
+        for operation, user_data_dict in mutations:
+            planned = self._plan_batch_actions(
+                operation, UserClass(**user_data_dict), MixinClass, context
+            )
+            if planned is None:
+                actions = None
+                break
+            actions.extend(planned)
+
+        org_ids = {
+            self._org_for_url(f"{self.base_url}{a['resource']}")
+            for a in actions or []
+        }
+        if not actions or len(org_ids) != 1 or None in org_ids:
+            logger.info(
+                f"{module_name}: mutations not batchable, executing "
+                f"{len(mutations)} individually"
+            )
+            for operation, user_data_dict in mutations:
+                self.execute(operation, module_name, user_data_dict)
+            return {'batched': False, 'actions': len(mutations), 'batches': []}
+
+        org_id = org_ids.pop()
+        runner = ActionBatchRunner(self._api_call, self.base_url)
+        try:
+            batches = runner.run(org_id, actions)
+        finally:
+            for action in actions:
+                self._invalidate(f"{self.base_url}{action['resource']}", org_id)
+        return {
+            'batched': True,
+            'actions': len(actions),
+            'batches': [b.get('id') for b in batches],
+        }
+
+    def _plan_batch_actions(
+        self,
+        operation: str,
+        user_data: Any,
+        mixin_class: type,
+        context: dict
+    ) -> Optional[List[dict]]:
+        """Translate one mutation into batch actions, or None if it can't be."""
+        required_for = 'update' if operation == 'replace' else operation
+        operations = self.loader.load_operation_plan(mixin_class, required_for)
+        if not operations:
+            return None
+
+        api_data = user_data.to_api(context)
+        api_data_dict = asdict(api_data) if is_dataclass(api_data) else api_data
+        user_data_dict = asdict(user_data) if is_dataclass(user_data) else user_data
+
+        actions = []
+        for endpoint_op in operations:
+            if not endpoint_op.op.batch_eligible:
+                return None
+            request = self._build_request(
+                endpoint_op, api_data_dict, user_data_dict, {}
+            )
+            if request is None:
+                return None
+            path, request_data = request
+            action = to_action(endpoint_op.method, path, request_data)
+            if action is None:
+                return None
+            actions.append(action)
+        return actions
 
     def lookup_org_ids(self, org_names: list) -> list:
         """
@@ -652,6 +1572,7 @@ class PlatformService:
             networks = self._paginated_get(
                 f'{self.base_url}/organizations/{org_id}/networks'
             )
+            self._remember_network_orgs(org_id, networks)
 
             for net in networks:
                 net_name = net.get('name', '')
@@ -669,6 +1590,35 @@ class PlatformService:
         return ids
 
 
+def init_manager_process(
+    service: PlatformService,
+    frame_path: str,
+    authkey: bytes,
+    metrics_path: Optional[str] = None,
+    metrics_interval: float = DEFAULT_TEXTFILE_INTERVAL
+) -> None:
+    """
+    Prepare the manager process before it starts serving.
+
+    Passed to ``PlatformManager.start()`` as its initializer.  It starts
+    the framed RPC server on *frame_path* and runs
+    ``PlatformService.warm_up`` on a daemon thread.  With *metrics_path*,
+    it also rewrites that Prometheus textfile every *metrics_interval*
+    seconds.  The initializer runs before the BaseManager listener is
+    bound and reported back through ``start()``'s pipe, so both sockets
+    are ready when ``start()`` returns.  Warm-up continues in the
+    background.
+    """
+    serve_frames(frame_path, service, authkey)
+    threading.Thread(
+        target=service.warm_up, name='warm-up', daemon=True,
+    ).start()
+    if metrics_path:
+        start_textfile_writer(
+            service.metrics, metrics_path, metrics_interval, service._gauges,
+        )
+
+
 class PlatformManager(ThreadingMixIn, BaseManager):
     """Custom Manager for sharing PlatformService across processes.
 
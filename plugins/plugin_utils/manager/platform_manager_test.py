@@ -0,0 +1,771 @@
+"""Colocated tests for PlatformService HTTP plumbing (no network access)."""
+
+import gzip
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from ..platform.operation_plan import OperationPlan
+from ..platform.types import EndpointOperation
+from . import platform_manager
+from .platform_manager import PlatformService
+
+
+class _FakeSession(requests.Session):
+    """Session answering from a {(method, path): (status, body)} table."""
+
+    routes: dict = {}
+    calls: list = []
+
+    def request(self, method, url, **kwargs):
+        path = urlparse(url).path[len('/api'):]
+        type(self).calls.append((method, path))
+        status, body = type(self).routes.get((method, path), (404, {}))
+        resp = requests.Response()
+        resp.status_code = status
+        resp._content = json.dumps(body).encode()
+        if status == 429:
+            resp.headers['Retry-After'] = '0'
+        return resp
+
+
+def _service(routes, **kwargs):
+    _FakeSession.routes = routes
+    _FakeSession.calls = []
+    return PlatformService(
+        'https://dash.example/api', 'key',
+        session_factory=_FakeSession, **kwargs,
+    )
+
+
+class TestOrgResolution:
+    """Requests are attributed to the organization that owns them."""
+
+    def test_organization_path(self):
+        svc = _service({})
+        assert svc._org_for_url(f'{svc.base_url}/organizations/O1/admins') == 'O1'
+        assert _FakeSession.calls == []
+
+    def test_unscoped_path(self):
+        svc = _service({})
+        assert svc._org_for_url(f'{svc.base_url}/organizations') is None
+
+    def test_network_path_resolved_once(self):
+        svc = _service({('GET', '/networks/N1'): (200, {'organizationId': 'O1'})})
+        url = f'{svc.base_url}/networks/N1/appliance/vlans'
+        assert svc._org_for_url(url) == 'O1'
+        assert svc._org_for_url(url) == 'O1'
+        assert _FakeSession.calls == [('GET', '/networks/N1')]
+
+    def test_device_path_via_network(self):
+        svc = _service({
+            ('GET', '/devices/Q2-AAA'): (200, {'networkId': 'N1'}),
+            ('GET', '/networks/N1'): (200, {'organizationId': 'O1'}),
+        })
+        assert svc._org_for_url(f'{svc.base_url}/devices/Q2-AAA/switch/ports') == 'O1'
+
+    def test_unknown_network_falls_back_to_shared_bucket(self):
+        svc = _service({})
+        assert svc._org_for_url(f'{svc.base_url}/networks/N404/vlans') is None
+        assert svc._org_for_url(f'{svc.base_url}/networks/N404/vlans') is None
+        assert len(_FakeSession.calls) == 1
+
+    def test_failed_lookup_retried_later(self):
+        svc = _service({('GET', '/networks/N1'): (429, {})})
+        url = f'{svc.base_url}/networks/N1/appliance/vlans'
+        assert svc._org_for_url(url) is None
+        assert svc._org_for_url(url) is None
+        assert len(_FakeSession.calls) == platform_manager._DEFAULT_MAX_RETRIES
+
+        # Once the retry delay has passed, the next request resolves it
+        svc._owner_failures['net_org:N1'] = 0.0
+        _FakeSession.routes[('GET', '/networks/N1')] = (200, {'organizationId': 'O1'})
+        assert svc._org_for_url(url) == 'O1'
+        assert svc.cache['net_org:N1'] == 'O1'
+
+    def test_org_network_listing_seeds_cache(self):
+        svc = _service({
+            ('GET', '/organizations/O1/networks'): (
+                200, [{'id': 'N1', 'name': 'lab'}],
+            ),
+        })
+        assert svc.lookup_network_ids('O1', ['lab']) == ['N1']
+        assert svc._org_for_url(f'{svc.base_url}/networks/N1/vlans') == 'O1'
+        assert _FakeSession.calls == [('GET', '/organizations/O1/networks')]
+
+    def test_rate_limit_disabled_skips_resolution(self):
+        svc = _service({('GET', '/networks/N1/vlans'): (200, [])}, rate_limit=0)
+        svc._api_call('GET', f'{svc.base_url}/networks/N1/vlans')
+        assert _FakeSession.calls == [('GET', '/networks/N1/vlans')]
+
+
+class TestRateLimitRetry:
+    """429 responses penalize the org bucket and are retried."""
+
+    def test_retries_after_429(self):
+        responses = iter([(429, {}), (200, {'ok': True})])
+
+        class _Flaky(_FakeSession):
+            def request(self, method, url, **kwargs):
+                _FakeSession.routes = {('GET', '/organizations/O1'): next(responses)}
+                return super().request(method, url, **kwargs)
+
+        svc = PlatformService('https://dash.example/api', 'key', session_factory=_Flaky)
+        resp = svc._api_call('GET', f'{svc.base_url}/organizations/O1')
+        assert resp.status_code == 200
+
+
+class TestResponseCaching:
+    """GETs are served from the response cache until a write invalidates."""
+
+    def test_repeated_get_hits_cache(self):
+        svc = _service({
+            ('GET', '/organizations/O1/admins'): (200, [{'id': 'a'}]),
+        })
+        url = f'{svc.base_url}/organizations/O1/admins'
+        assert svc._api_call('GET', url).json() == [{'id': 'a'}]
+        assert svc._api_call('GET', url).json() == [{'id': 'a'}]
+        assert _FakeSession.calls == [('GET', '/organizations/O1/admins')]
+        assert svc.cache_stats()['hits'] == 1
+
+    def test_write_invalidates_collection(self):
+        svc = _service({
+            ('GET', '/organizations/O1/admins'): (200, []),
+            ('PUT', '/organizations/O1/admins/a'): (200, {}),
+        })
+        url = f'{svc.base_url}/organizations/O1/admins'
+        svc._api_call('GET', url)
+        svc._api_call('PUT', f'{url}/a', json={})
+        svc._api_call('GET', url)
+        assert [c for c in _FakeSession.calls if c[0] == 'GET'] == [
+            ('GET', '/organizations/O1/admins'),
+        ] * 2
+
+    def test_device_write_invalidates_org_listings(self):
+        for rate_limit in (0, 10):
+            svc = _service({
+                ('GET', '/devices/Q1'): (200, {'networkId': 'N1'}),
+                ('GET', '/networks/N1'): (200, {'organizationId': 'O1'}),
+                ('GET', '/organizations/O1/devices'): (
+                    200, [{'serial': 'Q1', 'name': 'old'}],
+                ),
+                ('PUT', '/devices/Q1'): (200, {'serial': 'Q1', 'name': 'new'}),
+            }, rate_limit=rate_limit)
+            facts = {'gather_subset': ['devices'], 'organization_id': 'O1'}
+            svc.execute('find', 'facts', facts)
+            svc.execute('update', 'device', {'serial': 'Q1', 'name': 'new'})
+            _FakeSession.routes[('GET', '/organizations/O1/devices')] = (
+                200, [{'serial': 'Q1', 'name': 'new'}],
+            )
+            devices = svc.execute('find', 'facts', facts)['devices']
+            assert [d['name'] for d in devices] == ['new']
+
+    def test_get_in_flight_during_write_not_cached(self):
+        url = 'https://dash.example/api/organizations/O1/admins'
+
+        class _Racing(_FakeSession):
+            # The write completes while the first GET is on the wire
+            def request(self, method, url_, **kwargs):
+                response = super().request(method, url_, **kwargs)
+                if method == 'GET' and len(type(self).calls) == 1:
+                    svc._api_call('PUT', f'{url}/a', json={})
+                return response
+
+        _FakeSession.routes = {
+            ('GET', '/organizations/O1/admins'): (200, []),
+            ('PUT', '/organizations/O1/admins/a'): (200, {}),
+        }
+        _FakeSession.calls = []
+        svc = PlatformService(
+            'https://dash.example/api', 'key', session_factory=_Racing,
+        )
+        svc._api_call('GET', url)
+        svc._api_call('GET', url)
+        assert [c for c in _FakeSession.calls if c[0] == 'GET'] == [
+            ('GET', '/organizations/O1/admins'),
+        ] * 2
+
+    def test_use_cache_false_bypasses(self):
+        svc = _service({('GET', '/organizations/O1'): (200, {})})
+        url = f'{svc.base_url}/organizations/O1'
+        svc._api_call('GET', url)
+        svc._api_call('GET', url, use_cache=False)
+        assert len(_FakeSession.calls) == 2
+
+
+class TestFindPlan:
+    """Only the single find op whose result is used gets called."""
+
+    OPS = OperationPlan('find', {
+        'find_all': EndpointOperation(
+            path='/networks/{networkId}/appliance/vlans', method='GET',
+            fields=[], path_params=['networkId'], order=1,
+        ),
+        'find': EndpointOperation(
+            path='/networks/{networkId}/appliance/vlans/{vlanId}',
+            method='GET', fields=[], path_params=['networkId', 'vlanId'],
+            path_param_aliases={'vlanId': ['vlan_id']}, order=2,
+        ),
+    })
+
+    def test_keyed_lookup_skips_listing(self):
+        svc = _service({})
+        plan = svc._plan_find(self.OPS, {'networkId': 'N1'}, {'vlan_id': 10})
+        assert [(op.name, path) for op, path in plan] == [
+            ('find', '/networks/N1/appliance/vlans/10'),
+        ]
+
+    def test_unkeyed_lookup_lists(self):
+        svc = _service({})
+        plan = svc._plan_find(self.OPS, {'networkId': 'N1'}, {})
+        assert [(op.name, path) for op, path in plan] == [
+            ('find_all', '/networks/N1/appliance/vlans'),
+        ]
+
+    def test_unresolvable(self):
+        assert _service({})._plan_find(self.OPS, {}, {}) == []
+
+
+class TestConcurrentOperations:
+    """Ops in one wave are in flight at the same time."""
+
+    def test_wave_runs_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _BarrierSession(_FakeSession):
+            def request(self, method, url, **kwargs):
+                barrier.wait()
+                return super().request(method, url, **kwargs)
+
+        svc = PlatformService(
+            'https://dash.example/api', 'key',
+            session_factory=_BarrierSession, max_connections=4, rate_limit=0,
+        )
+        _FakeSession.routes = {
+            ('PUT', '/networks/N1/l3'): (200, {'rules': ['l3']}),
+            ('PUT', '/networks/N1/l7'): (200, {'rules': ['l7']}),
+        }
+        _FakeSession.calls = []
+        plan = OperationPlan('update', {
+            'main': EndpointOperation(
+                path='/networks/{networkId}/l3', method='PUT',
+                fields=['rules'], path_params=['networkId'],
+            ),
+            'l7': EndpointOperation(
+                path='/networks/{networkId}/l7', method='PUT',
+                fields=['rules'], path_params=['networkId'],
+            ),
+        })
+        result = svc._execute_operations(
+            plan, {'networkId': 'N1', 'rules': []}, {}, {},
+        )
+        assert result == {'rules': ['l3']}
+        assert sorted(_FakeSession.calls) == [
+            ('PUT', '/networks/N1/l3'), ('PUT', '/networks/N1/l7'),
+        ]
+
+
+class TestExecuteMany:
+    """execute_many returns per-item outcomes in order."""
+
+    def _svc(self, fail_on=()):
+        svc = _service({})
+        svc.calls = []
+
+        def execute(operation, module_name, data):
+            svc.calls.append((operation, data.get('name')))
+            if data.get('name') in fail_on:
+                raise ValueError(f"bad {data['name']}")
+            return {'name': data.get('name'), 'op': operation}
+
+        svc.execute = execute
+        return svc
+
+    def test_results_in_order(self):
+        svc = self._svc()
+        outcomes = svc.execute_many([
+            ('delete', 'vlan', {'name': 'a'}),
+            ('create', 'vlan', {'name': 'b'}),
+        ])
+        assert outcomes == [
+            {'result': {'name': 'a', 'op': 'delete'}},
+            {'result': {'name': 'b', 'op': 'create'}},
+        ]
+        assert svc.calls == [('delete', 'a'), ('create', 'b')]
+
+    def test_error_skips_later_mutations(self):
+        svc = self._svc(fail_on={'b'})
+        outcomes = svc.execute_many([
+            ('update', 'vlan', {'name': 'a'}),
+            ('update', 'vlan', {'name': 'b'}),
+            ('update', 'vlan', {'name': 'c'}),
+        ])
+        assert 'result' in outcomes[0]
+        assert outcomes[1] == {'error': 'bad b', 'error_type': 'ValueError'}
+        assert outcomes[2] == {'skipped': True}
+        assert ('update', 'c') not in svc.calls
+
+    def test_continue_on_error(self):
+        svc = self._svc(fail_on={'a'})
+        outcomes = svc.execute_many([
+            ('update', 'vlan', {'name': 'a'}),
+            ('update', 'vlan', {'name': 'b'}),
+        ], stop_on_error=False)
+        assert 'error' in outcomes[0] and 'result' in outcomes[1]
+
+    def test_duplicate_finds_executed_once(self):
+        svc = self._svc()
+        outcomes = svc.execute_many([
+            ('find', 'vlan', {'name': 'a'}),
+            ('find', 'vlan', {'name': 'b'}),
+            ('find', 'vlan', {'name': 'a'}),
+        ])
+        assert [o['result']['name'] for o in outcomes] == ['a', 'b', 'a']
+        assert sorted(svc.calls) == [('find', 'a'), ('find', 'b')]
+
+
+class TestWarmUp:
+    """warm_up preloads every module and opens one connection."""
+
+    def test_preloads_modules_and_connection(self):
+        svc = _service({})
+        summary = svc.warm_up()
+
+        assert summary['failed'] == 0
+        assert summary['loaded'] == len(svc.loader._class_cache) > 0
+        assert _FakeSession.calls == [('HEAD', '')]
+        assert svc.sessions.created == 1
+        # The connection check is not a Dashboard call
+        assert svc.cache_stats()['misses'] == 0
+
+
+def _counter(stats, name, **labels):
+    return sum(
+        c['value'] for c in stats['counters']
+        if c['name'] == name and labels.items() <= c['labels'].items()
+    )
+
+
+class TestMetrics:
+    """Requests are counted per module, operation and endpoint template."""
+
+    def test_find_labels_requests(self):
+        svc = _service({
+            ('GET', '/networks/N1'): (200, {'organizationId': 'O1'}),
+            ('GET', '/networks/N1/appliance/vlans'): (200, [{'id': '10'}]),
+        })
+        svc.execute('find', 'vlan', {'network_id': 'N1'})
+        svc.execute('find', 'vlan', {'network_id': 'N1'})
+        stats = svc.stats()
+
+        assert _counter(
+            stats, 'meraki_http_requests_total',
+            module='vlan', operation='find', method='GET', status='200',
+            endpoint='/networks/{networkId}/appliance/vlans',
+        ) == 1
+        # Org resolution is charged to the module too, under its own template
+        assert _counter(
+            stats, 'meraki_http_requests_total',
+            module='vlan', endpoint='/networks/{networkId}',
+        ) == 1
+        assert _counter(
+            stats, 'meraki_cache_lookups_total', module='vlan', result='hit',
+        ) == 1
+        assert _counter(
+            stats, 'meraki_operations_total', module='vlan', outcome='ok',
+        ) == 2
+        assert stats['gauges']['meraki_operations_in_flight'] == 0
+        assert stats['cache']['hits'] == 1
+
+    def test_pages_counted(self):
+        svc = _service({('GET', '/organizations'): (200, [{'id': 'O1'}])})
+        svc.execute('find', 'facts', {'gather_subset': ['organizations']})
+        assert _counter(
+            svc.stats(), 'meraki_pages_total',
+            module='facts', endpoint='/organizations',
+        ) == 1
+
+    def test_failed_operation_counted(self):
+        svc = _service({})
+        try:
+            svc.execute('explode', 'vlan', {'network_id': 'N1'})
+        except ValueError:
+            pass
+        assert _counter(
+            svc.stats(), 'meraki_operations_total',
+            module='vlan', operation='explode', outcome='error',
+        ) == 1
+
+    def test_429_counted(self):
+        responses = iter([(429, {}), (200, {})])
+
+        class _Flaky(_FakeSession):
+            def request(self, method, url, **kwargs):
+                _FakeSession.routes = {('GET', '/organizations/O1'): next(responses)}
+                return super().request(method, url, **kwargs)
+
+        svc = PlatformService(
+            'https://dash.example/api', 'key', session_factory=_Flaky,
+            rate_limit=0,
+        )
+        svc._api_call('GET', f'{svc.base_url}/organizations/O1')
+        stats = svc.stats()
+        assert _counter(stats, 'meraki_rate_limited_total') == 1
+        assert _counter(
+            stats, 'meraki_http_requests_total',
+            endpoint='/organizations/{organizationId}', status='429',
+        ) == 1
+
+
+class TestCallWithStats:
+    """call_with_stats returns the cost of one call with its result."""
+
+    def test_find_cost(self):
+        svc = _service({
+            ('GET', '/networks/N1'): (200, {'organizationId': 'O1'}),
+            ('GET', '/networks/N1/appliance/vlans'): (200, [{'id': '10'}]),
+        })
+        first = svc.call_with_stats('execute', ['find', 'vlan', {'network_id': 'N1'}])
+        second = svc.call_with_stats('execute', ['find', 'vlan', {'network_id': 'N1'}])
+
+        assert first['result'] == second['result']
+        assert first['stats']['http_calls'] == {'GET': 2}
+        assert first['stats']['bytes_received'] > 0
+        assert first['stats']['cache_hits'] == 0
+        assert first['stats']['manager_seconds'] >= first['stats']['transform_seconds'] > 0
+        # The second find is answered from the response cache
+        assert second['stats']['http_calls'] == {}
+        assert second['stats']['cache_hits'] == 1
+
+    def test_only_execute_methods(self):
+        with pytest.raises(ValueError, match='Cannot measure'):
+            _service({}).call_with_stats('stats', [])
+
+
+class _PagedSession(requests.Session):
+    """Session serving ``items`` for every GET, Link-paginated like Meraki."""
+
+    items: list = []
+    urls: list = []
+
+    def request(self, method, url, **kwargs):
+        type(self).urls.append(url)
+        query = parse_qs(urlparse(url).query)
+        per_page = int(query.get('perPage', ['2'])[0])
+        start = int(query.get('startingAfter', ['0'])[0])
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps(self.items[start:start + per_page]).encode()
+        if start + per_page < len(self.items):
+            base = url.split('?', 1)[0]
+            resp.headers['Link'] = (
+                f'<{base}?perPage={per_page}&startingAfter={start + per_page}>; '
+                'rel=next'
+            )
+        return resp
+
+
+def _paged_service(items):
+    _PagedSession.items = items
+    _PagedSession.urls = []
+    return PlatformService(
+        'https://dash.example/api', 'key',
+        session_factory=_PagedSession, rate_limit=0,
+    )
+
+
+class TestPagination:
+    """Listings are fetched one page at a time, in the largest pages allowed."""
+
+    def test_pages_fetched_on_demand(self):
+        svc = _paged_service([{'id': i} for i in range(5)])
+        pages = svc._iter_pages(f'{svc.base_url}/networks/N1/clients')
+        assert next(pages) == [{'id': 0}, {'id': 1}]
+        assert len(_PagedSession.urls) == 1
+        assert [len(page) for page in pages] == [2, 1]
+        assert len(_PagedSession.urls) == 3
+
+    def test_max_per_page_requested(self):
+        svc = _paged_service([{'id': i} for i in range(5)])
+        assert len(svc._paginated_get(
+            f'{svc.base_url}/organizations/O1/devices'
+        )) == 5
+        assert _PagedSession.urls == [
+            f'{svc.base_url}/organizations/O1/devices?perPage=1000',
+        ]
+
+    def test_explicit_per_page_kept(self):
+        svc = _paged_service([{'id': i} for i in range(5)])
+        svc._paginated_get(f'{svc.base_url}/organizations/O1/devices?perPage=3')
+        assert len(_PagedSession.urls) == 2
+        assert 'perPage=1000' not in ''.join(_PagedSession.urls)
+
+    def test_find_transforms_every_page(self, monkeypatch):
+        monkeypatch.setitem(
+            platform_manager._PER_PAGE_MAX,
+            '/organizations/{organizationId}/policyObjects', 2,
+        )
+        svc = _paged_service([
+            {'id': str(i), 'name': f'obj{i}', 'type': 'cidr'} for i in range(5)
+        ])
+        out = svc.call_with_stats(
+            'execute', ['find', 'policy_object', {'organization_id': 'O1'}],
+        )
+        assert [c['name'] for c in out['result']['config']] == [
+            f'obj{i}' for i in range(5)
+        ]
+        assert out['stats']['pages'] == 3
+        assert 0 < out['stats']['transform_seconds'] < out['stats']['manager_seconds']
+
+    def test_facts_filter_devices_across_pages(self, monkeypatch):
+        monkeypatch.setitem(
+            platform_manager._PER_PAGE_MAX,
+            '/organizations/{organizationId}/devices', 2,
+        )
+        svc = _paged_service([
+            {'serial': f'Q{i}', 'networkId': f'N{i % 2}'} for i in range(5)
+        ])
+        facts = svc.execute('find', 'facts', {
+            'gather_subset': ['devices'],
+            'organization_id': 'O1', 'network_id': 'N1',
+        })
+        assert [d['serial'] for d in facts['devices']] == ['Q1', 'Q3']
+        assert len(_PagedSession.urls) == 3
+
+
+class TestGatherToFile:
+    """gather_to_file writes found items to a file, page by page."""
+
+    def test_paginated_find_spooled(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(
+            platform_manager._PER_PAGE_MAX,
+            '/organizations/{organizationId}/policyObjects', 2,
+        )
+        svc = _paged_service([
+            {'id': str(i), 'name': f'obj{i}', 'type': 'cidr'} for i in range(5)
+        ])
+        path = tmp_path / 'objects.jsonl'
+        written = svc.gather_to_file(
+            'policy_object', [{'organization_id': 'O1'}], str(path),
+            ['name', 'type'],
+        )
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert lines == [{'name': f'obj{i}', 'type': 'cidr'} for i in range(5)]
+        assert written['count'] == 5 and written['path'] == str(path)
+        assert len(_PagedSession.urls) == 3
+
+    def test_item_finds_written(self, tmp_path):
+        svc = _service({
+            ('GET', '/networks/N1/appliance/vlans/10'): (
+                200, {'id': 10, 'name': 'data'},
+            ),
+        }, rate_limit=0)
+        path = tmp_path / 'vlans.jsonl'
+        written = svc.gather_to_file('vlan', [
+            {'network_id': 'N1', 'vlan_id': '10'},
+        ], str(path))
+        assert written['count'] == 1
+        assert json.loads(path.read_text())['name'] == 'data'
+
+    def test_facts_inventory_gzipped(self, tmp_path):
+        svc = _paged_service([{'serial': f'Q{i}'} for i in range(3)])
+        path = tmp_path / 'inventory.jsonl.gz'
+        written = svc.gather_to_file('facts', [{
+            'gather_subset': ['inventory'], 'organization_id': 'O1',
+        }], str(path))
+        with gzip.open(path, 'rt') as f:
+            assert [json.loads(line)['serial'] for line in f] == ['Q0', 'Q1', 'Q2']
+        assert written['count'] == 3
+
+    def test_failed_gather_keeps_previous_file(self, tmp_path):
+        svc = _service({}, rate_limit=0)
+        path = tmp_path / 'vlans.jsonl'
+        path.write_text('old\n')
+        with pytest.raises(requests.HTTPError):
+            svc.gather_to_file('policy_object', [{'organization_id': 'O1'}], str(path))
+        assert path.read_text() == 'old\n'
+
+
+class TestGatherFacts:
+    """Facts subsets are listed concurrently and filtered by the Dashboard."""
+
+    def test_subsets_run_concurrently(self):
+        barrier = threading.Barrier(4, timeout=5)
+
+        class _BarrierSession(_PagedSession):
+            def request(self, method, url, **kwargs):
+                barrier.wait()
+                return super().request(method, url, **kwargs)
+
+        _PagedSession.items = [{'id': 'x'}]
+        _PagedSession.urls = []
+        svc = PlatformService(
+            'https://dash.example/api', 'key',
+            session_factory=_BarrierSession, max_connections=4, rate_limit=0,
+        )
+        facts = svc.execute('find', 'facts', {
+            'gather_subset': ['all'], 'organization_id': 'O1',
+        })
+        assert sorted(facts) == ['devices', 'inventory', 'networks', 'organizations']
+
+    def test_network_filter_sent_to_dashboard(self):
+        svc = _paged_service([{'serial': 'Q1', 'networkId': 'N1', 'id': 'N1'}])
+        facts = svc.execute('find', 'facts', {
+            'gather_subset': ['networks', 'devices', 'device_statuses', 'uplinks'],
+            'organization_id': 'O1', 'network_id': 'N1',
+        })
+        base = svc.base_url
+        assert sorted(_PagedSession.urls) == sorted([
+            f'{base}/networks/N1',
+            f'{base}/organizations/O1/devices?networkIds%5B%5D=N1&perPage=1000',
+            f'{base}/organizations/O1/devices/statuses'
+            '?networkIds%5B%5D=N1&perPage=1000',
+            f'{base}/organizations/O1/uplinks/statuses'
+            '?networkIds%5B%5D=N1&perPage=1000',
+        ])
+        assert all(len(items) == 1 for items in facts.values())
+        assert svc._org_for_network('N1') == 'O1'
+
+    def test_status_subsets_opt_in(self):
+        svc = _paged_service([])
+        facts = svc.execute('find', 'facts', {'gather_subset': ['all']})
+        # Org-scoped subsets need organization_id
+        assert list(facts) == ['organizations']
+        facts = svc.execute('find', 'facts', {
+            'gather_subset': ['all'], 'organization_id': 'O1',
+        })
+        assert 'device_statuses' not in facts and 'uplinks' not in facts
+
+
+class TestFindOrg:
+    """One org-wide listing serves every switch's port finds."""
+
+    BY_SWITCH = [
+        {'serial': 'Q1', 'ports': [
+            {'portId': '1', 'name': 'uplink', 'vlan': 1},
+            {'portId': '2', 'name': 'ap', 'vlan': 20},
+        ]},
+        {'serial': 'Q2', 'ports': [{'portId': '1', 'name': 'uplink'}]},
+    ]
+
+    def _service(self):
+        return _service({
+            ('GET', '/organizations/O1/switch/ports/bySwitch'): (
+                200, self.BY_SWITCH,
+            ),
+            ('PUT', '/devices/Q1/switch/ports/2'): (
+                200, {'portId': '2', 'name': 'ap', 'vlan': 30},
+            ),
+            ('GET', '/devices/Q1/switch/ports'): (200, []),
+        }, rate_limit=0)
+
+    def test_ports_of_every_switch(self):
+        svc = self._service()
+        config = svc.execute(
+            'find_org', 'switch_port', {'organization_id': 'O1'},
+        )['config']
+        assert [(p['serial'], p['port_id'], p['name']) for p in config] == [
+            ('Q1', '1', 'uplink'), ('Q1', '2', 'ap'), ('Q2', '1', 'uplink'),
+        ]
+        assert _FakeSession.calls == [
+            ('GET', '/organizations/O1/switch/ports/bySwitch'),
+        ]
+
+    def test_device_finds_served_from_index(self):
+        svc = self._service()
+        svc.execute('find_org', 'switch_port', {'organization_id': 'O1'})
+        listing = svc.execute('find', 'switch_port', {'serial': 'Q1'})
+        item = svc.execute('find', 'switch_port', {'serial': 'Q2', 'port_id': '1'})
+        assert [p['port_id'] for p in listing['config']] == ['1', '2']
+        assert item['name'] == 'uplink'
+        assert len(_FakeSession.calls) == 1
+        assert svc.stats()['index']['hits'] == 2
+
+    def test_write_invalidates_device(self):
+        svc = self._service()
+        svc.execute('find_org', 'switch_port', {'organization_id': 'O1'})
+        svc.execute('update', 'switch_port', {
+            'serial': 'Q1', 'port_id': '2', 'vlan': 30,
+        })
+        svc.execute('find', 'switch_port', {'serial': 'Q1'})
+        assert _FakeSession.calls[-1] == ('GET', '/devices/Q1/switch/ports')
+
+    def test_find_org_after_write_is_fresh(self):
+        svc = self._service()
+        svc.execute('find_org', 'switch_port', {'organization_id': 'O1'})
+        svc.execute('update', 'switch_port', {
+            'serial': 'Q1', 'port_id': '2', 'vlan': 30,
+        })
+        _FakeSession.routes[('GET', '/organizations/O1/switch/ports/bySwitch')] = (
+            200, [{'serial': 'Q1', 'ports': [
+                {'portId': '1', 'name': 'uplink', 'vlan': 1},
+                {'portId': '2', 'name': 'ap', 'vlan': 30},
+            ]}],
+        )
+        config = svc.execute(
+            'find_org', 'switch_port', {'organization_id': 'O1'},
+        )['config']
+        item = svc.execute('find', 'switch_port', {'serial': 'Q1', 'port_id': '2'})
+        assert config[1]['vlan'] == item['vlan'] == 30
+
+    def test_module_without_org_listing(self):
+        with pytest.raises(ValueError, match='No organization-wide listing'):
+            self._service().execute('find_org', 'vlan', {'organization_id': 'O1'})
+
+
+class TestExecuteScoped:
+    """Each scope's operations run as one group; transforms are shared."""
+
+    def _service(self, fail_network=None):
+        routes = {}
+        for network in ('N1', 'N2', 'N3'):
+            status = 400 if network == fail_network else 201
+            routes[('POST', f'/networks/{network}/appliance/vlans')] = (
+                status, {'id': '10', 'name': 'data', 'subnet': '10.0.0.0/24'},
+            )
+        return _service(routes, rate_limit=0)
+
+    def _groups(self, networks):
+        return [
+            [('create', 'vlan', {
+                'network_id': network, 'vlan_id': '10', 'name': 'data',
+                'subnet': '10.0.0.0/24',
+            })]
+            for network in networks
+        ]
+
+    def test_transform_once_for_all_scopes(self, monkeypatch):
+        svc = self._service()
+        user_cls = svc.loader.load_classes_for_module('vlan', svc.api_version)[0]
+        transforms = []
+        original = user_cls.to_api
+
+        def to_api(self, context=None):
+            transforms.append(self.network_id)
+            return original(self, context)
+
+        monkeypatch.setattr(user_cls, 'to_api', to_api)
+        outcomes = svc.execute_scoped(
+            self._groups(['N1', 'N2', 'N3']), 'network_id',
+        )
+        assert [o[0]['result']['vlan_id'] for o in outcomes] == ['10'] * 3
+        assert len(transforms) == 1
+        assert sorted(path for _, path in _FakeSession.calls) == [
+            '/networks/N1/appliance/vlans',
+            '/networks/N2/appliance/vlans',
+            '/networks/N3/appliance/vlans',
+        ]
+
+        svc.execute('create', 'vlan', self._groups(['N1'])[0][0][2])
+        assert len(transforms) == 2
+
+    def test_failure_stays_in_its_scope(self):
+        svc = self._service(fail_network='N2')
+        outcomes = svc.execute_scoped(
+            self._groups(['N1', 'N2', 'N3']), 'network_id',
+        )
+        assert 'result' in outcomes[0][0] and 'result' in outcomes[2][0]
+        assert outcomes[1][0]['error_type'] == 'HTTPError'
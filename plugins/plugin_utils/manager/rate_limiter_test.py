@@ -0,0 +1,85 @@
+"""Colocated tests for TokenBucket and OrgRateLimiter."""
+
+import pytest
+
+from .rate_limiter import OrgRateLimiter, TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """TokenBucket grants a burst, then paces at its rate."""
+
+    def test_rejects_bad_parameters(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0, 10)
+        with pytest.raises(ValueError):
+            TokenBucket(10, 0)
+
+    def test_burst_is_free(self):
+        bucket = TokenBucket(10, 5, clock=_Clock())
+        assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+    def test_waits_queue_behind_each_other(self):
+        bucket = TokenBucket(10, 1, clock=_Clock())
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+
+    def test_refills_over_time(self):
+        clock = _Clock()
+        bucket = TokenBucket(10, 2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now = 0.1
+        assert bucket.reserve() == 0.0
+
+    def test_refill_capped_at_capacity(self):
+        clock = _Clock()
+        bucket = TokenBucket(10, 2, clock=clock)
+        clock.now = 100.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() > 0.0
+
+    def test_penalize_blocks_for_retry_after(self):
+        bucket = TokenBucket(10, 10, clock=_Clock())
+        bucket.penalize(2.0)
+        assert bucket.reserve() == pytest.approx(2.1)
+
+
+class TestOrgRateLimiter:
+    """OrgRateLimiter keeps an independent bucket per organization."""
+
+    def test_orgs_do_not_throttle_each_other(self):
+        slept = []
+        limiter = OrgRateLimiter(rate=10, burst=1, sleep=slept.append)
+        limiter.acquire('org_a')
+        limiter.acquire('org_b')
+        assert slept == []
+        limiter.acquire('org_a')
+        assert len(slept) == 1
+
+    def test_penalize_only_affects_one_org(self):
+        slept = []
+        limiter = OrgRateLimiter(rate=10, burst=10, sleep=slept.append)
+        limiter.penalize('org_a', 1.0)
+        limiter.acquire('org_b')
+        assert slept == []
+        limiter.acquire('org_a')
+        assert slept and slept[0] >= 1.0
+
+    def test_zero_rate_disables(self):
+        slept = []
+        limiter = OrgRateLimiter(rate=0, sleep=slept.append)
+        assert not limiter.enabled
+        for _ in range(100):
+            limiter.acquire('org_a')
+        limiter.penalize('org_a', 5.0)
+        assert slept == []
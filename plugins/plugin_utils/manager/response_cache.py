@@ -0,0 +1,239 @@
+"""Read-through cache of Dashboard GET responses for PlatformService.
+
+Each resource task gathers ``before`` and ``after``, and consecutive
+tasks on the same network re-read the same collections.  The manager
+outlives individual tasks, so it can answer repeated GETs from memory.
+
+Entries are keyed by full request URL (including query string, so each
+page of a paginated listing is its own entry), expire after ``ttl``
+seconds and are evicted least-recently-used beyond ``max_entries``.
+
+Writes invalidate by path.  A POST/PUT/DELETE of ``/a/b/c`` drops:
+
+- ``/a/b/c`` itself and everything below it (``/a/b/c/...``);
+- each ancestor exactly (``/a/b``, ``/a``), since a collection listing
+  embeds its items.
+
+Org-wide listings also hold items written under other paths, for
+example ``/organizations/{id}/devices`` lists what is written under
+``/devices/{serial}``.  ``PlatformService`` therefore also drops the
+owning organization's ``/organizations/{id}`` subtree on every write.
+
+A GET that is in flight while a write invalidates its path would store
+the pre-write response afterwards.  Callers take a ``token()`` before
+sending the GET and pass it to ``put``, which skips the response if an
+invalidation covering its path happened since.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL = 30.0
+DEFAULT_CACHE_SIZE = 512
+
+# Invalidations remembered for put(token=...); an older token is
+# treated as invalidated.
+_RECENT_WRITES = 256
+
+# (path, ancestors): drops path, its subtree and the exact ancestors
+_Rule = Tuple[str, FrozenSet[str]]
+
+
+def _path_of(url: str) -> str:
+    """Path component of *url* without query string or trailing slash."""
+    return urlsplit(url).path.rstrip('/') or '/'
+
+
+def _covers(rule: _Rule, path: str) -> bool:
+    """Whether an invalidation *rule* applies to an entry at *path*."""
+    target, ancestors = rule
+    return path == target or path.startswith(target + '/') or path in ancestors
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of successful GET responses.
+
+    A ``ttl`` or ``max_entries`` of 0 disables caching.
+
+    Attributes:
+        max_entries: Maximum number of cached responses
+        ttl: Seconds an entry stays valid
+        hits: Lookups answered from the cache
+        misses: Lookups that went to the Dashboard
+        evictions: Entries dropped for size or age
+        invalidations: Entries dropped because of a write
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (0 disables)
+            ttl: Seconds an entry stays valid (0 disables)
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._clock = clock
+        # url -> (expires_at, path, status, headers, content)
+        self._entries: "OrderedDict[str, Tuple]" = OrderedDict()
+        # Write sequence number and the latest invalidations, newest last
+        self._seq = 0
+        self._recent: "deque[Tuple[int, _Rule]]" = deque(maxlen=_RECENT_WRITES)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached at all."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """
+        Return a fresh copy of the cached response for *url*, if valid.
+
+        Returns:
+            A new ``requests.Response``, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[url]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+        _, _, status, headers, content = entry
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = content
+        response.url = url
+        return response
+
+    def token(self) -> int:
+        """Write sequence number to pass to ``put`` for a GET sent now."""
+        return self._seq
+
+    def put(
+        self,
+        url: str,
+        response: requests.Response,
+        token: Optional[int] = None
+    ) -> None:
+        """
+        Cache a successful (2xx) GET response for *url*.
+
+        Args:
+            url: Request URL
+            response: Response to the GET
+            token: ``token()`` taken before the GET was sent; the
+                response is not cached if a write invalidated *url* since
+        """
+        if not self.enabled or not 200 <= response.status_code < 300:
+            return
+        path = _path_of(url)
+        entry = (
+            self._clock() + self.ttl,
+            path,
+            response.status_code,
+            dict(response.headers),
+            response.content,
+        )
+        with self._lock:
+            if token is not None and self._invalidated_since(token, path):
+                logger.debug(f"Not caching {path}: written while in flight")
+                return
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _invalidated_since(self, token: int, path: str) -> bool:
+        """Whether a write after *token* covers *path* (lock held)."""
+        if self._seq - token > len(self._recent):
+            return True
+        return any(
+            seq > token and _covers(rule, path) for seq, rule in self._recent
+        )
+
+    def invalidate(self, url: str, ancestors: bool = True) -> int:
+        """
+        Drop entries affected by a write to *url*.
+
+        Args:
+            url: Written URL
+            ancestors: Also drop the exact ancestors of its path (False
+                drops only the path and its subtree)
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.enabled:
+            return 0
+        path = _path_of(url)
+        parents = set()
+        parent = path
+        while ancestors and '/' in parent.strip('/'):
+            parent = parent.rsplit('/', 1)[0]
+            parents.add(parent)
+        rule = (path, frozenset(parents))
+
+        with self._lock:
+            self._seq += 1
+            self._recent.append((self._seq, rule))
+            stale = [
+                key for key, entry in self._entries.items()
+                if _covers(rule, entry[1])
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached responses for {path}")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, invalidations and size
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+            }
@@ -0,0 +1,156 @@
+"""Colocated tests for ResponseCache."""
+
+import requests
+
+from .response_cache import ResponseCache
+
+BASE = 'https://dash.example/api/v1'
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(body=b'[]', status=200, link=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    if link:
+        resp.headers['Link'] = link
+    return resp
+
+
+class TestResponseCache:
+    """ResponseCache stores GETs, expires them and counts hits."""
+
+    def test_miss_then_hit(self):
+        cache = ResponseCache()
+        url = f'{BASE}/networks/N1/appliance/vlans'
+        assert cache.get(url) is None
+        cache.put(url, _response(b'[{"id": "10"}]', link='<x>; rel=next'))
+        hit = cache.get(url)
+        assert hit.json() == [{'id': '10'}]
+        assert hit.headers['Link'] == '<x>; rel=next'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_hits_are_independent_copies(self):
+        cache = ResponseCache()
+        cache.put(f'{BASE}/a', _response(b'{}'))
+        assert cache.get(f'{BASE}/a') is not cache.get(f'{BASE}/a')
+
+    def test_errors_not_cached(self):
+        cache = ResponseCache()
+        cache.put(f'{BASE}/a', _response(status=404))
+        assert cache.get(f'{BASE}/a') is None
+
+    def test_ttl_expiry(self):
+        clock = _Clock()
+        cache = ResponseCache(ttl=30, clock=clock)
+        cache.put(f'{BASE}/a', _response())
+        clock.now = 29
+        assert cache.get(f'{BASE}/a') is not None
+        clock.now = 31
+        assert cache.get(f'{BASE}/a') is None
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put(f'{BASE}/a', _response())
+        cache.put(f'{BASE}/b', _response())
+        cache.get(f'{BASE}/a')
+        cache.put(f'{BASE}/c', _response())
+        assert cache.get(f'{BASE}/b') is None
+        assert cache.get(f'{BASE}/a') is not None
+        assert cache.stats()['evictions'] == 1
+
+    def test_disabled(self):
+        cache = ResponseCache(ttl=0)
+        cache.put(f'{BASE}/a', _response())
+        assert cache.get(f'{BASE}/a') is None
+        assert cache.stats() == {
+            'hits': 0, 'misses': 0, 'evictions': 0,
+            'invalidations': 0, 'size': 0,
+        }
+
+
+class TestInvalidation:
+    """Writes drop the resource, its subtree and its ancestors only."""
+
+    def _filled(self):
+        cache = ResponseCache()
+        for path in (
+            '/networks/N1/appliance/vlans',
+            '/networks/N1/appliance/vlans?perPage=10&startingAfter=5',
+            '/networks/N1/appliance/vlans/10',
+            '/networks/N1/appliance/vlans/10/dhcp',
+            '/networks/N1/appliance/vlans/11',
+            '/networks/N1/wireless/ssids',
+            '/networks/N2/appliance/vlans',
+        ):
+            cache.put(f'{BASE}{path}', _response())
+        return cache
+
+    def _cached(self, cache, path):
+        return cache.get(f'{BASE}{path}') is not None
+
+    def test_update_item(self):
+        cache = self._filled()
+        assert cache.invalidate(f'{BASE}/networks/N1/appliance/vlans/10') == 4
+        assert not self._cached(cache, '/networks/N1/appliance/vlans')
+        assert not self._cached(
+            cache, '/networks/N1/appliance/vlans?perPage=10&startingAfter=5'
+        )
+        assert not self._cached(cache, '/networks/N1/appliance/vlans/10')
+        assert not self._cached(cache, '/networks/N1/appliance/vlans/10/dhcp')
+        assert self._cached(cache, '/networks/N1/appliance/vlans/11')
+        assert self._cached(cache, '/networks/N1/wireless/ssids')
+        assert self._cached(cache, '/networks/N2/appliance/vlans')
+
+    def test_create_in_collection(self):
+        cache = self._filled()
+        cache.invalidate(f'{BASE}/networks/N1/appliance/vlans')
+        assert not self._cached(cache, '/networks/N1/appliance/vlans/11')
+        assert self._cached(cache, '/networks/N1/wireless/ssids')
+
+    def test_prefix_is_not_a_path_boundary(self):
+        cache = ResponseCache()
+        cache.put(f'{BASE}/networks/N10/appliance/vlans', _response())
+        cache.invalidate(f'{BASE}/networks/N1')
+        assert cache.get(f'{BASE}/networks/N10/appliance/vlans') is not None
+
+    def test_subtree_only(self):
+        cache = self._filled()
+        cache.invalidate(f'{BASE}/networks/N1/appliance/vlans/10', ancestors=False)
+        assert self._cached(cache, '/networks/N1/appliance/vlans')
+        assert not self._cached(cache, '/networks/N1/appliance/vlans/10/dhcp')
+
+
+class TestInFlightGets:
+    """A GET sent before a write is not cached after it."""
+
+    def test_written_while_in_flight(self):
+        cache = ResponseCache()
+        token = cache.token()
+        cache.invalidate(f'{BASE}/networks/N1/appliance/vlans/10')
+        cache.put(f'{BASE}/networks/N1/appliance/vlans', _response(), token)
+        cache.put(f'{BASE}/networks/N1/wireless/ssids', _response(), token)
+        assert cache.get(f'{BASE}/networks/N1/appliance/vlans') is None
+        assert cache.get(f'{BASE}/networks/N1/wireless/ssids') is not None
+
+    def test_sent_after_write(self):
+        cache = ResponseCache()
+        cache.invalidate(f'{BASE}/networks/N1/appliance/vlans/10')
+        cache.put(f'{BASE}/networks/N1/appliance/vlans', _response(), cache.token())
+        assert cache.get(f'{BASE}/networks/N1/appliance/vlans') is not None
+
+    def test_token_older_than_write_log(self):
+        cache = ResponseCache()
+        token = cache.token()
+        for i in range(300):
+            cache.invalidate(f'{BASE}/networks/N{i}/x')
+        cache.put(f'{BASE}/organizations/O1/admins', _response(), token)
+        assert cache.get(f'{BASE}/organizations/O1/admins') is None
@@ -7,9 +7,12 @@ Adapted for cisco.meraki_rm collection.
 """
 
 from multiprocessing.managers import BaseManager
-from typing import Any
+from typing import Any, Optional
 from dataclasses import asdict, is_dataclass
 import logging
+import time
+
+from .metrics import CallStats
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,7 @@ class ManagerRPCClient:
         authkey: Authentication key
         manager: Manager instance
         service_proxy: Proxy to PlatformService
+        stats: Cost of the calls made so far, once enable_stats() is called
     """
 
     def __init__(self, base_url: str, socket_path: str, authkey: bytes):
@@ -54,8 +58,32 @@ class ManagerRPCClient:
         self.manager.connect()
 
         self.service_proxy = self.manager.get_platform_service()
+        self.stats: Optional[CallStats] = None
         logger.info("Connected to Platform Manager")
 
+    def enable_stats(self, stats: Optional[CallStats] = None) -> CallStats:
+        """
+        Collect the cost of every later execute call into ``stats``.
+
+        Args:
+            stats: Collector to add to (default: a new one)
+
+        Returns:
+            The collector (see PlatformService.call_with_stats)
+        """
+        self.stats = stats if stats is not None else CallStats()
+        return self.stats
+
+    def _invoke(self, method: str, *args) -> Any:
+        """Call a service method, through call_with_stats if enabled."""
+        if self.stats is None:
+            return getattr(self.service_proxy, method)(*args)
+        start = time.perf_counter()
+        reply = self.service_proxy.call_with_stats(method, list(args))
+        self.stats.merge(reply['stats'])
+        self.stats.add(rpc_seconds=time.perf_counter() - start)
+        return reply['result']
+
     def execute(
         self,
         operation: str,
@@ -78,10 +106,111 @@ class ManagerRPCClient:
         else:
             data_dict = user_data
 
-        result_dict = self.service_proxy.execute(
+        result_dict = self._invoke(
+            'execute',
             operation,
             module_name,
             data_dict
         )
 
         return result_dict
+
+    def execute_many(self, operations: list, stop_on_error: bool = True) -> list:
+        """
+        Execute several operations via manager in one round-trip.
+
+        Args:
+            operations: Ordered list of ``(operation, module_name,
+                user_data)`` tuples; user_data may be a dataclass
+                instance or dict
+            stop_on_error: Skip the mutations that follow a failed one
+
+        Returns:
+            Per-operation outcome dicts (see PlatformService.execute_many)
+        """
+        payload = [
+            (op, module, asdict(data) if is_dataclass(data) else data)
+            for op, module, data in operations
+        ]
+        return self._invoke('execute_many', payload, stop_on_error)
+
+    def execute_scoped(self, groups: list, scope_param: str) -> list:
+        """
+        Execute the operations of several scopes via manager in one round-trip.
+
+        Args:
+            groups: One list of ``(operation, module_name, user_data)``
+                tuples per scope
+            scope_param: User Model field holding the scope
+
+        Returns:
+            One list of outcome dicts per group (see
+            PlatformService.execute_scoped)
+        """
+        payload = [
+            [
+                (op, module, asdict(data) if is_dataclass(data) else data)
+                for op, module, data in operations
+            ]
+            for operations in groups
+        ]
+        return self._invoke('execute_scoped', payload, scope_param)
+
+    def execute_batch(self, module_name: str, mutations: list) -> dict:
+        """
+        Execute several mutations as Meraki action batches via manager.
+
+        Args:
+            module_name: Module name (e.g., 'vlan', 'ssid')
+            mutations: Ordered list of ``(operation, user_data)`` pairs;
+                user_data may be a dataclass instance or dict
+
+        Returns:
+            Batch summary dict (see PlatformService.execute_batch)
+        """
+        payload = [
+            (op, asdict(data) if is_dataclass(data) else data)
+            for op, data in mutations
+        ]
+        return self._invoke('execute_batch', module_name, payload)
+
+    def gather_to_file(
+        self,
+        module_name: str,
+        queries: list,
+        path: str,
+        fields: Optional[list] = None
+    ) -> dict:
+        """
+        Gather via manager into a JSONL file instead of the reply.
+
+        Args:
+            module_name: Module name (e.g., 'admin', 'facts')
+            queries: User Model dataclass instances or dicts, one per find
+            path: Destination file (``.gz`` for gzip)
+            fields: Keys to keep from each item; None keeps all
+
+        Returns:
+            Dict with path, count and checksum (see
+            PlatformService.gather_to_file)
+        """
+        payload = [asdict(q) if is_dataclass(q) else q for q in queries]
+        return self._invoke('gather_to_file', module_name, payload, path, fields)
+
+    def cache_stats(self) -> dict:
+        """
+        Get the manager's response cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, invalidations and size
+        """
+        return self.service_proxy.cache_stats()
+
+    def stats(self) -> dict:
+        """
+        Get the manager's metrics (see PlatformService.stats).
+
+        Returns:
+            Dict with counters, histograms, gauges and cache counters
+        """
+        return self.service_proxy.stats()
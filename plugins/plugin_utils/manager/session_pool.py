@@ -0,0 +1,105 @@
+"""Bounded pool of HTTP sessions shared by PlatformService worker threads.
+
+``requests.Session`` is not thread-safe, so PlatformService used to
+serialize every Dashboard call through one lock.  SessionPool instead
+hands each in-flight request its own session (and therefore its own
+keep-alive connection pool), bounded by ``max_connections``.
+
+Sessions are returned to a LIFO queue after use so the most recently
+used — and therefore most likely still connected — session is handed
+out next.  Sessions are created lazily, so an idle manager never opens
+more connections than it has actually needed concurrently.
+"""
+
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 10
+
+
+class SessionPool:
+    """
+    Thread-safe pool of ``requests.Session`` objects.
+
+    Attributes:
+        max_connections: Maximum number of concurrently borrowed sessions
+        created: Number of sessions created so far
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], requests.Session],
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Zero-argument callable returning a configured session
+            max_connections: Upper bound on concurrent in-flight requests
+
+        Raises:
+            ValueError: If max_connections is less than 1
+        """
+        if max_connections < 1:
+            raise ValueError(
+                f"max_connections must be >= 1, got {max_connections}"
+            )
+        self.max_connections = max_connections
+        self.created = 0
+        self._factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of sessions currently borrowed."""
+        return self._in_flight
+
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """
+        Borrow a session for the duration of one request.
+
+        Blocks while ``max_connections`` sessions are already in use.
+
+        Yields:
+            A session owned exclusively by the calling thread
+        """
+        with self._slots:
+            try:
+                sess = self._idle.get_nowait()
+            except queue.Empty:
+                sess = self._factory()
+                with self._lock:
+                    self.created += 1
+                logger.debug(
+                    f"Opened HTTP session {self.created}/{self.max_connections}"
+                )
+
+            with self._lock:
+                self._in_flight += 1
+            try:
+                yield sess
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                self._idle.put(sess)
+
+    def close(self) -> None:
+        """Close all idle sessions."""
+        while True:
+            try:
+                sess = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            sess.close()
@@ -0,0 +1,78 @@
+"""Colocated tests for SessionPool."""
+
+import threading
+import time
+
+import pytest
+
+from .session_pool import SessionPool
+
+
+class _FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestSessionPool:
+    """SessionPool bounds concurrency and reuses sessions."""
+
+    def test_rejects_zero_connections(self):
+        with pytest.raises(ValueError):
+            SessionPool(_FakeSession, max_connections=0)
+
+    def test_sequential_use_reuses_one_session(self):
+        pool = SessionPool(_FakeSession, max_connections=4)
+        with pool.session() as first:
+            pass
+        with pool.session() as second:
+            pass
+        assert first is second
+        assert pool.created == 1
+
+    def test_concurrent_use_gets_distinct_sessions(self):
+        pool = SessionPool(_FakeSession, max_connections=4)
+        with pool.session() as a, pool.session() as b:
+            assert a is not b
+            assert pool.in_flight == 2
+        assert pool.in_flight == 0
+        assert pool.created == 2
+
+    def test_in_flight_never_exceeds_max(self):
+        pool = SessionPool(_FakeSession, max_connections=3)
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with pool.session():
+                with lock:
+                    peak.append(pool.in_flight)
+                time.sleep(0.01)
+
+        threads = [threading.Thread(target=worker) for _ in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(peak) <= 3
+        assert pool.created <= 3
+
+    def test_session_returned_on_error(self):
+        pool = SessionPool(_FakeSession, max_connections=1)
+        with pytest.raises(RuntimeError):
+            with pool.session():
+                raise RuntimeError("boom")
+        assert pool.in_flight == 0
+        with pool.session():
+            pass
+        assert pool.created == 1
+
+    def test_close_closes_idle_sessions(self):
+        pool = SessionPool(_FakeSession, max_connections=2)
+        with pool.session() as a, pool.session() as b:
+            pass
+        pool.close()
+        assert a.closed and b.closed
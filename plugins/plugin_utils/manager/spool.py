@@ -0,0 +1,143 @@
+"""Spool gathered items to a JSON Lines file instead of the task result.
+
+An org-scale ``state: gathered`` (admins, policy objects, inventory)
+returns every item in the Ansible result, which Ansible serializes and
+copies several times.  With ``gathered_dest`` the manager writes the
+items to a file as it gathers them, one JSON object per line (gzip
+compressed when the path ends in ``.gz``).  The task returns only the
+path, item count and checksum.
+
+A ``Spool`` is made current with ``spooling()``.  Paginated listings
+gathered inside write each page to it as the page arrives, so neither
+the raw listing nor the transformed one is held whole.  The file is
+written next to its destination and renamed into place when complete,
+so readers never see a partial file.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Optional, Sequence
+
+_CHUNK = 1024 * 1024
+
+_current_spool: ContextVar[Optional['Spool']] = ContextVar(
+    'meraki_spool', default=None,
+)
+
+
+class Spool:
+    """
+    JSON Lines writer for gathered items.
+
+    Use as a context manager: the file is renamed onto *path* when the
+    block exits normally and discarded when it raises.  Threads
+    gathering concurrently may share one spool; writes are locked.
+
+    Attributes:
+        path: Destination path
+        fields: Keys kept from each item (None keeps all); ``None``
+            values are dropped, as ``_validate_output`` does for the
+            task result
+        count: Items written so far
+        checksum: SHA-256 of the file as written (after ``close``)
+    """
+
+    def __init__(self, path: str, fields: Optional[Sequence[str]] = None):
+        self.path = path
+        self.fields = frozenset(fields) if fields else None
+        self.count = 0
+        self.checksum: Optional[str] = None
+        self._tmp: Optional[str] = None
+        self._raw = None
+        self._out = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'Spool':
+        directory = os.path.dirname(self.path) or '.'
+        fd, self._tmp = tempfile.mkstemp(
+            dir=directory, prefix='.', suffix='.tmp',
+        )
+        self._raw = os.fdopen(fd, 'wb')
+        if self.path.endswith('.gz'):
+            # mtime=0 keeps the checksum stable for identical content
+            self._out = gzip.GzipFile(
+                filename='', mode='wb', fileobj=self._raw, mtime=0,
+            )
+        else:
+            self._out = self._raw
+        return self
+
+    def write(self, items: Iterable[dict]) -> None:
+        """Append *items*, one JSON object per line."""
+        lines = []
+        for item in items:
+            if self.fields is not None and isinstance(item, dict):
+                item = {
+                    k: v for k, v in item.items()
+                    if k in self.fields and v is not None
+                }
+            lines.append(json.dumps(item, separators=(',', ':'), default=str))
+        if lines:
+            data = ('\n'.join(lines) + '\n').encode()
+            with self._lock:
+                self._out.write(data)
+                self.count += len(lines)
+
+    def close(self) -> None:
+        """Finish the file, move it onto ``path`` and set ``checksum``."""
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+
+        self.checksum = file_checksum(self._tmp)
+        os.replace(self._tmp, self.path)
+        self._tmp = None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self._raw.close()
+        finally:
+            os.unlink(self._tmp)
+            self._tmp = None
+
+    def summary(self) -> dict:
+        """Plain-data description of the written file (RPC and JSON safe)."""
+        return {'path': self.path, 'count': self.count, 'checksum': self.checksum}
+
+
+def file_checksum(path: str) -> Optional[str]:
+    """SHA-256 of the file at *path*, or None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+@contextmanager
+def spooling(spool: Spool) -> Iterator[Spool]:
+    """Send items gathered in this context to *spool*."""
+    token = _current_spool.set(spool)
+    try:
+        yield spool
+    finally:
+        _current_spool.reset(token)
+
+
+def current_spool() -> Optional[Spool]:
+    """The spool of the enclosing ``spooling()`` block, if any."""
+    return _current_spool.get()
@@ -0,0 +1,70 @@
+"""Colocated tests for the gathered-items spool."""
+
+import gzip
+import hashlib
+import json
+
+import pytest
+
+from .spool import Spool, current_spool, file_checksum, spooling
+
+
+class TestSpool:
+    """Items are written as JSON Lines and the file appears when complete."""
+
+    def test_jsonl_written(self, tmp_path):
+        path = tmp_path / 'admins.jsonl'
+        with Spool(str(path)) as spool:
+            spool.write([{'email': 'a@x'}, {'email': 'b@x'}])
+            spool.write([])
+            assert not path.exists()
+        assert [json.loads(line) for line in path.read_text().splitlines()] == [
+            {'email': 'a@x'}, {'email': 'b@x'},
+        ]
+        assert spool.summary() == {
+            'path': str(path), 'count': 2,
+            'checksum': hashlib.sha256(path.read_bytes()).hexdigest(),
+        }
+
+    def test_gzip_by_suffix(self, tmp_path):
+        path = tmp_path / 'inv.jsonl.gz'
+        with Spool(str(path)) as spool:
+            spool.write([{'serial': 'Q1'}])
+        with gzip.open(path, 'rt') as f:
+            assert json.loads(f.readline()) == {'serial': 'Q1'}
+
+    def test_gzip_checksum_stable(self, tmp_path):
+        sums = []
+        for name in ('a.jsonl.gz', 'b.jsonl.gz'):
+            with Spool(str(tmp_path / name)) as spool:
+                spool.write([{'serial': 'Q1'}])
+            sums.append(spool.checksum)
+        assert sums[0] == sums[1]
+
+    def test_fields_filter_like_output_validation(self, tmp_path):
+        path = tmp_path / 'out.jsonl'
+        with Spool(str(path), fields=['name', 'email']) as spool:
+            spool.write([{'name': 'a', 'email': None, 'internal': 1}])
+        assert json.loads(path.read_text()) == {'name': 'a'}
+
+    def test_failure_leaves_nothing(self, tmp_path):
+        path = tmp_path / 'out.jsonl'
+        path.write_text('old\n')
+        with pytest.raises(RuntimeError):
+            with Spool(str(path)) as spool:
+                spool.write([{'a': 1}])
+                raise RuntimeError('gather failed')
+        assert path.read_text() == 'old\n'
+        assert [p.name for p in tmp_path.iterdir()] == ['out.jsonl']
+
+    def test_spooling_context(self, tmp_path):
+        assert current_spool() is None
+        with Spool(str(tmp_path / 'x.jsonl')) as spool, spooling(spool):
+            assert current_spool() is spool
+        assert current_spool() is None
+
+    def test_file_checksum(self, tmp_path):
+        path = tmp_path / 'f'
+        assert file_checksum(str(path)) is None
+        path.write_bytes(b'abc')
+        assert file_checksum(str(path)) == hashlib.sha256(b'abc').hexdigest()
@@ -59,25 +59,47 @@ def _build_ansible_task(tool_name: str, args: Dict[str, Any], metadata: Dict[str
     return yaml.dump([task], default_flow_style=False, sort_keys=False)
 
 
-def _execute_live(tool_name: str, args: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
+def _live_service() -> Any:
+    """Create the service live mode sends operations to.
+
+    ``AsyncPlatformService`` when httpx is installed, so tool calls run
+    on the event loop; otherwise the threaded ``PlatformService``.
+    """
+    api_key = os.environ.get("MERAKI_API_KEY")
+    dashboard_url = os.environ.get("MERAKI_DASHBOARD_URL", "https://api.meraki.com/api/v1")
+
+    from ..manager.async_platform import HAS_HTTPX, AsyncPlatformService
+
+    if HAS_HTTPX:
+        return AsyncPlatformService(dashboard_url, api_key)
+
+    from ..manager.platform_manager import PlatformService
+
+    return PlatformService(dashboard_url, api_key)
+
+
+async def _execute_live(
+    tool_name: str,
+    args: Dict[str, Any],
+    metadata: Dict[str, Any],
+    service: Any,
+) -> Dict[str, Any]:
     """Execute an operation against the Meraki Dashboard API.
 
     Args:
         tool_name: MCP tool name (e.g. ``meraki_vlan``).
         args: Tool call arguments from the MCP client.
         metadata: Internal metadata dict for this tool.
+        service: Service from ``_live_service()``.  A threaded
+            ``PlatformService`` is called on a worker thread so the
+            event loop keeps serving other tool calls.
 
     Returns:
         Dict with ``state`` and ``results`` keys.
     """
-    api_key = os.environ.get("MERAKI_API_KEY")
-    dashboard_url = os.environ.get("MERAKI_DASHBOARD_URL", "https://api.meraki.com/api/v1")
-
     from dataclasses import asdict
 
-    from ..manager.platform_manager import PlatformService
-
-    service = PlatformService(dashboard_url, api_key)
+    from ..manager.async_platform import AsyncPlatformService
 
     user_cls = metadata["user_model_class"]
     scope_param = metadata["scope_param"]
@@ -98,8 +120,13 @@ def _execute_live(tool_name: str, args: Dict[str, Any], metadata: Dict[str, Any]
 
     results = []
     for item in config:
-        user_data = user_cls(**{scope_param: scope_value}, **item)
-        result = service.execute(operation, module_name, asdict(user_data))
+        user_data = asdict(user_cls(**{scope_param: scope_value}, **item))
+        if isinstance(service, AsyncPlatformService):
+            result = await service.execute(operation, module_name, user_data)
+        else:
+            result = await asyncio.to_thread(
+                service.execute, operation, module_name, user_data
+            )
         results.append(result)
 
     return {"state": state, "results": results}
@@ -146,12 +173,15 @@ def _describe_tools(tool_defs: list[Dict[str, Any]], arguments: Dict[str, Any])
     return json.dumps({"tool_count": len(catalogue), "tools": catalogue}, indent=2)
 
 
-def create_server(mode: str = "task") -> Server:
+def create_server(mode: str = "task", live: Dict[str, Any] | None = None) -> Server:
     """Create and configure the MCP server with dynamically generated tools.
 
     Args:
         mode: Server mode — ``"task"`` for Ansible YAML generation or
             ``"live"`` for direct API execution.
+        live: Holds the live-mode service under ``"service"`` once the
+            first tool call creates it; the caller closes it with
+            ``_close_live()`` when the server stops.
 
     Returns:
         Configured ``mcp.server.Server`` instance.
@@ -160,6 +190,9 @@ def create_server(mode: str = "task") -> Server:
 
     tool_defs = build_tool_definitions()
     tool_index: Dict[str, Dict[str, Any]] = {t["name"]: t for t in tool_defs}
+    # Live mode: one service (and connection pool) for all tool calls
+    if live is None:
+        live = {}
 
     _DESCRIBE_SCHEMA: Dict[str, Any] = {
         "type": "object",
@@ -218,7 +251,9 @@ def create_server(mode: str = "task") -> Server:
         if mode == "task":
             text = _build_ansible_task(name, arguments, metadata)
         else:
-            result = _execute_live(name, arguments, metadata)
+            if "service" not in live:
+                live["service"] = _live_service()
+            result = await _execute_live(name, arguments, metadata, live["service"])
             text = json.dumps(result, indent=2, default=str)
 
         return [TextContent(type="text", text=text)]
@@ -226,15 +261,33 @@ def create_server(mode: str = "task") -> Server:
     return server
 
 
+async def _close_live(live: Dict[str, Any]) -> None:
+    """Close the live-mode service in *live*, if one was created."""
+    service = live.pop("service", None)
+    if service is None:
+        return
+
+    from ..manager.async_platform import AsyncPlatformService
+
+    if isinstance(service, AsyncPlatformService):
+        await service.aclose()
+    else:
+        service.sessions.close()
+
+
 async def _run_server(mode: str) -> None:
     """Run the MCP server over stdio."""
-    server = create_server(mode=mode)
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    live: Dict[str, Any] = {}
+    server = create_server(mode=mode, live=live)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        await _close_live(live)
 
 
 def main() -> None:
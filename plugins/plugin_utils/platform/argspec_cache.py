@@ -0,0 +1,130 @@
+"""Compiled argspec cache for the resource action plugins.
+
+Every task used to import its module, ``yaml.safe_load`` the whole
+DOCUMENTATION block and rebuild the argspec.  The argspec only changes
+when the module file does, so it is compiled once and stored as JSON in
+the manager runtime directory, keyed by the SHA-256 of the module
+source.  Later forks hash the file and ``json.load`` the result, which
+is far cheaper than importing the module and parsing YAML.  Editing the
+module changes its hash, so stale entries are never read.
+
+Within one process the decoded argspec is also kept in memory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout changes so old files are ignored
+ARGSPEC_FORMAT = 1
+
+_memory: Dict[str, dict] = {}
+
+
+def build_argspec(documentation: str) -> dict:
+    """
+    Build argument spec from a module DOCUMENTATION string.
+
+    Args:
+        documentation: DOCUMENTATION string from module
+
+    Returns:
+        Dict with 'argument_spec' (param_name -> spec) and
+        constraint keys for ArgumentSpecValidator
+
+    Raises:
+        ValueError: If documentation cannot be parsed
+    """
+    try:
+        doc_data = yaml.safe_load(documentation)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Failed to parse DOCUMENTATION: {e}") from e
+
+    return {
+        'argument_spec': doc_data.get('options', {}),
+        'mutually_exclusive': doc_data.get('mutually_exclusive', []),
+        'required_together': doc_data.get('required_together', []),
+        'required_one_of': doc_data.get('required_one_of', []),
+        'required_if': doc_data.get('required_if', []),
+    }
+
+
+def source_digest(path: str) -> Optional[str]:
+    """SHA-256 of the file at *path*, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_argspec(
+    digest: str,
+    documentation: Callable[[], str],
+    cache_dir: Optional[Path] = None
+) -> Optional[dict]:
+    """
+    Return the compiled argspec for a module source digest.
+
+    Looks in memory, then in ``cache_dir/<digest>.json``; on a miss
+    calls *documentation* to get the DOCUMENTATION string, compiles it
+    and writes the cache file.
+
+    Args:
+        digest: SHA-256 of the module source (see source_digest)
+        documentation: Returns the module's DOCUMENTATION string
+        cache_dir: Directory for cache files (None: memory only)
+
+    Returns:
+        Argspec dict, or None if the module has no DOCUMENTATION
+    """
+    if digest in _memory:
+        return _memory[digest]
+
+    path = cache_dir / f'{digest}.json' if cache_dir else None
+    argspec = _read(path) if path else None
+    if argspec is None:
+        doc = documentation()
+        if not doc:
+            return None
+        argspec = build_argspec(doc)
+        if path:
+            _write(path, argspec)
+
+    _memory[digest] = argspec
+    return argspec
+
+
+def _read(path: Path) -> Optional[dict]:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('format') != ARGSPEC_FORMAT:
+        return None
+    return data.get('argspec')
+
+
+def _write(path: Path, argspec: dict) -> None:
+    """Write atomically so concurrent forks never read a partial file."""
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'format': ARGSPEC_FORMAT, 'argspec': argspec}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Argspec cache not written to {path}: {e}")
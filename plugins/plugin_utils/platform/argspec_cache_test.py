@@ -0,0 +1,99 @@
+"""Colocated tests for the compiled argspec cache."""
+
+import json
+
+import pytest
+
+from . import argspec_cache
+
+DOC = """
+module: meraki_test
+options:
+  state:
+    type: str
+    choices: [merged, deleted]
+    default: merged
+  config:
+    type: list
+    elements: dict
+required_if:
+  - [state, deleted, [config]]
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memory(monkeypatch):
+    monkeypatch.setattr(argspec_cache, '_memory', {})
+
+
+class _Doc:
+    def __init__(self, text=DOC):
+        self.text = text
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.text
+
+
+class TestBuildArgspec:
+
+    def test_options_and_constraints(self):
+        argspec = argspec_cache.build_argspec(DOC)
+        assert set(argspec['argument_spec']) == {'state', 'config'}
+        assert argspec['required_if'] == [['state', 'deleted', ['config']]]
+        assert argspec['mutually_exclusive'] == []
+
+    def test_invalid_yaml(self):
+        with pytest.raises(ValueError, match='DOCUMENTATION'):
+            argspec_cache.build_argspec('options: [unclosed')
+
+
+class TestLoadArgspec:
+
+    def test_compiles_once_then_reads_file(self, tmp_path, monkeypatch):
+        doc = _Doc()
+        first = argspec_cache.load_argspec('abc', doc, tmp_path)
+        assert (tmp_path / 'abc.json').exists()
+
+        monkeypatch.setattr(argspec_cache, '_memory', {})
+        second = argspec_cache.load_argspec('abc', doc, tmp_path)
+        assert second == first
+        assert doc.calls == 1
+
+    def test_memory_hit(self, tmp_path):
+        doc = _Doc()
+        first = argspec_cache.load_argspec('abc', doc, tmp_path)
+        (tmp_path / 'abc.json').unlink()
+        assert argspec_cache.load_argspec('abc', doc, tmp_path) is first
+        assert doc.calls == 1
+
+    def test_other_format_ignored(self, tmp_path):
+        (tmp_path / 'abc.json').write_text(json.dumps(
+            {'format': argspec_cache.ARGSPEC_FORMAT + 1, 'argspec': {}},
+        ))
+        doc = _Doc()
+        argspec = argspec_cache.load_argspec('abc', doc, tmp_path)
+        assert 'state' in argspec['argument_spec']
+        assert doc.calls == 1
+
+    def test_no_documentation(self, tmp_path):
+        assert argspec_cache.load_argspec('abc', _Doc(''), tmp_path) is None
+
+    def test_memory_only(self):
+        doc = _Doc()
+        assert argspec_cache.load_argspec('abc', doc, None)
+        assert doc.calls == 1
+
+
+class TestSourceDigest:
+
+    def test_changes_with_content(self, tmp_path):
+        path = tmp_path / 'mod.py'
+        path.write_text('a = 1')
+        before = argspec_cache.source_digest(str(path))
+        path.write_text('a = 2')
+        assert argspec_cache.source_digest(str(path)) != before
+
+    def test_missing_file(self, tmp_path):
+        assert argspec_cache.source_digest(str(tmp_path / 'nope.py')) is None
@@ -6,12 +6,164 @@ and API (Device) dataclasses in the cisco.meraki_rm collection.
 Adapted from the NovaCom reference pattern for Meraki Dashboard API.
 """
 
+import copy
 from abc import ABC
-from dataclasses import asdict, fields, is_dataclass
-from typing import TypeVar, Type, Optional, Dict, Any
+from dataclasses import MISSING, asdict, fields, is_dataclass
+from functools import lru_cache
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type,
+    TypeVar,
+)
 
 T = TypeVar('T')
 
+# Methods of the generic transform path.  A class overriding any of them
+# keeps the generic path instead of a compiled transformer.
+_GENERIC_HOOKS = (
+    '_apply_forward_mapping', '_apply_reverse_mapping',
+    '_get_nested', '_set_nested',
+)
+
+
+@lru_cache(maxsize=None)
+def dataclass_field_names(cls: type) -> FrozenSet[str]:
+    """Field names of dataclass *cls* (computed once per class)."""
+    return frozenset(f.name for f in fields(cls))
+
+
+def _plain(value: Any) -> Any:
+    """
+    Copy *value* the way ``asdict`` would.
+
+    Dataclasses become dicts, and lists, tuples and dicts are rebuilt,
+    so the mapped result never shares a mutable value with its source.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    return copy.deepcopy(value)
+
+
+class CompiledTransform:
+    """
+    Field mapping of one (class, direction) compiled into flat steps.
+
+    Built once from ``_field_mapping`` and ``_transform_registry`` by
+    ``BaseTransformMixin._compiled_transform()``.  Unlike the generic
+    path it reads source attributes directly instead of deep-copying the
+    whole instance with ``asdict``, copying only the mapped values,
+    pre-splits dotted paths, and knows the target's accepted fields up
+    front.  The result is identical, and like ``asdict`` it shares no
+    mutable values with the source.
+
+    Attributes:
+        steps: ``(attr, nested source keys, target keys, transform name)``
+        target_fields: Field names the target dataclass accepts, or None
+    """
+
+    __slots__ = ('steps', 'target_fields')
+
+    def __init__(self, cls: type, direction: str, target_class: type):
+        mapping = cls._field_mapping or {}
+        source_fields = dataclass_field_names(cls)
+        steps = []
+        for user_field, spec in mapping.items():
+            if isinstance(spec, str):
+                api_field = spec
+            elif isinstance(spec, dict):
+                api_field = spec.get('api_field', user_field)
+            else:
+                api_field = user_field
+
+            if direction == 'forward':
+                source, target = user_field, api_field
+                transform = spec.get('forward_transform') if isinstance(spec, dict) else None
+            else:
+                source, target = api_field, user_field
+                transform = spec.get('reverse_transform') if isinstance(spec, dict) else None
+
+            attr, *rest = source.split('.')
+            if attr not in source_fields:
+                continue
+            steps.append((attr, tuple(rest), tuple(target.split('.')), transform))
+
+        self.steps: Tuple[tuple, ...] = tuple(steps)
+        self.target_fields = (
+            dataclass_field_names(target_class)
+            if is_dataclass(target_class) else None
+        )
+
+    def apply(self, instance: Any, context: Dict) -> dict:
+        """
+        Map *instance*'s attributes to a target-format dict.
+
+        Args:
+            instance: Source dataclass instance
+            context: Transform context passed to transform functions
+
+        Returns:
+            Mapped data (before the post-transform hook)
+        """
+        return self._map(
+            instance.__getattribute__, instance._apply_transform, context
+        )
+
+    def apply_dict(self, data: dict, registry: Dict, context: Dict) -> dict:
+        """
+        Map a raw source-format dict, as if it were a source instance.
+
+        Keys that are not source fields are ignored, and transform
+        names are looked up in *registry* directly.
+
+        Args:
+            data: Raw source data (e.g. one item of an API listing)
+            registry: The source class's ``_transform_registry``
+            context: Transform context passed to transform functions
+
+        Returns:
+            Mapped data (before the post-transform hook)
+        """
+        def apply_transform(value, name, ctx):
+            func = registry.get(name)
+            return func(value, ctx) if func else value
+
+        return self._map(data.get, apply_transform, context)
+
+    def _map(
+        self,
+        get: Callable[[str], Any],
+        apply_transform: Callable[[Any, str, Dict], Any],
+        context: Dict
+    ) -> dict:
+        result: Dict[str, Any] = {}
+        for attr, rest, target, transform in self.steps:
+            value = get(attr)
+            if value is None:
+                continue
+            value = _plain(value)
+            for key in rest:
+                value = value.get(key) if isinstance(value, dict) else None
+                if value is None:
+                    break
+            if value is None:
+                continue
+
+            if transform is not None:
+                value = apply_transform(value, transform, context)
+
+            current = result
+            for key in target[:-1]:
+                current = current.setdefault(key, {})
+            current[target[-1]] = value
+        return result
+
 
 class BaseTransformMixin(ABC):
     """
@@ -36,6 +188,8 @@ class BaseTransformMixin(ABC):
         SYSTEM_KEY: API-generated opaque identifier for URL routing (e.g. 'admin_id')
         SUPPORTS_DELETE: False for singletons that cannot be removed
         VALID_STATES: Frozenset of states this resource supports
+        AFTER_FROM_RESPONSES: False if create/update responses do not
+            describe the full resource, so ``after`` must be re-gathered
     """
 
     _field_mapping: Optional[Dict] = None
@@ -49,6 +203,7 @@ class BaseTransformMixin(ABC):
     VALID_STATES: frozenset = frozenset({
         'merged', 'replaced', 'overridden', 'deleted', 'gathered',
     })
+    AFTER_FROM_RESPONSES: bool = True
 
     def to_api(self, context: Optional[Dict] = None) -> Any:
         """
@@ -57,7 +212,6 @@ class BaseTransformMixin(ABC):
         Args:
             context: Optional context dict containing:
                 - manager: PlatformService instance for lookups
-                - session: HTTP session
                 - cache: Lookup cache
                 - api_version: Current API version
 
@@ -89,11 +243,166 @@ class BaseTransformMixin(ABC):
             context=context or {}
         )
 
+    @classmethod
+    def to_ansible_many(
+        cls,
+        items: Iterable[dict],
+        context: Optional[Dict] = None
+    ) -> List[dict]:
+        """
+        Transform raw API items straight to User Model dicts.
+
+        Equivalent to ``asdict(cls(**item).to_ansible(context))`` per item
+        (unknown keys dropped), but done in one pass over precomputed key
+        maps, without building an API instance, a User Model instance
+        and a copied dict for every row.  Classes with custom hooks,
+        ``__post_init__`` or non-None field defaults take the per-item path.
+
+        Args:
+            items: API-format dicts (e.g. a GET listing)
+            context: Optional context dict (same as to_ansible)
+
+        Returns:
+            List of User Model dicts, ready to return over RPC
+        """
+        context = context or {}
+        user_class = cls._get_ansible_class()
+        batch = cls._batch_transform(user_class)
+
+        if batch is None:
+            api_fields = (
+                dataclass_field_names(cls) if is_dataclass(cls) else None
+            )
+            return [
+                asdict(cls(**(
+                    item if api_fields is None
+                    else {k: v for k, v in item.items() if k in api_fields}
+                )).to_ansible(context))
+                for item in items
+            ]
+
+        compiled, template = batch
+        registry = cls._transform_registry or {}
+        target_fields = compiled.target_fields
+        results = []
+        for item in items:
+            row = dict(template)
+            for key, value in compiled.apply_dict(
+                item, registry, context
+            ).items():
+                if key in target_fields:
+                    row[key] = value
+            results.append(row)
+        return results
+
+    @classmethod
+    def _batch_transform(
+        cls,
+        user_class: type
+    ) -> Optional[Tuple[CompiledTransform, Dict[str, None]]]:
+        """
+        Return ``(compiled reverse transform, empty user row)`` if the
+        dict-to-dict fast path of ``to_ansible_many`` is exact for this
+        class, else None.
+        """
+        cache = cls.__dict__.get('_compiled_transforms')
+        key = ('reverse-many', user_class)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        compiled = cls._compiled_transform('reverse', user_class)
+        eligible = (
+            compiled is not None
+            and compiled.target_fields is not None
+            and cls._post_transform_hook is BaseTransformMixin._post_transform_hook
+            and cls._apply_transform is BaseTransformMixin._apply_transform
+            and all(
+                not hasattr(c, '__post_init__')
+                and all(
+                    f.default is None and f.default_factory is MISSING
+                    for f in fields(c)
+                )
+                for c in (cls, user_class)
+            )
+        )
+        batch = (
+            (compiled, {f.name: None for f in fields(user_class)})
+            if eligible else None
+        )
+        cls.__dict__['_compiled_transforms'][key] = batch
+        return batch
+
     def _transform(
         self,
         target_class: Type[T],
         direction: str,
         context: Dict
+    ) -> T:
+        """
+        Bidirectional transformation logic.
+
+        Uses the class's compiled transformer when available, otherwise
+        the generic path (``_transform_generic``).
+
+        Args:
+            target_class: Target dataclass type to instantiate
+            direction: 'forward' (User->Device) or 'reverse' (Device->User)
+            context: Context dict for transformation functions
+
+        Returns:
+            Instance of target_class with transformed data
+        """
+        compiled = type(self)._compiled_transform(direction, target_class)
+        if compiled is None:
+            return self._transform_generic(target_class, direction, context)
+
+        transformed_data = self._post_transform_hook(
+            compiled.apply(self, context), direction, context
+        )
+        if compiled.target_fields is not None:
+            transformed_data = {
+                k: v for k, v in transformed_data.items()
+                if k in compiled.target_fields
+            }
+        return target_class(**transformed_data)
+
+    @classmethod
+    def _compiled_transform(
+        cls,
+        direction: str,
+        target_class: type
+    ) -> Optional[CompiledTransform]:
+        """
+        Return the cached compiled transformer for this class.
+
+        Returns None (use the generic path) for non-dataclasses, unknown
+        directions, and classes that override a generic-path method.
+        """
+        key = (direction, target_class)
+        cache = cls.__dict__.get('_compiled_transforms')
+        if cache is None:
+            cache = {}
+            cls._compiled_transforms = cache
+        if key not in cache:
+            generic = (
+                direction not in ('forward', 'reverse')
+                or not is_dataclass(cls)
+                or any(
+                    getattr(cls, name) is not getattr(BaseTransformMixin, name)
+                    for name in _GENERIC_HOOKS
+                )
+            )
+            cache[key] = (
+                None if generic
+                else CompiledTransform(cls, direction, target_class)
+            )
+        return cache[key]
+
+    def _transform_generic(
+        self,
+        target_class: Type[T],
+        direction: str,
+        context: Dict
     ) -> T:
         """
         Generic bidirectional transformation logic.
@@ -129,7 +438,7 @@ class BaseTransformMixin(ABC):
         # Only pass fields the target dataclass actually accepts — scope
         # parameters like networkId live in path_params, not in the body.
         if is_dataclass(target_class):
-            valid_fields = {f.name for f in fields(target_class)}
+            valid_fields = dataclass_field_names(target_class)
             transformed_data = {
                 k: v for k, v in transformed_data.items()
                 if k in valid_fields
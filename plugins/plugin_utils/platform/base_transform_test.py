@@ -1,6 +1,6 @@
 """Colocated tests for BaseTransformMixin — core transform engine."""
 
-from dataclasses import dataclass, fields
+from dataclasses import asdict, dataclass, fields
 from typing import Any, Dict, Optional
 
 from .base_transform import BaseTransformMixin
@@ -182,3 +182,162 @@ class TestEdgeCases:
         user = FakeUser(snake_field='z')
         api = user.to_api(None)
         assert api.camelField == 'z'
+
+
+# ── Compiled transformer ──
+
+
+@dataclass
+class Inner:
+    city: Optional[str] = None
+
+
+@dataclass
+class RichUser(BaseTransformMixin):
+    speed: Optional[int] = None
+    address: Optional[Dict[str, Any]] = None
+    label: Optional[str] = None
+    inner: Optional[Inner] = None
+
+    _field_mapping = {
+        'speed': {'api_field': 'speedMbps', 'forward_transform': 'x1000',
+                  'reverse_transform': 'div1000'},
+        'address.city': 'location.city',
+        'label': {'api_field': 'label'},
+        'inner': 'inner',
+    }
+    _transform_registry = {
+        'x1000': lambda v, ctx: v * 1000,
+        'div1000': lambda v, ctx: v // 1000,
+    }
+
+    @classmethod
+    def _get_api_class(cls):
+        return RichAPI
+
+    @classmethod
+    def _get_ansible_class(cls):
+        return cls
+
+
+@dataclass
+class RichAPI(BaseTransformMixin):
+    speedMbps: Optional[int] = None
+    location: Optional[Dict[str, Any]] = None
+    label: Optional[str] = None
+    inner: Optional[Dict[str, Any]] = None
+
+    _field_mapping = RichUser._field_mapping
+    _transform_registry = RichUser._transform_registry
+
+    @classmethod
+    def _get_api_class(cls):
+        return cls
+
+    @classmethod
+    def _get_ansible_class(cls):
+        return RichUser
+
+
+@dataclass
+class CustomNestedUser(FakeUser):
+    def _get_nested(self, data, path):
+        return 'custom'
+
+
+class TestCompiledTransform:
+    """The compiled path gives the same result as the generic one."""
+
+    def _both(self, obj, direction):
+        target = (
+            obj._get_api_class() if direction == 'forward'
+            else obj._get_ansible_class()
+        )
+        return (
+            obj._transform(target, direction, _ctx()),
+            obj._transform_generic(target, direction, _ctx()),
+        )
+
+    def test_forward_matches_generic(self):
+        user = RichUser(speed=2, address={'city': 'Oslo'}, label='x',
+                        inner=Inner(city='Rome'))
+        compiled, generic = self._both(user, 'forward')
+        assert compiled == generic
+        assert compiled.speedMbps == 2000
+        assert compiled.location == {'city': 'Oslo'}
+        assert compiled.inner == {'city': 'Rome'}
+
+    def test_reverse_matches_generic(self):
+        api = RichAPI(speedMbps=3000, location={'city': 'Lima'}, label=None)
+        compiled, generic = self._both(api, 'reverse')
+        assert compiled == generic
+        assert compiled.speed == 3
+        assert compiled.address == {'city': 'Lima'}
+        assert compiled.label is None
+
+    def test_mutable_values_not_shared(self):
+        api = RichAPI(inner={'city': 'Rome', 'tags': ['a']})
+        compiled, generic = self._both(api, 'reverse')
+        assert compiled == generic
+        assert compiled.inner is not api.inner
+        assert compiled.inner['tags'] is not api.inner['tags']
+
+        raw = {'inner': {'city': 'Rome', 'tags': ['a']}}
+        item = RichAPI.to_ansible_many([raw], _ctx())[0]
+        item['inner']['tags'].append('b')
+        assert raw['inner']['tags'] == ['a']
+
+    def test_hook_still_runs(self):
+        api = FakeAPIWithHook(camelField='v')
+        compiled, generic = self._both(api, 'reverse')
+        assert compiled == generic
+        assert compiled.snake_field == 'v_hooked'
+
+    def test_compiled_once_per_class(self):
+        FakeUser(snake_field='a').to_api()
+        first = FakeUser._compiled_transform('forward', FakeAPI)
+        FakeUser(snake_field='b').to_api()
+        assert FakeUser._compiled_transform('forward', FakeAPI) is first
+
+    def test_overridden_hook_uses_generic_path(self):
+        assert CustomNestedUser._compiled_transform('forward', FakeAPI) is None
+        assert CustomNestedUser(snake_field='a').to_api() == FakeAPI(
+            camelField='custom', anotherOne='custom',
+        )
+
+
+class TestToAnsibleMany:
+    """to_ansible_many matches the per-item construct -> to_ansible -> asdict."""
+
+    def _per_item(self, api_cls, items):
+        valid = {f.name for f in fields(api_cls)}
+        return [
+            asdict(api_cls(**{k: v for k, v in i.items() if k in valid}).to_ansible())
+            for i in items
+        ]
+
+    def test_fast_path(self):
+        items = [
+            {'camelField': 'a', 'anotherOne': 1, 'unknownKey': 'x'},
+            {'camelField': None},
+            {},
+        ]
+        assert FakeAPI._batch_transform(FakeUser) is not None
+        assert FakeAPI.to_ansible_many(items) == self._per_item(FakeAPI, items)
+        assert FakeAPI.to_ansible_many(items)[0] == {
+            'snake_field': 'a', 'another_one': 1, 'scope_param': None,
+        }
+
+    def test_transforms_and_nested_paths(self):
+        items = [{'speedMbps': 5000, 'location': {'city': 'Bern'}, 'label': 'l'}]
+        assert RichAPI.to_ansible_many(items) == self._per_item(RichAPI, items)
+
+    def test_hook_class_uses_per_item_path(self):
+        items = [{'camelField': 'v', 'bonus': 'b'}]
+        assert FakeAPIWithHook._batch_transform(FakeUser) is None
+        assert FakeAPIWithHook.to_ansible_many(items) == [
+            {'snake_field': 'v_hooked', 'another_one': None, 'scope_param': None},
+        ]
+
+    def test_empty(self):
+        assert FakeAPI.to_ansible_many([]) == []
@@ -0,0 +1,187 @@
+"""Keyed comparison of ``before`` and ``after`` config lists.
+
+A resource task's ``changed`` flag and its ``--diff`` output both come
+from comparing the ``before`` and ``after`` lists.  Items are matched by
+the resource's match key (``CANONICAL_KEY`` or ``SYSTEM_KEY``) and
+compared by a hash of their canonical JSON, so neither the order of the
+items nor the order of keys inside them matters, and the cost is linear
+in the number of items.  Only the items that differ are reported: a
+1,000-item collection with one changed field gives a one-entry diff.
+
+Lists without a usable key (singletons, items missing the key, or
+duplicate keys) are compared as multisets of content hashes instead.
+"""
+
+import hashlib
+import json
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+
+def canonical(item: Any) -> Any:
+    """*item* without its top-level ``None`` values, which mean "unset"."""
+    if isinstance(item, dict):
+        return {k: v for k, v in item.items() if v is not None}
+    return item
+
+
+def content_hash(item: Any) -> str:
+    """SHA-256 of the canonical JSON of *item* (sorted keys)."""
+    data = json.dumps(
+        canonical(item), sort_keys=True, separators=(',', ':'), default=str,
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def diff_lists(
+    before: List[dict],
+    after: List[dict],
+    key: Optional[str] = None
+) -> dict:
+    """
+    Compare two config lists item by item.
+
+    Args:
+        before: Items before the run
+        after: Items after the run
+        key: Field identifying an item in both lists, or None
+
+    Returns:
+        Dict with ``added`` and ``removed`` (key values, or whole items
+        when the lists are compared without a key) and ``changed``, a
+        list of ``{'key': value, 'fields': {field: {'before': ...,
+        'after': ...}}}``.  All three are empty when nothing differs.
+    """
+    return _diff(before, after, key)[0]
+
+
+def lists_differ(
+    before: List[dict],
+    after: List[dict],
+    key: Optional[str] = None
+) -> bool:
+    """Whether *before* and *after* hold different items."""
+    changes = diff_lists(before, after, key)
+    return bool(changes['added'] or changes['removed'] or changes['changed'])
+
+
+def diff_output(
+    before: List[dict],
+    after: List[dict],
+    key: Optional[str] = None
+) -> dict:
+    """
+    Build the ``diff`` of a task result from the items that differ.
+
+    ``before`` and ``after`` are YAML of the removed and changed items
+    and of the added and changed items, as Ansible renders them with
+    ``--diff``; ``changes`` is the structured form from ``diff_lists``.
+    """
+    changes, old, new = _diff(before, after, key)
+    return {
+        'before': yaml.dump(old, default_flow_style=False, sort_keys=True),
+        'after': yaml.dump(new, default_flow_style=False, sort_keys=True),
+        'before_header': f"before ({len(old)} of {len(before)} items)",
+        'after_header': f"after ({len(new)} of {len(after)} items)",
+        'changes': changes,
+    }
+
+
+def _diff(
+    before: List[dict],
+    after: List[dict],
+    key: Optional[str]
+) -> Tuple[dict, List[dict], List[dict]]:
+    """``(changes, differing before items, differing after items)``."""
+    if key is None and len(before) == 1 and len(after) == 1:
+        # Singleton resource: the one item is compared field by field
+        old, new = before[0], after[0]
+        if content_hash(old) == content_hash(new):
+            return _changes(), [], []
+        return _changes(changed=[_field_deltas(None, old, new)]), [old], [new]
+
+    old_index = _index(before, key)
+    new_index = _index(after, key)
+    if old_index is None or new_index is None:
+        return _unkeyed_diff(before, after)
+
+    changes = _changes()
+    old_items, new_items = [], []
+    for value, old in old_index.items():
+        new = new_index.get(value)
+        if new is None:
+            changes['removed'].append(value)
+            old_items.append(old)
+        elif content_hash(old) != content_hash(new):
+            changes['changed'].append(_field_deltas(value, old, new))
+            old_items.append(old)
+            new_items.append(new)
+    for value, new in new_index.items():
+        if value not in old_index:
+            changes['added'].append(value)
+            new_items.append(new)
+    return changes, old_items, new_items
+
+
+def _index(items: List[dict], key: Optional[str]) -> Optional[Dict[str, dict]]:
+    """Items by ``str(item[key])``; None if any item lacks a unique key."""
+    if key is None:
+        return None
+    index = {}
+    for item in items:
+        value = item.get(key) if isinstance(item, dict) else None
+        if value in (None, '') or str(value) in index:
+            return None
+        index[str(value)] = item
+    return index
+
+
+def _unkeyed_diff(
+    before: List[dict],
+    after: List[dict]
+) -> Tuple[dict, List[dict], List[dict]]:
+    """Compare *before* and *after* as multisets of content hashes."""
+    old_hashes = [content_hash(item) for item in before]
+    new_hashes = [content_hash(item) for item in after]
+    unmatched_old = Counter(old_hashes) - Counter(new_hashes)
+    unmatched_new = Counter(new_hashes) - Counter(old_hashes)
+
+    removed = _take(before, old_hashes, unmatched_old)
+    added = _take(after, new_hashes, unmatched_new)
+    return _changes(added=added, removed=removed), removed, added
+
+
+def _take(items: List[dict], hashes: List[str], wanted: Counter) -> List[dict]:
+    """The items whose hashes are in *wanted*, as many times as counted."""
+    taken = []
+    for item, digest in zip(items, hashes):
+        if wanted[digest] > 0:
+            wanted[digest] -= 1
+            taken.append(item)
+    return taken
+
+
+def _field_deltas(value: Optional[str], old: dict, new: dict) -> dict:
+    """``{'key': value, 'fields': {field: {'before': ..., 'after': ...}}}``."""
+    old, new = canonical(old), canonical(new)
+    fields = {}
+    for name in list(old) + [k for k in new if k not in old]:
+        if name not in new or name not in old or (
+            content_hash(old[name]) != content_hash(new[name])
+        ):
+            fields[name] = {'before': old.get(name), 'after': new.get(name)}
+    return {'key': value, 'fields': fields}
+
+
+def _changes(
+    added: Optional[list] = None,
+    removed: Optional[list] = None,
+    changed: Optional[list] = None
+) -> dict:
+    return {
+        'added': added or [],
+        'removed': removed or [],
+        'changed': changed or [],
+    }
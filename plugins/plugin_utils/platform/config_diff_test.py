@@ -0,0 +1,87 @@
+"""Colocated tests for the keyed before/after comparison."""
+
+import yaml
+
+from .config_diff import content_hash, diff_lists, diff_output, lists_differ
+
+BEFORE = [
+    {'item_id': '1', 'name': 'Alpha', 'tags': ['a', 'b']},
+    {'item_id': '2', 'name': 'Beta', 'rules': {'x': 1, 'y': 2}},
+]
+
+
+class TestContentHash:
+
+    def test_key_order_and_unset_fields_ignored(self):
+        assert content_hash({'a': 1, 'b': {'c': 2, 'd': 3}}) == content_hash(
+            {'b': {'d': 3, 'c': 2}, 'a': 1, 'e': None}
+        )
+
+    def test_values_matter(self):
+        assert content_hash({'a': [1, 2]}) != content_hash({'a': [2, 1]})
+
+
+class TestDiffLists:
+
+    def test_order_does_not_matter(self):
+        after = [
+            {'rules': {'y': 2, 'x': 1}, 'name': 'Beta', 'item_id': '2'},
+            {'tags': ['a', 'b'], 'name': 'Alpha', 'item_id': '1'},
+        ]
+        assert not lists_differ(BEFORE, after, 'item_id')
+
+    def test_added_removed_changed(self):
+        after = [
+            {'item_id': '1', 'name': 'Alpha2', 'tags': ['a', 'b']},
+            {'item_id': '3', 'name': 'Gamma'},
+        ]
+        assert diff_lists(BEFORE, after, 'item_id') == {
+            'added': ['3'],
+            'removed': ['2'],
+            'changed': [{
+                'key': '1',
+                'fields': {'name': {'before': 'Alpha', 'after': 'Alpha2'}},
+            }],
+        }
+
+    def test_key_values_matched_as_strings(self):
+        changes = diff_lists(
+            [{'id': 10, 'name': 'a'}], [{'id': '10', 'name': 'b'}], 'id',
+        )
+        assert changes['added'] == changes['removed'] == []
+        assert changes['changed'][0]['key'] == '10'
+
+    def test_singleton_field_deltas(self):
+        changes = diff_lists([{'a': 1, 'b': 2}], [{'a': 1, 'b': 3}])
+        assert changes['changed'] == [
+            {'key': None, 'fields': {'b': {'before': 2, 'after': 3}}},
+        ]
+
+    def test_duplicate_keys_compared_by_content(self):
+        before = [{'name': 'x', 'v': 1}, {'name': 'x', 'v': 2}]
+        after = [{'name': 'x', 'v': 2}, {'name': 'x', 'v': 3}]
+        assert diff_lists(before, after, 'name') == {
+            'added': [{'name': 'x', 'v': 3}],
+            'removed': [{'name': 'x', 'v': 1}],
+            'changed': [],
+        }
+
+
+class TestDiffOutput:
+
+    def test_large_collection_single_change_stays_small(self):
+        before = [
+            {'item_id': str(i), 'name': f'item-{i}', 'vlan': i % 4094}
+            for i in range(1000)
+        ]
+        after = [dict(item) for item in reversed(before)]
+        after[500]['name'] = 'renamed'
+
+        diff = diff_output(before, after, 'item_id')
+        assert yaml.safe_load(diff['before']) == [before[499]]
+        assert yaml.safe_load(diff['after']) == [after[500]]
+        assert diff['before_header'] == 'before (1 of 1000 items)'
+        assert diff['changes']['changed'] == [{
+            'key': '499',
+            'fields': {'name': {'before': 'item-499', 'after': 'renamed'}},
+        }]
@@ -0,0 +1,101 @@
+"""Content index for matching Category C resources.
+
+Gather-first resources (no ``CANONICAL_KEY``) are matched to the user's
+config by content: an existing item matches a desired one when every
+field the user supplied is equal, compared as strings
+(``BaseResourceActionPlugin._config_matches``).  Scanning every existing
+item for every desired one is O(n·m).
+
+``ContentIndex`` hashes the existing items by the values of the fields a
+desired item supplies.  One table is built per distinct set of supplied
+fields, which is usually one per run, so matching n desired items
+against m existing ones costs about O(n + m).  It returns the same item
+the linear scan would: the first match in candidate order.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+_Fields = Tuple[str, ...]
+
+
+def _values(item: dict, fields: _Fields) -> Tuple[str, ...]:
+    return tuple(str(item.get(name)) for name in fields)
+
+
+class ContentIndex:
+    """
+    Index of candidate resources by their user-supplied field values.
+
+    The candidate list may change while matching: ``add``, ``replace``
+    and ``remove`` keep the index in step, and ``refresh`` re-indexes an
+    item whose fields were updated in place.
+
+    Attributes:
+        matches: Predicate ``(desired, candidate) -> bool`` confirming a
+            match; stale entries (after in-place updates) are skipped
+    """
+
+    def __init__(
+        self,
+        candidates: List[dict],
+        matches: Callable[[dict, dict], bool]
+    ):
+        self.matches = matches
+        self._items: List[Optional[dict]] = list(candidates)
+        self._positions: Dict[int, int] = {
+            id(item): pos for pos, item in enumerate(self._items)
+        }
+        self._tables: Dict[_Fields, Dict[Tuple[str, ...], List[int]]] = {}
+
+    def find(self, desired: dict) -> Optional[dict]:
+        """The first candidate matching every non-None field of *desired*."""
+        fields = tuple(sorted(k for k, v in desired.items() if v is not None))
+        if not fields:
+            return next((item for item in self._items if item is not None), None)
+        bucket = self._table(fields).get(_values(desired, fields), ())
+        found = None
+        for pos in bucket:
+            item = self._items[pos]
+            if (item is not None and (found is None or pos < found)
+                    and self.matches(desired, item)):
+                found = pos
+        return None if found is None else self._items[found]
+
+    def position(self, item: dict) -> int:
+        """Position of candidate *item* in the candidate list."""
+        return self._positions[id(item)]
+
+    def add(self, item: dict) -> None:
+        """Append *item* as the last candidate."""
+        self._items.append(item)
+        self._index(len(self._items) - 1)
+
+    def replace(self, old: dict, new: dict) -> None:
+        """Put *new* in the place of candidate *old*."""
+        pos = self._positions.pop(id(old))
+        self._items[pos] = new
+        self._index(pos)
+
+    def remove(self, item: dict) -> None:
+        """Drop candidate *item*."""
+        self._items[self._positions.pop(id(item))] = None
+
+    def refresh(self, item: dict) -> None:
+        """Re-index candidate *item* after its fields changed in place."""
+        self._index(self._positions[id(item)])
+
+    def _table(self, fields: _Fields) -> Dict[Tuple[str, ...], List[int]]:
+        table = self._tables.get(fields)
+        if table is None:
+            table = {}
+            for pos, item in enumerate(self._items):
+                if item is not None:
+                    table.setdefault(_values(item, fields), []).append(pos)
+            self._tables[fields] = table
+        return table
+
+    def _index(self, pos: int) -> None:
+        item = self._items[pos]
+        self._positions[id(item)] = pos
+        for fields, table in self._tables.items():
+            table.setdefault(_values(item, fields), []).append(pos)
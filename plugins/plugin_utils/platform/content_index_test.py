@@ -0,0 +1,60 @@
+"""Colocated tests for the Category C content index."""
+
+from .content_index import ContentIndex
+
+
+def _matches(desired, current):
+    return all(
+        str(v) == str(current.get(k)) for k, v in desired.items() if v is not None
+    )
+
+
+def _scan(desired, candidates):
+    return next((c for c in candidates if _matches(desired, c)), None)
+
+
+CANDIDATES = [
+    {'id': 'a', 'name': 'web', 'port': 80},
+    {'id': 'b', 'name': 'web', 'port': 443},
+    {'id': 'c', 'name': 'dns', 'port': 53},
+    {'id': 'd', 'name': 'web', 'port': 80},
+]
+
+
+class TestContentIndex:
+
+    def test_same_result_as_scan(self):
+        index = ContentIndex(CANDIDATES, _matches)
+        for desired in (
+            {'name': 'web'}, {'name': 'web', 'port': '443'}, {'port': 80},
+            {'name': 'dns', 'port': None}, {'name': 'ntp'}, {},
+        ):
+            assert index.find(desired) is _scan(desired, CANDIDATES)
+
+    def test_remove_and_add(self):
+        index = ContentIndex(CANDIDATES, _matches)
+        index.remove(CANDIDATES[0])
+        assert index.find({'port': 80}) is CANDIDATES[3]
+        new = {'id': 'e', 'name': 'ntp', 'port': 123}
+        index.add(new)
+        assert index.find({'name': 'ntp'}) is new
+        assert index.position(new) == 4
+
+    def test_replace_keeps_position(self):
+        items = [dict(c) for c in CANDIDATES]
+        index = ContentIndex(items, _matches)
+        assert index.find({'name': 'dns'}) is items[2]
+        new = {'name': 'web', 'port': 80}
+        index.replace(items[2], new)
+        assert index.find({'name': 'dns'}) is None
+        assert index.find({'name': 'web', 'port': 80}) is items[0]
+        assert index.position(new) == 2
+
+    def test_refresh_after_in_place_update(self):
+        items = [dict(c) for c in CANDIDATES]
+        index = ContentIndex(items, _matches)
+        assert index.find({'name': 'dns'}) is items[2]
+        items[0]['name'] = 'dns'
+        index.refresh(items[0])
+        assert index.find({'name': 'dns'}) is items[0]
+        assert index.find({'name': 'web'}) is items[1]
@@ -12,6 +12,7 @@ from typing import Type, Tuple, Optional, Dict
 import logging
 
 from .base_transform import BaseTransformMixin
+from .operation_plan import OperationPlan
 from .registry import APIVersionRegistry
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,7 @@ class DynamicClassLoader:
     Attributes:
         registry: APIVersionRegistry for version discovery
         class_cache: Cache of loaded classes to avoid repeated imports
+        plan_cache: Cache of compiled operation plans per (mixin, operation)
         collection_prefix: Import path prefix for the collection
     """
 
@@ -63,6 +65,7 @@ class DynamicClassLoader:
         """
         self.registry = registry
         self._class_cache: Dict[str, Tuple[Type, Type, Type]] = {}
+        self._plan_cache: Dict[Tuple[Type, str], OperationPlan] = {}
         self.collection_prefix = collection_prefix or _COLLECTION_PREFIX
 
     def load_classes_for_module(
@@ -108,6 +111,35 @@ class DynamicClassLoader:
 
         return result
 
+    def load_operation_plan(
+        self,
+        mixin_class: Type,
+        operation: str
+    ) -> OperationPlan:
+        """
+        Load the compiled endpoint operation plan for a mixin.
+
+        Plans are compiled on first use and cached for the life of the
+        loader (i.e. of the manager).
+
+        Args:
+            mixin_class: Transform mixin returned by load_classes_for_module
+            operation: Operation type ('create', 'update', 'delete', 'find')
+
+        Returns:
+            OperationPlan (empty if the mixin defines no such endpoints)
+        """
+        key = (mixin_class, operation)
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            plan = OperationPlan.for_mixin(mixin_class, operation)
+            self._plan_cache[key] = plan
+            logger.debug(
+                f"Compiled {operation} plan for {mixin_class.__name__}: "
+                f"{plan.names()}"
+            )
+        return plan
+
     def _load_user_class(self, module_name: str) -> Type:
         """
         Load stable User Model dataclass from user_models/.
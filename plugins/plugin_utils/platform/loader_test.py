@@ -98,3 +98,22 @@ class TestLoadClassesForModule:
         assert user_cls.__name__ == 'UserVlan'
         assert 'APIVlan' in api_cls.__name__
         assert 'TransformMixin' in mixin_cls.__name__
+
+
+class TestOperationPlanCache:
+    """load_operation_plan compiles once per (mixin, operation)."""
+
+    def test_cached(self):
+        calls = []
+
+        class Mixin:
+            @classmethod
+            def get_endpoint_operations(cls):
+                calls.append(1)
+                return {}
+
+        dcl = loader.DynamicClassLoader(registry=None)
+        first = dcl.load_operation_plan(Mixin, 'find')
+        assert dcl.load_operation_plan(Mixin, 'find') is first
+        assert dcl.load_operation_plan(Mixin, 'create') is not first
+        assert len(calls) == 2
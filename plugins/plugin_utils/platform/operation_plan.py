@@ -0,0 +1,230 @@
+"""Compiled endpoint operation plans.
+
+A transform mixin describes its endpoints through
+``get_endpoint_operations()``, which builds a fresh dict of
+``EndpointOperation`` dataclasses on every call.  Executing a resource
+operation used to re-filter that dict, re-run the dependency sort and
+fill each path template with repeated ``str.replace``.
+
+An ``OperationPlan`` does all of that once per (mixin, operation) and is
+cached by ``DynamicClassLoader``.  It holds:
+
+- the operations in execution order (dependencies, then ``order``);
+- the same operations grouped into waves that may run concurrently;
+- each path template split into literal and parameter segments;
+- for each path parameter, the names to look up, aliases included;
+- the request body field names.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from .types import EndpointOperation
+
+_PARAM_RE = re.compile(r'\{(\w+)\}')
+
+
+def sort_operations(operations: Dict[str, EndpointOperation]) -> List[str]:
+    """
+    Sort operation names by dependencies, then by ``order``.
+
+    Raises:
+        ValueError: If the dependencies are circular
+    """
+    sorted_ops: List[str] = []
+    remaining = dict(operations)
+
+    while remaining:
+        ready = [
+            name for name, op in remaining.items()
+            if op.depends_on is None or op.depends_on in sorted_ops
+        ]
+
+        if not ready:
+            raise ValueError(
+                f"Circular dependency in operations: "
+                f"{list(remaining.keys())}"
+            )
+
+        ready.sort(key=lambda name: remaining[name].order)
+        sorted_ops.append(ready[0])
+        remaining.pop(ready[0])
+
+    return sorted_ops
+
+
+class CompiledOperation:
+    """
+    One endpoint operation with its path template pre-parsed.
+
+    Attributes:
+        name: Operation name (e.g., 'create', 'find')
+        op: The source EndpointOperation
+        method: HTTP method
+        fields: Request body field names
+        segments: Path split into literals (str) and parameter indexes (int)
+        param_sources: Per path parameter, ``(param, names to look up)``
+        resolvable: False when the template has undeclared parameters
+    """
+
+    __slots__ = (
+        'name', 'op', 'method', 'fields', 'segments',
+        'param_sources', 'resolvable',
+    )
+
+    def __init__(self, name: str, op: EndpointOperation):
+        self.name = name
+        self.op = op
+        self.method = op.method
+        self.fields: Tuple[str, ...] = tuple(op.fields or ())
+
+        path_params = list(op.path_params or ())
+        aliases = op.path_param_aliases or {}
+        self.param_sources: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (param, (param, *aliases.get(param, ()))) for param in path_params
+        )
+
+        index = {param: i for i, param in enumerate(path_params)}
+        segments: List[Any] = []
+        self.resolvable = True
+        pos = 0
+        for match in _PARAM_RE.finditer(op.path):
+            if match.start() > pos:
+                segments.append(op.path[pos:match.start()])
+            param = match.group(1)
+            if param in index:
+                segments.append(index[param])
+            else:
+                self.resolvable = False
+            pos = match.end()
+        if pos < len(op.path):
+            segments.append(op.path[pos:])
+        self.segments: Tuple[Any, ...] = tuple(segments)
+
+    def resolve_path(
+        self,
+        api_data: dict,
+        user_data: dict,
+        results: dict
+    ) -> Optional[str]:
+        """
+        Fill the path template.
+
+        Each parameter is taken from an earlier operation's result, else
+        from the API data or User Model data, first by name and then by
+        alias.
+
+        Returns:
+            The resolved path, or None if a parameter is missing
+        """
+        if not self.resolvable:
+            return None
+        values = []
+        for param, names in self.param_sources:
+            if param in results:
+                r = results[param]
+                val = r.get('id', r) if isinstance(r, dict) else r
+            else:
+                val = None
+                for name in names:
+                    val = api_data.get(name) or user_data.get(name)
+                    if val is not None:
+                        break
+            if val is None:
+                return None
+            values.append(str(val))
+        return ''.join(
+            values[s] if isinstance(s, int) else s for s in self.segments
+        )
+
+    def build_body(self, api_data: dict, user_data: dict) -> dict:
+        """Request body from the op's fields, preferring API data."""
+        body = {}
+        for name in self.fields:
+            val = api_data.get(name)
+            if val is None:
+                val = user_data.get(name)
+            if val is not None:
+                body[name] = val
+        return body
+
+
+class OperationPlan:
+    """
+    Execution-ready endpoint operations for one (mixin, operation).
+
+    Attributes:
+        operation: Operation type the plan is for ('create', 'find', ...)
+        ops: Compiled operations in execution order
+        waves: ``ops`` grouped into consecutive waves.  Ops in one wave
+            share an ``order`` and do not depend on each other, so they
+            may run concurrently; each wave starts after the previous
+            one has finished.
+    """
+
+    __slots__ = ('operation', 'ops', 'waves', '_by_name')
+
+    def __init__(
+        self,
+        operation: str,
+        operations: Dict[str, EndpointOperation]
+    ):
+        """
+        Compile *operations*.
+
+        Args:
+            operation: Operation type ('create', 'update', 'delete', 'find')
+            operations: Endpoint operations already filtered for *operation*
+
+        Raises:
+            ValueError: If the dependencies are circular
+        """
+        self.operation = operation
+        self.ops: Tuple[CompiledOperation, ...] = tuple(
+            CompiledOperation(name, operations[name])
+            for name in sort_operations(operations)
+        )
+        self._by_name = {c.name: c for c in self.ops}
+
+        waves: List[List[CompiledOperation]] = []
+        for compiled in self.ops:
+            current = waves[-1] if waves else None
+            if (current is None
+                    or current[0].op.order != compiled.op.order
+                    or any(c.name == compiled.op.depends_on for c in current)):
+                waves.append([compiled])
+            else:
+                current.append(compiled)
+        self.waves: Tuple[Tuple[CompiledOperation, ...], ...] = tuple(
+            tuple(w) for w in waves
+        )
+
+    @classmethod
+    def for_mixin(cls, mixin_class: type, operation: str) -> 'OperationPlan':
+        """Compile the plan for *operation* from a transform mixin."""
+        all_ops = {}
+        if hasattr(mixin_class, 'get_endpoint_operations'):
+            all_ops = mixin_class.get_endpoint_operations()
+        return cls(operation, {
+            name: op for name, op in all_ops.items()
+            if op.required_for is None or op.required_for == operation
+        })
+
+    def __bool__(self) -> bool:
+        return bool(self.ops)
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def __iter__(self):
+        return iter(self.ops)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __getitem__(self, name: str) -> CompiledOperation:
+        return self._by_name[name]
+
+    def names(self) -> List[str]:
+        """Operation names in execution order."""
+        return [c.name for c in self.ops]
@@ -0,0 +1,117 @@
+"""Colocated tests for compiled operation plans."""
+
+import pytest
+
+from .operation_plan import OperationPlan, sort_operations
+from .types import EndpointOperation
+
+
+def _op(path, method='GET', **kwargs):
+    kwargs.setdefault('fields', [])
+    return EndpointOperation(path=path, method=method, **kwargs)
+
+
+class TestSortOperations:
+    """Dependencies first, then ``order``."""
+
+    def test_order(self):
+        ops = {'b': _op('/b', order=2), 'a': _op('/a', order=1)}
+        assert sort_operations(ops) == ['a', 'b']
+
+    def test_depends_on_beats_order(self):
+        ops = {
+            'child': _op('/c', order=1, depends_on='parent'),
+            'parent': _op('/p', order=5),
+        }
+        assert sort_operations(ops) == ['parent', 'child']
+
+    def test_circular(self):
+        ops = {
+            'a': _op('/a', depends_on='b'),
+            'b': _op('/b', depends_on='a'),
+        }
+        with pytest.raises(ValueError, match='Circular'):
+            sort_operations(ops)
+
+
+class TestCompiledOperation:
+    """Path templates and bodies resolve like the old str.replace loop."""
+
+    def _compiled(self, **kwargs):
+        op = _op(
+            '/networks/{networkId}/appliance/vlans/{vlanId}', 'PUT',
+            path_params=['networkId', 'vlanId'],
+            path_param_aliases={'vlanId': ['vlan_id', 'id']},
+            **kwargs,
+        )
+        return OperationPlan('update', {'update': op})['update']
+
+    def test_resolve_from_api_data_and_alias(self):
+        compiled = self._compiled()
+        assert compiled.resolve_path(
+            {'networkId': 'N1'}, {'vlan_id': 10}, {},
+        ) == '/networks/N1/appliance/vlans/10'
+
+    def test_result_of_earlier_op_wins(self):
+        compiled = self._compiled()
+        assert compiled.resolve_path(
+            {'networkId': 'N1', 'vlanId': '1'}, {}, {'vlanId': {'id': '7'}},
+        ) == '/networks/N1/appliance/vlans/7'
+
+    def test_missing_param(self):
+        assert self._compiled().resolve_path({'networkId': 'N1'}, {}, {}) is None
+
+    def test_undeclared_template_param(self):
+        plan = OperationPlan('find', {
+            'find': _op('/networks/{networkId}/x/{xId}', path_params=['networkId']),
+        })
+        assert not plan['find'].resolvable
+        assert plan['find'].resolve_path({'networkId': 'N1', 'xId': 1}, {}, {}) is None
+
+    def test_body_prefers_api_data(self):
+        compiled = self._compiled(fields=['name', 'subnet', 'mask'])
+        assert compiled.build_body(
+            {'name': 'api', 'subnet': None},
+            {'name': 'user', 'subnet': '10.0.0.0/24'},
+        ) == {'name': 'api', 'subnet': '10.0.0.0/24'}
+
+
+class TestOperationPlan:
+    """Plans are filtered by operation and ordered."""
+
+    class Mixin:
+        @classmethod
+        def get_endpoint_operations(cls):
+            return {
+                'find': _op('/x/{id}', path_params=['id'], required_for='find', order=2),
+                'find_all': _op('/x', required_for='find', order=1),
+                'create': _op('/x', 'POST', required_for='create'),
+            }
+
+    def test_for_mixin(self):
+        plan = OperationPlan.for_mixin(self.Mixin, 'find')
+        assert plan.names() == ['find_all', 'find']
+        assert 'create' not in plan
+        assert len(plan) == 2
+
+    def test_empty(self):
+        assert not OperationPlan.for_mixin(object, 'delete')
+
+
+class TestWaves:
+    """Independent ops with the same ``order`` share a wave."""
+
+    def test_grouping(self):
+        plan = OperationPlan('update', {
+            'rules_a': _op('/a', 'PUT', order=1),
+            'rules_b': _op('/b', 'PUT', order=1),
+            'child': _op('/c', 'PUT', order=1, depends_on='rules_a'),
+            'last': _op('/d', 'PUT', order=2),
+        })
+        assert [[c.name for c in w] for w in plan.waves] == [
+            ['rules_a', 'rules_b'], ['child'], ['last'],
+        ]
+
+    def test_single_op(self):
+        plan = OperationPlan('create', {'create': _op('/x', 'POST')})
+        assert [[c.name for c in w] for w in plan.waves] == [['create']]
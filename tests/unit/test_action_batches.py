@@ -0,0 +1,147 @@
+"""Unit tests for routing action plugin mutations through action batches.
+
+Checks that _apply_* collect their create/update/delete calls in order
+and hand them to the manager as a single execute_batch() call when
+``meraki_action_batches`` is enabled.  No Ansible runtime required.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import pytest
+from ansible.errors import AnsibleError
+
+from plugins.action.base_action import BaseResourceActionPlugin
+
+
+@dataclass
+class FakeUser:
+    network_id: Optional[str] = None
+    item_id: Optional[str] = None
+    name: Optional[str] = None
+
+
+class FakePlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'test_resource'
+    SCOPE_PARAM = 'network_id'
+    CANONICAL_KEY = 'item_id'
+    SUPPORTS_DELETE = True
+
+
+class RecordingManager:
+    def __init__(self):
+        self.calls = []
+
+    def execute_many(self, operations):
+        return [
+            {'result': self.execute(op, module_name, user_data)}
+            for op, module_name, user_data in operations
+        ]
+
+    def execute(self, op, module_name, user_data):
+        self.calls.append(('execute', op, asdict(user_data)))
+        return {}
+
+    def execute_batch(self, module_name, mutations):
+        self.calls.append((
+            'execute_batch',
+            [(op, asdict(data)) for op, data in mutations],
+        ))
+        return {'batched': True, 'actions': len(mutations), 'batches': ['b1']}
+
+
+BEFORE = [
+    {'item_id': '1', 'name': 'Alpha'},
+    {'item_id': '2', 'name': 'Beta'},
+    {'item_id': '3', 'name': 'Gamma'},
+]
+
+
+@pytest.fixture
+def plugin():
+    return FakePlugin.__new__(FakePlugin)
+
+
+@pytest.fixture
+def manager():
+    return RecordingManager()
+
+
+class TestApplyMutations:
+
+    def test_disabled_executes_individually(self, plugin, manager):
+        config = [{'item_id': '1', 'name': 'A2'}, {'item_id': '4', 'name': 'D'}]
+        plugin._apply_merged_or_replaced(
+            manager, FakeUser, 'N1', config, 'replaced', BEFORE,
+        )
+        assert [c[:2] for c in manager.calls] == [
+            ('execute', 'replace'), ('execute', 'create'),
+        ]
+
+    def test_overridden_batches_deletes_then_writes(self, plugin, manager):
+        plugin._action_batches = True
+        config = [{'item_id': '1', 'name': 'A2'}, {'item_id': '4', 'name': 'D'}]
+        plugin._apply_overridden(manager, FakeUser, 'N1', config, BEFORE)
+
+        assert len(manager.calls) == 1
+        kind, mutations = manager.calls[0]
+        assert kind == 'execute_batch'
+        assert [(op, d['item_id']) for op, d in mutations] == [
+            ('delete', '2'), ('delete', '3'), ('replace', '1'), ('create', '4'),
+        ]
+        assert all(d['network_id'] == 'N1' for _, d in mutations)
+
+    def test_deleted_batches(self, plugin, manager):
+        plugin._action_batches = True
+        plugin._apply_deleted(
+            manager, FakeUser, 'N1',
+            [{'item_id': '1'}, {'item_id': '2'}, {'item_id': '9'}], BEFORE,
+        )
+        kind, mutations = manager.calls[0]
+        assert kind == 'execute_batch'
+        assert [d['item_id'] for _, d in mutations] == ['1', '2']
+
+    def test_single_mutation_not_batched(self, plugin, manager):
+        plugin._action_batches = True
+        plugin._apply_merged_or_replaced(
+            manager, FakeUser, 'N1', [{'item_id': '1', 'name': 'A2'}],
+            'merged', BEFORE,
+        )
+        assert manager.calls == [
+            ('execute', 'update', {'network_id': 'N1', 'item_id': '1', 'name': 'A2'}),
+        ]
+
+    def test_no_op_sends_nothing(self, plugin, manager):
+        plugin._action_batches = True
+        plugin._apply_merged_or_replaced(
+            manager, FakeUser, 'N1', [{'item_id': '1', 'name': 'Alpha'}],
+            'merged', BEFORE,
+        )
+        assert manager.calls == []
+
+    def test_disabled_sends_one_execute_many(self, plugin, manager):
+        sent = []
+        manager.execute_many = lambda ops: sent.append(ops) or [
+            {'result': {}} for _ in ops
+        ]
+        config = [{'item_id': '1', 'name': 'A2'}, {'item_id': '4', 'name': 'D'}]
+        plugin._apply_merged_or_replaced(
+            manager, FakeUser, 'N1', config, 'merged', BEFORE,
+        )
+        assert len(sent) == 1
+        assert [(op, module) for op, module, _ in sent[0]] == [
+            ('update', 'test_resource'), ('create', 'test_resource'),
+        ]
+
+    def test_item_error_raises(self, plugin, manager):
+        manager.execute_many = lambda ops: [
+            {'error': '400 Bad Request', 'error_type': 'HTTPError'},
+            {'skipped': True},
+        ]
+        config = [{'item_id': '1', 'name': 'A2'}, {'item_id': '4', 'name': 'D'}]
+        with pytest.raises(AnsibleError, match='test_resource update failed: 400'):
+            plugin._apply_merged_or_replaced(
+                manager, FakeUser, 'N1', config, 'merged', BEFORE,
+            )
@@ -0,0 +1,132 @@
+"""Unit tests for deriving ``after`` from mutation responses.
+
+Covers BaseResourceActionPlugin._after_from_responses(): patching
+``before`` with create/update responses and deletes, and every case that
+must fall back to a full re-gather (return None).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from plugins.action.base_action import BaseResourceActionPlugin
+
+
+@dataclass
+class FakeUser:
+    network_id: Optional[str] = None
+    name: Optional[str] = None
+    item_id: Optional[str] = None
+    enabled: Optional[bool] = None
+
+
+class CanonicalPlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'test_resource'
+    CANONICAL_KEY = 'name'
+    SYSTEM_KEY = 'item_id'
+
+
+class SingletonPlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'test_singleton'
+    CANONICAL_KEY = None
+    SUPPORTS_DELETE = False
+
+
+@pytest.fixture
+def plugin():
+    return CanonicalPlugin.__new__(CanonicalPlugin)
+
+
+@pytest.fixture
+def singleton():
+    return SingletonPlugin.__new__(SingletonPlugin)
+
+
+BEFORE = [
+    {'name': 'Alpha', 'item_id': '1', 'enabled': True},
+    {'name': 'Beta', 'item_id': '2', 'enabled': False},
+]
+
+
+class TestPatchBefore:
+
+    def test_no_mutations_keeps_before(self, plugin):
+        assert plugin._after_from_responses(BEFORE, []) == BEFORE
+
+    def test_update_replaces_in_place(self, plugin):
+        updated = {'name': 'Beta', 'item_id': '2', 'enabled': True}
+        after = plugin._after_from_responses(BEFORE, [
+            ('update', FakeUser(name='Beta', enabled=True), updated),
+        ])
+        assert after == [BEFORE[0], updated]
+        assert BEFORE[1]['enabled'] is False
+
+    def test_rename_matched_by_system_key(self, plugin):
+        renamed = {'name': 'Gamma', 'item_id': '1', 'enabled': True}
+        after = plugin._after_from_responses(BEFORE, [
+            ('update', FakeUser(name='Gamma', item_id='1'), renamed),
+        ])
+        assert after == [renamed, BEFORE[1]]
+
+    def test_create_appends(self, plugin):
+        created = {'name': 'Delta', 'item_id': '9', 'enabled': True}
+        after = plugin._after_from_responses(BEFORE, [
+            ('create', FakeUser(name='Delta'), created),
+        ])
+        assert after == BEFORE + [created]
+
+    def test_delete_removes(self, plugin):
+        after = plugin._after_from_responses(BEFORE, [
+            ('delete', FakeUser(name='Alpha', item_id='1'), {}),
+        ])
+        assert after == [BEFORE[1]]
+
+    def test_overridden_sequence(self, plugin):
+        created = {'name': 'Delta', 'item_id': '9', 'enabled': True}
+        after = plugin._after_from_responses(BEFORE, [
+            ('delete', FakeUser(name='Alpha', item_id='1'), {}),
+            ('delete', FakeUser(name='Beta', item_id='2'), {}),
+            ('create', FakeUser(name='Delta'), created),
+        ])
+        assert after == [created]
+
+    def test_singleton_update(self, singleton):
+        before = [{'name': 'Old', 'enabled': False}]
+        result = {'name': 'New', 'enabled': False}
+        assert singleton._after_from_responses(
+            before, [('update', FakeUser(name='New'), result)],
+        ) == [result]
+
+
+class TestFallBackToGather:
+
+    def test_batched(self, plugin):
+        assert plugin._after_from_responses(BEFORE, None) is None
+
+    def test_model_opt_out(self, plugin):
+        plugin.AFTER_FROM_RESPONSES = False
+        assert plugin._after_from_responses(BEFORE, []) is None
+
+    def test_empty_response(self, plugin):
+        assert plugin._after_from_responses(BEFORE, [
+            ('update', FakeUser(name='Beta'), {}),
+        ]) is None
+
+    def test_response_without_key(self, plugin):
+        assert plugin._after_from_responses(BEFORE, [
+            ('create', FakeUser(name='Delta'), {'enabled': True}),
+        ]) is None
+
+    def test_delete_of_unknown_resource(self, plugin):
+        assert plugin._after_from_responses(BEFORE, [
+            ('delete', FakeUser(name='Zed', item_id='77'), {}),
+        ]) is None
+
+    def test_keyless_with_several_entries(self, singleton):
+        before = [{'name': 'a'}, {'name': 'b'}]
+        assert singleton._after_from_responses(before, [
+            ('update', FakeUser(name='c'), {'name': 'c'}),
+        ]) is None
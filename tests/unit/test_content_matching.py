@@ -0,0 +1,129 @@
+"""Unit tests for Category C (content-matched) resources at scale.
+
+Gather-first resources have no canonical key, so desired items are
+matched to existing ones by their user-supplied fields.  The matching
+goes through a per-run ``ContentIndex``; these tests check the results
+and that 5,000 desired items against 5,000 existing ones cost a linear
+number of ``_config_matches`` comparisons (a scan per item makes tens
+of millions).  Wall-clock timings are in
+``tools/benchmarks/content_matching.py``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from plugins.action.base_action import BaseResourceActionPlugin
+
+SIZE = 5000
+# _config_matches calls allowed per existing + desired item for one
+# 5k x 5k operation; a scan per desired item needs about SIZE / 2.
+CALLS_PER_ITEM = 2
+
+
+@dataclass
+class FakeRule:
+    network_id: Optional[str] = None
+    rule_id: Optional[str] = None
+    name: Optional[str] = None
+    cidr: Optional[str] = None
+    policy: Optional[str] = None
+
+
+class CatCPlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'test_rule'
+    SCOPE_PARAM = 'network_id'
+    CANONICAL_KEY = None
+    SYSTEM_KEY = 'rule_id'
+    SUPPORTS_DELETE = True
+
+
+class CountingPlugin(CatCPlugin):
+    """Counts content comparisons, including those of its ContentIndex."""
+
+    calls = 0
+
+    def _config_matches(self, desired, current):
+        self.calls += 1
+        return CatCPlugin._config_matches(desired, current)
+
+
+def _rule(i, **extra):
+    return {
+        'name': f'rule-{i}', 'cidr': f'10.{i >> 8}.{i & 255}.0/24',
+        'policy': 'allow', **extra,
+    }
+
+
+BEFORE = [_rule(i, rule_id=str(i)) for i in range(SIZE)]
+# Same rules, in reverse order, without the system key
+DESIRED = [_rule(i) for i in reversed(range(SIZE))]
+
+
+@pytest.fixture
+def plugin():
+    return CountingPlugin.__new__(CountingPlugin)
+
+
+def _linear(plugin, func, *args):
+    """Run *func*, checking it compared about O(n + m) item pairs."""
+    plugin.calls = 0
+    result = func(*args)
+    budget = CALLS_PER_ITEM * (len(BEFORE) + len(DESIRED))
+    assert plugin.calls <= budget, (
+        f"{func.__name__} made {plugin.calls} comparisons"
+    )
+    return result
+
+
+class TestSmall:
+    """Behaviour matches the documented Category C rules."""
+
+    def test_replaced_content_then_positional(self, plugin):
+        before = [_rule(1, rule_id='1'), _rule(2, rule_id='2')]
+        config = [_rule(2), {'name': 'new', 'policy': 'deny'}]
+        after = plugin._predict_after('replaced', before, config)
+        assert after == [{'name': 'new', 'policy': 'deny'}, _rule(2)]
+
+    def test_merged_updates_matched_item(self, plugin):
+        before = [_rule(1, rule_id='1')]
+        after = plugin._predict_after(
+            'merged', before, [{'name': 'rule-1', 'policy': 'allow'}],
+        )
+        assert after == before
+
+    def test_deleted_removes_each_match_once(self, plugin):
+        before = [_rule(1, rule_id='1'), _rule(1, rule_id='2')]
+        after = plugin._predict_after('deleted', before, [_rule(1)])
+        assert after == [before[1]]
+
+
+class TestScale:
+    """5,000 existing and 5,000 desired items."""
+
+    def test_plan_overridden_finds_every_match(self, plugin):
+        mutations = _linear(
+            plugin, plugin._plan_overridden, FakeRule, 'N1', DESIRED, BEFORE,
+        )
+        assert mutations == []
+
+    def test_plan_replaced_finds_every_match(self, plugin):
+        mutations = _linear(
+            plugin, plugin._plan_merged_or_replaced,
+            FakeRule, 'N1', DESIRED, 'replaced', BEFORE,
+        )
+        assert mutations == []
+
+    def test_predict_states(self, plugin):
+        predict = plugin._predict_after
+        merged = _linear(plugin, predict, 'merged', BEFORE, DESIRED)
+        assert not plugin._lists_differ(BEFORE, merged)
+
+        replaced = _linear(plugin, predict, 'replaced', BEFORE, DESIRED)
+        assert len(replaced) == SIZE
+
+        deleted = _linear(plugin, predict, 'deleted', BEFORE, DESIRED)
+        assert deleted == []
@@ -0,0 +1,80 @@
+"""Unit tests for how the action plugin plans gathered reads.
+
+A handful of keyed items are looked up one by one; beyond
+ITEM_LOOKUP_LIMIT, one collection listing is filtered locally.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import pytest
+
+from plugins.action.base_action import BaseResourceActionPlugin
+
+
+@dataclass
+class FakeUser:
+    network_id: Optional[str] = None
+    item_id: Optional[str] = None
+    name: Optional[str] = None
+
+
+class FakePlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'test_resource'
+    SCOPE_PARAM = 'network_id'
+    CANONICAL_KEY = 'item_id'
+
+
+LISTING = [{'item_id': str(i), 'name': f'n{i}'} for i in range(1, 8)]
+
+
+class ListingManager:
+    def __init__(self):
+        self.finds = []
+
+    def execute_many(self, operations):
+        return [
+            {'result': self.execute(op, module_name, user_data)}
+            for op, module_name, user_data in operations
+        ]
+
+    def execute(self, op, module_name, user_data):
+        data = asdict(user_data)
+        self.finds.append(data.get('item_id'))
+        if data.get('item_id'):
+            return {'config': [
+                r for r in LISTING if r['item_id'] == data['item_id']
+            ]}
+        return {'config': list(LISTING)}
+
+
+@pytest.fixture
+def plugin():
+    return FakePlugin.__new__(FakePlugin)
+
+
+@pytest.fixture
+def manager():
+    return ListingManager()
+
+
+class TestGatherPlan:
+
+    def test_few_items_looked_up_individually(self, plugin, manager):
+        config = [{'item_id': '2'}, {'item_id': '5'}]
+        result = plugin._do_gathered(manager, FakeUser, 'N1', config)
+        assert manager.finds == ['2', '5']
+        assert [r['item_id'] for r in result] == ['2', '5']
+
+    def test_many_items_use_one_listing(self, plugin, manager):
+        config = [{'item_id': k} for k in ('6', '1', '99', '3', '4')]
+        result = plugin._do_gathered(manager, FakeUser, 'N1', config)
+        assert manager.finds == [None]
+        assert [r['item_id'] for r in result] == ['6', '1', '3', '4']
+
+    def test_unkeyed_item_keeps_individual_lookups(self, plugin, manager):
+        config = [{'item_id': k} for k in ('1', '2', '3')] + [{'name': 'n4'}]
+        plugin._do_gathered(manager, FakeUser, 'N1', config)
+        assert manager.finds == ['1', '2', '3', None]
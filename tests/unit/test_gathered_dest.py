@@ -0,0 +1,56 @@
+"""Unit tests for ``gathered_dest``: gathered items spooled to a file."""
+
+from __future__ import annotations
+
+import os
+
+from plugins.action.base_action import BaseResourceActionPlugin
+from plugins.plugin_utils.manager.spool import Spool
+
+
+class FakePlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'admin'
+
+
+class FakeManager:
+    """Writes *items* the way PlatformService.gather_to_file does."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+
+    def gather_to_file(self, module_name, queries, path, fields=None):
+        self.calls.append((module_name, queries, path, fields))
+        with Spool(path, fields) as spool:
+            spool.write(self.items)
+        return spool.summary()
+
+
+def _plugin():
+    return FakePlugin.__new__(FakePlugin)
+
+
+class TestGatherToFile:
+    """The task result carries the file summary, not the items."""
+
+    def test_relative_path_made_absolute(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = FakeManager([{'email': 'a@x'}])
+        written, changed = _plugin()._gather_to_file(
+            manager, [{'organization_id': 'O1'}], 'admins.jsonl', ['email'],
+        )
+        assert manager.calls[0][0] == 'admin'
+        assert manager.calls[0][2] == os.path.join(str(tmp_path), 'admins.jsonl')
+        assert written['count'] == 1
+        assert changed is True
+
+    def test_unchanged_when_content_identical(self, tmp_path):
+        dest = str(tmp_path / 'admins.jsonl.gz')
+        manager = FakeManager([{'email': 'a@x'}])
+        _plugin()._gather_to_file(manager, [{}], dest)
+        _, changed = _plugin()._gather_to_file(manager, [{}], dest)
+        assert changed is False
+
+        manager.items.append({'email': 'b@x'})
+        written, changed = _plugin()._gather_to_file(manager, [{}], dest)
+        assert changed is True and written['count'] == 2
@@ -41,8 +41,6 @@ if _tools_dir not in sys.path:
 from requests_flask_adapter import Session as FlaskSession
 from mock_server.server import create_app
 from plugins.plugin_utils.manager.platform_manager import PlatformService
-from plugins.plugin_utils.platform.registry import APIVersionRegistry
-from plugins.plugin_utils.platform.loader import DynamicClassLoader
 
 
 # ---------------------------------------------------------------------------
@@ -50,19 +48,9 @@ from plugins.plugin_utils.platform.loader import DynamicClassLoader
 # ---------------------------------------------------------------------------
 
 def _make_service() -> PlatformService:
-    svc = PlatformService.__new__(PlatformService)
-    svc.base_url = "http://mock-meraki"
-    svc.api_key = "test-key"
-    svc.session = FlaskSession()
-    svc.session.headers.update({
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    })
-    svc.api_version = "1"
-    svc.cache = {}
-    svc.registry = APIVersionRegistry()
-    svc.loader = DynamicClassLoader(svc.registry)
-    return svc
+    return PlatformService(
+        "http://mock-meraki", "test-key", session_factory=FlaskSession,
+    )
 
 
 @pytest.fixture(scope="module")
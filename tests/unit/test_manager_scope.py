@@ -0,0 +1,45 @@
+"""Unit tests for how the action plugin names its Platform Manager.
+
+By default each inventory host gets its own manager; with
+``meraki_manager_scope: credential`` all hosts sharing a dashboard URL
+and API key share one.
+"""
+
+from __future__ import annotations
+
+import pytest
+from ansible.errors import AnsibleError
+
+from plugins.action.base_action import BaseResourceActionPlugin
+
+URL = 'https://api.meraki.com/api/v1'
+KEY = 'secret-api-key'
+
+stem = BaseResourceActionPlugin._manager_stem
+
+
+class TestManagerStem:
+    """Runtime file stems per scope."""
+
+    def test_host_scope_is_default(self):
+        assert stem('site1', URL, KEY) == 'manager_site1'
+        assert stem('site1', URL, KEY, 'host') == 'manager_site1'
+
+    def test_credential_scope_shared_across_hosts(self):
+        assert stem('site1', URL, KEY, 'credential') == \
+            stem('site2', URL, KEY, 'credential')
+
+    def test_credential_scope_separates_credentials(self):
+        assert stem('site1', URL, KEY, 'credential') != \
+            stem('site1', URL, 'other-key', 'credential')
+        assert stem('site1', URL, KEY, 'credential') != \
+            stem('site1', 'https://api.meraki.cn/api/v1', KEY, 'credential')
+
+    def test_credential_stem_does_not_leak_key(self):
+        name = stem('site1', URL, KEY, 'credential')
+        assert KEY not in name
+        assert name.startswith('manager_') and len(name) == len('manager_') + 16
+
+    def test_unknown_scope_rejected(self):
+        with pytest.raises(AnsibleError, match='meraki_manager_scope'):
+            stem('site1', URL, KEY, 'org')
@@ -25,7 +25,12 @@ import yaml
 
 from plugins.plugin_utils.mcp.schema import dataclass_to_json_schema
 from plugins.plugin_utils.mcp.introspect import build_tool_definitions
-from plugins.plugin_utils.mcp.server import _build_ansible_task
+from plugins.plugin_utils.manager.async_platform import AsyncPlatformService
+from plugins.plugin_utils.mcp.server import (
+    _build_ansible_task,
+    _close_live,
+    _execute_live,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -302,6 +307,59 @@ def test_fqcn_format() -> None:
     assert "cisco.meraki_rm.meraki_wireless_rf_profile" in tasks[0]
 
 
+# ---------------------------------------------------------------------------
+# server.py — live mode service
+# ---------------------------------------------------------------------------
+
+class _Client:
+    """Stand-in for httpx.AsyncClient; records closing."""
+
+    closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _RecordingService(AsyncPlatformService):
+    """AsyncPlatformService recording execute() calls instead of sending."""
+
+    def __init__(self) -> None:
+        super().__init__("https://dash.example/api/v1", "key", client=_Client())
+        self.calls: list = []
+
+    async def execute(self, operation, module_name, user_data_dict):
+        self.calls.append((operation, module_name, user_data_dict["vlan_id"]))
+        return {"vlan_id": user_data_dict["vlan_id"]}
+
+
+def test_execute_live_awaits_async_service(
+    tool_index: dict[str, dict[str, Any]],
+) -> None:
+    """Verify live calls go through the shared async service."""
+    service = _RecordingService()
+    result = asyncio.run(_execute_live(
+        "meraki_vlan",
+        {"network_id": "N_1", "state": "gathered",
+         "config": [{"vlan_id": "10"}, {"vlan_id": "20"}]},
+        tool_index["meraki_vlan"]["_metadata"],
+        service,
+    ))
+
+    assert result["results"] == [{"vlan_id": "10"}, {"vlan_id": "20"}]
+    assert service.calls == [("find", "vlan", "10"), ("find", "vlan", "20")]
+
+
+def test_close_live_closes_service() -> None:
+    """Verify the live-mode service's connection pool is closed."""
+    service = _RecordingService()
+    live: dict[str, Any] = {"service": service}
+    asyncio.run(_close_live(live))
+    asyncio.run(_close_live(live))
+
+    assert service.client.closed
+    assert live == {}
+
+
 # ---------------------------------------------------------------------------
 # End-to-end MCP server via ClientSession
 # ---------------------------------------------------------------------------
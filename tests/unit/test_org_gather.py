@@ -0,0 +1,39 @@
+"""Unit tests for organization-wide gathers of device-scoped modules."""
+
+from __future__ import annotations
+
+from plugins.action.base_action import BaseResourceActionPlugin
+
+
+class FakePlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'switch_port'
+    SCOPE_PARAM = 'serial'
+
+
+_ARGSPEC = {
+    'argument_spec': {
+        'config': {
+            'suboptions': {'port_id': {'type': 'str'}, 'name': {'type': 'str'}},
+        },
+    },
+}
+
+
+def _plugin():
+    return FakePlugin.__new__(FakePlugin)
+
+
+class TestValidateOutputKeep:
+    """Items gathered across an org keep their scope key."""
+
+    def test_scope_key_dropped_by_default(self):
+        items = [{'port_id': '1', 'name': 'a', 'serial': 'Q1'}]
+        assert _plugin()._validate_output(items, _ARGSPEC) == [
+            {'port_id': '1', 'name': 'a'},
+        ]
+
+    def test_scope_key_kept(self):
+        items = [{'port_id': '1', 'name': None, 'serial': 'Q1', 'extra': 1}]
+        assert _plugin()._validate_output(
+            items, _ARGSPEC, keep=('serial',),
+        ) == [{'port_id': '1', 'serial': 'Q1'}]
@@ -0,0 +1,101 @@
+"""Unit tests for ``scopes``: one task reconciled across several scopes."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Optional
+
+from plugins.action.base_action import BaseResourceActionPlugin
+
+
+@dataclass
+class FakeUser:
+    network_id: Optional[str] = None
+    item_id: Optional[str] = None
+    name: Optional[str] = None
+
+
+class FakePlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'test_resource'
+    SCOPE_PARAM = 'network_id'
+    CANONICAL_KEY = 'item_id'
+    SUPPORTS_DELETE = True
+
+
+class ScopedManager:
+    """Keeps items per network; mutations in *failing* networks raise."""
+
+    def __init__(self, items, failing=()):
+        self.items = items
+        self.failing = set(failing)
+        self.calls = []
+
+    def execute_scoped(self, groups, scope_param):
+        self.calls.append([[op for op, _, _ in group] for group in groups])
+        return [[self._outcome(*op) for op in group] for group in groups]
+
+    def _outcome(self, op, module_name, user_data):
+        data = asdict(user_data)
+        network_id = data.pop('network_id')
+        network = self.items.setdefault(network_id, {})
+        if op == 'find':
+            return {'result': {'config': list(network.values())}}
+        if network_id in self.failing:
+            return {'error': 'boom', 'error_type': 'HTTPError'}
+        network[data['item_id']] = data
+        return {'result': data}
+
+    def cache_stats(self):
+        return {}
+
+
+def _plugin(check_mode=False):
+    plugin = FakePlugin.__new__(FakePlugin)
+    plugin._task = SimpleNamespace(check_mode=check_mode, diff=False)
+    plugin._task_stats = None
+    plugin._manager_socket = None
+    return plugin
+
+
+CONFIG = [{'item_id': '1', 'name': 'Alpha'}]
+
+
+class TestRunScoped:
+
+    def test_per_scope_before_after(self):
+        manager = ScopedManager({
+            'N1': {'1': {'item_id': '1', 'name': 'Alpha'}},
+            'N2': {},
+        })
+        result = _plugin()._run_scoped(
+            manager, FakeUser, None, ['N1', 'N2', 'N1'], 'merged', CONFIG,
+        )
+        assert result['changed'] is True and not result['failed']
+        by_scope = {r['network_id']: r for r in result['scope_results']}
+        assert list(by_scope) == ['N1', 'N2']
+        assert by_scope['N1']['changed'] is False
+        assert by_scope['N2']['before'] == []
+        assert by_scope['N2']['after'] == [{'item_id': '1', 'name': 'Alpha'}]
+        # One call gathers every scope, one applies the changed scope only
+        assert manager.calls == [[['find'], ['find']], [['create']]]
+
+    def test_failed_scope_reported_alone(self):
+        manager = ScopedManager({'N_ok': {}, 'N_bad': {}}, failing={'N_bad'})
+        result = _plugin()._run_scoped(
+            manager, FakeUser, None, ['N_ok', 'N_bad'], 'merged', CONFIG,
+        )
+        assert result['failed'] is True
+        assert result['msg'] == '1 of 2 scopes failed: N_bad'
+        ok, bad = result['scope_results']
+        assert ok['changed'] is True and 'failed' not in ok
+        assert bad['msg'] == 'test_resource failed: boom'
+        assert bad['after'] == []
+
+    def test_check_mode_applies_nothing(self):
+        manager = ScopedManager({'N1': {}, 'N2': {}})
+        result = _plugin(check_mode=True)._run_scoped(
+            manager, FakeUser, None, ['N1', 'N2'], 'merged', CONFIG,
+        )
+        assert result['changed'] is True
+        assert len(manager.calls) == 1
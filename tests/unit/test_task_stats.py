@@ -0,0 +1,61 @@
+"""Unit tests for the optional ``meraki_stats`` task result block."""
+
+from __future__ import annotations
+
+from plugins.action.base_action import BaseResourceActionPlugin
+from plugins.plugin_utils.manager.metrics import CallStats
+
+
+class FakePlugin(BaseResourceActionPlugin):
+    MODULE_NAME = 'test_resource'
+
+
+class FakeTask:
+    diff = False
+
+
+def _plugin(stats):
+    p = FakePlugin.__new__(FakePlugin)
+    p._manager_socket = None
+    p._manager_authkey_b64 = None
+    p._task = FakeTask()
+    p._task_started = 0.0
+    p._task_stats = stats
+    return p
+
+
+class TestTaskStats:
+    """_build_result reports the task's API cost when enabled."""
+
+    def test_absent_by_default(self):
+        assert 'meraki_stats' not in _plugin(None)._build_result(failed=False)
+
+    def test_block_from_merged_call_stats(self):
+        stats = CallStats()
+        stats.merge({
+            'http_calls': {'GET': 3, 'PUT': 1}, 'pages': 2,
+            'bytes_received': 2048, 'cache_hits': 1,
+            'rate_limit_wait_seconds': 0.1, 'http_seconds': 0.3,
+            'transform_seconds': 0.01, 'manager_seconds': 0.35,
+            'rpc_seconds': 0.4,
+        })
+        p = _plugin(stats)
+        with p._measure('validation_seconds'):
+            pass
+
+        block = p._build_result(failed=False, changed=True)['meraki_stats']
+        assert block['http_calls'] == {'GET': 3, 'PUT': 1}
+        assert block['pages'] == 2
+        assert block['bytes_received'] == 2048
+        assert block['cache_hits'] == 1
+        assert block['rate_limit_wait_seconds'] == 0.1
+        assert block['seconds']['rpc'] == 0.4
+        assert block['seconds']['manager'] == 0.35
+        assert block['seconds']['http'] == 0.3
+        assert block['seconds']['transform'] == 0.01
+        assert block['seconds']['validation'] >= 0
+        assert block['seconds']['total'] > 0
+
+    def test_failed_result_still_reports(self):
+        result = _plugin(CallStats())._build_result(failed=True, msg='boom')
+        assert result['meraki_stats']['http_calls'] == {}
@@ -0,0 +1,73 @@
+"""Shared helpers for the manager benchmarks.
+
+Benchmarks run from the collection root::
+
+    python -m tools.benchmarks.<name> [options]
+
+Each benchmark prints a small fixed-width table so results can be pasted
+into a PR description or redirected to ``bench_output.txt``.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SPEC = PROJECT_ROOT / "spec3.json"
+
+for _p in (str(PROJECT_ROOT), str(PROJECT_ROOT / "tools")):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+
+@contextmanager
+def serve_mock(spec_path: str, latency_ms: float = 0.0) -> Iterator[str]:
+    """Run the stateful mock server on an ephemeral local port.
+
+    Args:
+        spec_path: Path to the OpenAPI spec (``spec3.json``)
+        latency_ms: Artificial per-request latency, standing in for the
+            round-trip time to the real Dashboard
+
+    Yields:
+        Base URL of the running server
+    """
+    from werkzeug.serving import make_server
+    from mock_server.server import create_app
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    app = create_app(str(spec_path))
+    if latency_ms:
+        delay = latency_ms / 1000.0
+
+        @app.before_request
+        def _simulated_latency():
+            time.sleep(delay)
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def print_table(headers: Sequence[str], rows: List[Sequence]) -> None:
+    """Print rows as a right-aligned fixed-width table."""
+    cells = [[str(h) for h in headers]] + [
+        [f"{c:.3f}" if isinstance(c, float) else str(c) for c in row]
+        for row in rows
+    ]
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    for i, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if i == 0:
+            print("  ".join("-" * w for w in widths))
@@ -0,0 +1,103 @@
+"""Benchmark: PlatformService throughput versus Ansible fork count.
+
+Simulates ``forks: N`` by driving one shared PlatformService from N
+threads — exactly what ``PlatformManager``'s ThreadingMixIn does when N
+workers are connected — against the mock server with an artificial
+per-request latency.  Every simulated fork gathers VLANs from its own
+network, so the calls are fully independent.  Per-org pacing is
+disabled (``rate_limit=0``) so only connection concurrency is measured.
+
+Two configurations are measured for each fork count:
+
+- ``serial``: ``max_connections=1`` — equivalent to the old global
+  session lock, one request in flight at a time.
+- ``pooled``: ``max_connections=<--max-connections>`` — the session pool.
+
+Usage::
+
+    python -m tools.benchmarks.http_concurrency --spec spec3.json
+    python -m tools.benchmarks.http_concurrency --forks 1 5 10 20 --latency-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from .common import DEFAULT_SPEC, print_table, serve_mock
+
+from plugins.plugin_utils.manager.platform_manager import PlatformService
+
+
+def _seed(base_url: str, forks: int) -> None:
+    """Create one VLAN in each simulated fork's network."""
+    svc = PlatformService(base_url, "bench-key", rate_limit=0)
+    for i in range(forks):
+        svc.execute("create", "vlan", {
+            "network_id": f"N_bench_{i}",
+            "vlan_id": "100",
+            "name": f"bench-{i}",
+            "subnet": "10.0.0.0/24",
+            "appliance_ip": "10.0.0.1",
+        })
+
+
+def _run(base_url: str, forks: int, calls: int, max_connections: int) -> float:
+    """Return wall-clock seconds for *forks* x *calls* gathers."""
+    svc = PlatformService(
+        base_url, "bench-key",
+        max_connections=max_connections, rate_limit=0,
+    )
+    barrier = threading.Barrier(forks + 1)
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        for _ in range(calls):
+            svc.execute("find", "vlan", {"network_id": f"N_bench_{i}"})
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(forks)
+    ]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", default=str(DEFAULT_SPEC))
+    parser.add_argument("--forks", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    parser.add_argument("--calls", type=int, default=20,
+                        help="gathers per simulated fork (default: 20)")
+    parser.add_argument("--latency-ms", type=float, default=25.0,
+                        help="simulated Dashboard latency (default: 25)")
+    parser.add_argument("--max-connections", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    with serve_mock(args.spec, args.latency_ms) as base_url:
+        _seed(base_url, max(args.forks))
+        for forks in args.forks:
+            total = forks * args.calls
+            serial = _run(base_url, forks, args.calls, 1)
+            pooled = _run(base_url, forks, args.calls, args.max_connections)
+            rows.append((
+                forks, total,
+                total / serial, total / pooled, serial / pooled,
+            ))
+
+    print(f"latency={args.latency_ms}ms  calls/fork={args.calls}  "
+          f"max_connections={args.max_connections}")
+    print_table(
+        ("forks", "calls", "serial req/s", "pooled req/s", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark: per-execute cost of preparing endpoint requests.
+
+Measures the manager-side overhead of turning one resource into its
+endpoint calls (no HTTP), for every module and operation type:
+
+- ``legacy``: what ``execute()`` did before compiled plans —
+  call ``get_endpoint_operations()``, filter by operation, run the
+  dependency sort and fill each path with ``str.replace``.
+- ``compiled``: look up the cached ``OperationPlan`` from the loader and
+  resolve each ``CompiledOperation``.
+
+Usage::
+
+    python -m tools.benchmarks.operation_plan
+    python -m tools.benchmarks.operation_plan --iterations 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from .common import print_table
+
+from plugins.plugin_utils.platform.loader import DynamicClassLoader
+from plugins.plugin_utils.platform.operation_plan import sort_operations
+from plugins.plugin_utils.platform.registry import APIVersionRegistry
+
+OPERATIONS = ("create", "update", "delete", "find")
+
+
+def _legacy(mixin_class, operation, api_data, user_data):
+    """Request preparation as done before compiled plans."""
+    operations = {
+        name: op for name, op in mixin_class.get_endpoint_operations().items()
+        if op.required_for is None or op.required_for == operation
+    }
+    requests = []
+    for name in sort_operations(operations):
+        op = operations[name]
+        body = {}
+        for field in op.fields:
+            if field in api_data and api_data[field] is not None:
+                body[field] = api_data[field]
+            elif field in user_data and user_data[field] is not None:
+                body[field] = user_data[field]
+        path = op.path
+        for param in op.path_params or []:
+            val = api_data.get(param) or user_data.get(param)
+            if val is None:
+                for alt in (op.path_param_aliases or {}).get(param, []):
+                    val = api_data.get(alt) or user_data.get(alt)
+                    if val is not None:
+                        break
+            if val is None:
+                path = None
+                break
+            path = path.replace(f"{{{param}}}", str(val))
+        requests.append((path, body))
+    return requests
+
+
+def _compiled(loader, mixin_class, operation, api_data, user_data):
+    """Request preparation through the cached OperationPlan."""
+    return [
+        (op.resolve_path(api_data, user_data, {}),
+         op.build_body(api_data, user_data))
+        for op in loader.load_operation_plan(mixin_class, operation)
+    ]
+
+
+def _sample_data(mixin_class):
+    """API data filling every field and path parameter of the module."""
+    data = {}
+    for op in mixin_class.get_endpoint_operations().values():
+        for name in op.fields:
+            data[name] = "value"
+        for param in op.path_params or []:
+            data[param] = "X1"
+    return data
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000,
+                        help="executes per module and operation (default: 2000)")
+    args = parser.parse_args()
+
+    registry = APIVersionRegistry()
+    loader = DynamicClassLoader(registry)
+    modules = [
+        m for m in registry.get_modules_for_version("1")
+        if not m.endswith("_test")
+    ]
+
+    rows = []
+    for operation in OPERATIONS:
+        legacy_total = compiled_total = 0.0
+        for module in modules:
+            _, _, mixin = loader.load_classes_for_module(module, "1")
+            api_data = _sample_data(mixin)
+            legacy_total += _time(
+                lambda: _legacy(mixin, operation, api_data, {}),
+                args.iterations,
+            )
+            compiled_total += _time(
+                lambda: _compiled(loader, mixin, operation, api_data, {}),
+                args.iterations,
+            )
+        calls = args.iterations * len(modules)
+        rows.append((
+            operation,
+            legacy_total / calls * 1e6,
+            compiled_total / calls * 1e6,
+            legacy_total / compiled_total,
+        ))
+
+    print(f"modules={len(modules)}  iterations={args.iterations}")
+    print_table(
+        ("operation", "legacy us/exec", "compiled us/exec", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
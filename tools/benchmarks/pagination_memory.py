@@ -0,0 +1,192 @@
+"""Benchmark: peak memory of large paginated listings, materialized vs. streamed.
+
+Serves a synthetic organization of ``--devices`` devices (spread over
+``--networks`` networks) and as many policy objects from an in-process
+session that paginates with Link headers like the Dashboard, honouring
+``perPage``.  No mock server or network is involved.
+
+Two workloads:
+
+- ``facts``: ``gather_subset: devices`` for one network, which lists
+  every device in the org and keeps that network's.
+- ``find``: a ``policy_object`` find, which transforms every object to
+  the User Model.
+
+Each is run two ways:
+
+- ``materialize``: all pages are collected into one raw list first
+  (``_paginated_get``), then filtered or transformed.
+- ``stream``: ``PlatformService`` as shipped; items are filtered or
+  transformed as each page arrives.
+
+Every run happens in a forked child; the peak RSS growth over the
+child's baseline is reported.  The response cache is disabled so that
+retained pages do not hide the difference.
+
+Usage::
+
+    python -m tools.benchmarks.pagination_memory
+    python -m tools.benchmarks.pagination_memory --devices 20000 --per-page 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import resource
+import time
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from .common import print_table
+
+from plugins.plugin_utils.manager import platform_manager
+from plugins.plugin_utils.manager.platform_manager import PlatformService
+
+ORG = "O_bench"
+
+
+def _device(i: int, networks: int) -> dict:
+    return {
+        "serial": f"Q2XX-{i // 10000:04d}-{i % 10000:04d}",
+        "name": f"device-{i}",
+        "mac": f"00:18:0a:{i >> 16 & 255:02x}:{i >> 8 & 255:02x}:{i & 255:02x}",
+        "networkId": f"N_{i % networks}",
+        "model": "MS225-48FP",
+        "productType": "switch",
+        "firmware": "switch-16-8",
+        "lanIp": f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}",
+        "tags": ["bench", f"rack-{i % 40}"],
+        "address": "500 Terry A Francois Blvd, San Francisco, CA",
+        "lat": 37.7703, "lng": -122.3871,
+        "notes": "", "url": f"https://n1.meraki.com/dev/{i}",
+    }
+
+
+def _policy_object(i: int, networks: int) -> dict:
+    return {
+        "id": str(i), "name": f"object-{i}", "category": "network",
+        "type": "cidr", "cidr": f"10.{i >> 16 & 255}.{i >> 8 & 255}.0/24",
+        "groupIds": [], "networkIds": [f"N_{i % networks}"],
+        "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+
+class _SyntheticOrg(requests.Session):
+    """Builds each requested page on the fly, Link-paginated."""
+
+    size = 0
+    networks = 1
+    requests_sent = 0
+
+    def request(self, method, url, **kwargs):
+        type(self).requests_sent += 1
+        parts = urlparse(url)
+        query = parse_qs(parts.query)
+        per_page = int(query.get("perPage", ["1000"])[0])
+        start = int(query.get("startingAfter", ["0"])[0])
+        end = min(start + per_page, self.size)
+        make = _device if parts.path.endswith("/devices") else _policy_object
+
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps(
+            [make(i, self.networks) for i in range(start, end)]
+        ).encode()
+        if end < self.size:
+            resp.headers["Link"] = (
+                f"<{url.split('?', 1)[0]}?perPage={per_page}&startingAfter={end}>; "
+                "rel=next"
+            )
+        return resp
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() // 1024
+
+
+def _run(workload: str, mode: str, conn) -> None:
+    service = PlatformService(
+        "https://dash.example/api/v1", "bench-key",
+        session_factory=_SyntheticOrg, rate_limit=0, cache_ttl=0,
+    )
+    # Imports and transform setup are not part of the measurement
+    _, api_class, mixin_class = service.loader.load_classes_for_module(
+        "policy_object", service.api_version,
+    )
+    service.loader.load_operation_plan(mixin_class, "find")
+    api_class.to_ansible_many([_policy_object(0, 1)], {})
+    base = _rss_kb()
+    start = time.perf_counter()
+    _SyntheticOrg.requests_sent = 0
+
+    if workload == "facts":
+        network = "N_1"
+        if mode == "materialize":
+            devices = service._paginated_get(
+                f"{service.base_url}/organizations/{ORG}/devices"
+            )
+            result = [d for d in devices if d.get("networkId") == network]
+            del devices
+        else:
+            result = service.execute("find", "facts", {
+                "gather_subset": ["devices"],
+                "organization_id": ORG, "network_id": network,
+            })["devices"]
+    else:
+        url = f"{service.base_url}/organizations/{ORG}/policyObjects"
+        if mode == "materialize":
+            result = api_class.to_ansible_many(service._paginated_get(url), {})
+        else:
+            result = service.execute(
+                "find", "policy_object", {"organization_id": ORG},
+            )["config"]
+
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    conn.send((
+        len(result), _SyntheticOrg.requests_sent, (peak - base) / 1024, elapsed,
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=100_000)
+    parser.add_argument("--networks", type=int, default=100)
+    parser.add_argument(
+        "--per-page", type=int, default=0,
+        help="override perPage for both listings (default: endpoint maximum)",
+    )
+    args = parser.parse_args()
+
+    _SyntheticOrg.size = args.devices
+    _SyntheticOrg.networks = args.networks
+    if args.per_page:
+        for path in ("/organizations/{organizationId}/devices",
+                     "/organizations/{organizationId}/policyObjects"):
+            platform_manager._PER_PAGE_MAX[path] = args.per_page
+
+    ctx = multiprocessing.get_context("fork")
+    results = []
+    for workload in ("facts", "find"):
+        for mode in ("materialize", "stream"):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_run, args=(workload, mode, child))
+            proc.start()
+            items, sent, peak_mb, elapsed = parent.recv()
+            proc.join()
+            results.append((workload, mode, items, sent, peak_mb, elapsed))
+
+    print(f"devices={args.devices}  networks={args.networks}  "
+          f"per_page={args.per_page or 'max'}")
+    print_table(
+        ("workload", "mode", "items", "requests", "peak RSS +MB", "seconds"),
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark: per-task RPC latency, manager proxy vs. framed transport.
+
+Spawns one PlatformManager process the way ``_get_or_spawn_manager``
+does, serving both transports.  It then times what every Ansible task
+pays to reach it:
+
+- ``connect``: opening a client (``ManagerRPCClient`` runs the
+  BaseManager handshake and proxy creation; ``FrameRPCClient`` only
+  connects).
+- ``connect+execute``: a fresh client plus one ``find``.  This is the
+  per-task cost, because each task runs in a new fork.
+- ``execute``: one more ``find`` on an open client.
+
+The ``find`` gathers ``--rows`` VLANs that are seeded on the mock
+server.  It is served from the manager's response cache after the first
+call, so the timings are dominated by the transport, not by HTTP.
+
+Usage::
+
+    python -m tools.benchmarks.rpc_latency --spec spec3.json
+    python -m tools.benchmarks.rpc_latency --rows 1 1000 --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import secrets
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from .common import DEFAULT_SPEC, print_table, serve_mock
+
+from plugins.plugin_utils.manager.frame_rpc import (
+    FrameRPCClient,
+    frame_address,
+    serve_frames,
+)
+from plugins.plugin_utils.manager.platform_manager import (
+    PlatformManager,
+    PlatformService,
+)
+from plugins.plugin_utils.manager.rpc_client import ManagerRPCClient
+
+
+def _seed(base_url: str, network: str, rows: int) -> None:
+    svc = PlatformService(base_url, "bench-key", rate_limit=0)
+    for i in range(rows):
+        svc.execute("create", "vlan", {
+            "network_id": network,
+            "vlan_id": str(100 + i),
+            "name": f"bench-{i}",
+            "subnet": "10.0.0.0/24",
+            "appliance_ip": "10.0.0.1",
+        })
+
+
+def _median_us(samples):
+    return statistics.median(samples) * 1e6
+
+
+def _measure(factory, network: str, iterations: int):
+    """Median connect, connect+execute and execute times for one client."""
+    query = {"network_id": network}
+    connect, task, execute = [], [], []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client = factory()
+        connected = time.perf_counter()
+        client.execute("find", "vlan", query)
+        done = time.perf_counter()
+        client.execute("find", "vlan", query)
+        again = time.perf_counter()
+        connect.append(connected - start)
+        task.append(done - start)
+        execute.append(again - done)
+    return _median_us(connect), _median_us(task), _median_us(execute)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", default=str(DEFAULT_SPEC))
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 500])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+
+    results = []
+    with serve_mock(args.spec) as base_url, \
+            tempfile.TemporaryDirectory() as tmp:
+        socket_path = str(Path(tmp) / "manager_bench.sock")
+        frame_path = frame_address(socket_path)
+        authkey = secrets.token_bytes(32)
+
+        service = PlatformService(base_url, "bench-key", rate_limit=0)
+        PlatformManager.register("get_platform_service", callable=lambda: service)
+        manager = PlatformManager(address=socket_path, authkey=authkey)
+        manager.start(
+            initializer=serve_frames,
+            initargs=(frame_path, service, authkey),
+        )
+        while not Path(frame_path).exists():
+            time.sleep(0.01)
+
+        try:
+            for rows in args.rows:
+                network = f"N_rpc_{rows}"
+                _seed(base_url, network, rows)
+                transports = (
+                    ("manager", lambda: ManagerRPCClient(
+                        base_url, socket_path, authkey,
+                    )),
+                    ("framed", lambda: FrameRPCClient(
+                        base_url, frame_path, authkey,
+                    )),
+                )
+                for name, factory in transports:
+                    results.append((
+                        rows, name,
+                        *_measure(factory, network, args.iterations),
+                    ))
+        finally:
+            manager.shutdown()
+
+    print(f"iterations={args.iterations}  (median us)")
+    print_table(
+        ("rows", "transport", "connect", "connect+execute", "execute"),
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark: manager spawn time and first-task latency per module.
+
+Spawns a PlatformManager the way ``_get_or_spawn_manager`` does, waits
+``--idle-ms`` to stand in for the gap before the next task, then times
+the first ``find`` for each of ``--modules`` over a fresh
+``ManagerRPCClient``.  That first call is what every later task pays
+for a module it has not used before.
+
+Two configurations are measured:
+
+- ``cold``: the initializer only starts the framed RPC server.  Each
+  module's first call imports its classes, compiles its plans and, on
+  the very first call, opens the HTTPS connection.
+- ``warm``: ``init_manager_process``, which also runs
+  ``PlatformService.warm_up`` on a background thread.
+
+Per-org pacing is disabled (``rate_limit=0``).
+
+Usage::
+
+    python -m tools.benchmarks.spawn_latency --spec spec3.json
+    python -m tools.benchmarks.spawn_latency --idle-ms 200 --latency-ms 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import secrets
+import tempfile
+import time
+from pathlib import Path
+
+from .common import DEFAULT_SPEC, print_table, serve_mock
+
+from plugins.plugin_utils.manager.frame_rpc import frame_address, serve_frames
+from plugins.plugin_utils.manager.platform_manager import (
+    PlatformManager,
+    PlatformService,
+    init_manager_process,
+)
+from plugins.plugin_utils.manager.rpc_client import ManagerRPCClient
+
+DEFAULT_MODULES = [
+    "vlan", "group_policy", "firewall", "ssid", "static_route", "switch_stack",
+]
+
+
+def _cold(service, frame_path, authkey):
+    serve_frames(frame_path, service, authkey)
+
+
+def _run(base_url: str, initializer, modules, idle: float):
+    """Return (spawn ms, {module: first find ms})."""
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = str(Path(tmp) / "manager_bench.sock")
+        authkey = secrets.token_bytes(32)
+        service = PlatformService(base_url, "bench-key", rate_limit=0)
+        PlatformManager.register("get_platform_service", callable=lambda: service)
+        manager = PlatformManager(address=socket_path, authkey=authkey)
+
+        start = time.perf_counter()
+        manager.start(
+            initializer=initializer,
+            initargs=(service, frame_address(socket_path), authkey),
+        )
+        spawn = time.perf_counter() - start
+        time.sleep(idle)
+
+        first = {}
+        try:
+            for module in modules:
+                client = ManagerRPCClient(base_url, socket_path, authkey)
+                start = time.perf_counter()
+                client.execute("find", module, {"network_id": "N_bench"})
+                first[module] = time.perf_counter() - start
+        finally:
+            manager.shutdown()
+    return spawn * 1e3, {m: t * 1e3 for m, t in first.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", default=str(DEFAULT_SPEC))
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--idle-ms", type=float, default=500.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    results = []
+    with serve_mock(args.spec, args.latency_ms) as base_url:
+        for name, initializer in (("cold", _cold), ("warm", init_manager_process)):
+            spawn, first = _run(
+                base_url, initializer, args.modules, args.idle_ms / 1e3,
+            )
+            results.append((
+                name, spawn, first[args.modules[0]],
+                sum(first.values()) / len(first),
+            ))
+
+    print(f"modules={len(args.modules)}  idle={args.idle_ms:g}ms  (ms)")
+    print_table(
+        ("mode", "spawn", "first task", "mean first call per module"),
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark: API -> User Model transform cost per row.
+
+Times the transform of gathered rows through the paths of
+``BaseTransformMixin``:
+
+- ``generic``: ``_transform_generic`` on an API instance — ``asdict``
+  deep copy, then a dotted-path walk per mapped field and a fresh
+  valid-field set.
+- ``compiled``: ``_transform`` on an API instance with the class's
+  cached ``CompiledTransform`` — direct attribute reads, no copy.
+- ``per-item``: what the manager did per raw API dict before
+  ``to_ansible_many`` — construct, ``to_ansible()``, ``asdict``.
+- ``many``: ``to_ansible_many`` over the raw API dicts.
+
+Rows are synthetic: every API field is populated, and every third field
+carries a small nested list/dict like real port or policy payloads.
+
+Usage::
+
+    python -m tools.benchmarks.transform
+    python -m tools.benchmarks.transform --rows 5000 --modules switch_port admin
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import asdict, fields
+
+from .common import print_table
+
+from plugins.plugin_utils.platform.loader import DynamicClassLoader
+from plugins.plugin_utils.platform.registry import APIVersionRegistry
+
+DEFAULT_MODULES = ["switch_port", "policy_object", "admin", "vlan", "ssid"]
+
+
+def _row(api_class, i):
+    """One synthetic API instance with every field populated."""
+    data = {}
+    for n, f in enumerate(fields(api_class)):
+        if n % 3 == 2:
+            data[f.name] = {"items": [{"id": i, "value": f.name}] * 3}
+        else:
+            data[f.name] = f"{f.name}-{i}"
+    return api_class(**data)
+
+
+def _time(rows, transform):
+    start = time.perf_counter()
+    for row in rows:
+        transform(row)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    args = parser.parse_args()
+
+    loader = DynamicClassLoader(APIVersionRegistry())
+    context = {}
+    results = []
+    for module in args.modules:
+        _, api_class, _ = loader.load_classes_for_module(module, "1")
+        user_class = api_class._get_ansible_class()
+        rows = [_row(api_class, i) for i in range(args.rows)]
+
+        generic = _time(rows, lambda r: r._transform_generic(
+            user_class, "reverse", context,
+        ))
+        compiled = _time(rows, lambda r: r._transform(
+            user_class, "reverse", context,
+        ))
+        raw = [asdict(r) for r in rows]
+        per_item = _time(raw, lambda d: asdict(api_class(**d).to_ansible(context)))
+        start = time.perf_counter()
+        api_class.to_ansible_many(raw, context)
+        many = time.perf_counter() - start
+
+        us = 1e6 / args.rows
+        results.append((
+            module,
+            len(api_class._field_mapping or {}),
+            generic * us, compiled * us, per_item * us, many * us,
+        ))
+
+    print(f"rows={args.rows}  (us per row)")
+    print_table(
+        ("module", "fields", "generic", "compiled", "per-item", "many"),
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ import logging
 import os
 import re
 import sys
+import uuid
 from typing import Any, Dict, Optional, Tuple
 
 from flask import Flask, Response, jsonify, request
@@ -133,6 +134,9 @@ def create_app(spec_path: str) -> Flask:
         """Dump current state for debugging."""
         return jsonify(store.dump())
 
+    # Action batches replay their actions against the routes below
+    _register_action_batches(app, store)
+
     # Auto-register routes from the spec
     _register_spec_routes(app, loader, store)
 
@@ -144,6 +148,97 @@ def create_app(spec_path: str) -> Flask:
     return app
 
 
+_ACTION_BATCH_RE = re.compile(
+    r'^/organizations/(?P<org>[^/]+)/actionBatches(?:/(?P<batch>[^/]+))?$'
+)
+_BATCH_METHODS = {'create': 'POST', 'update': 'PUT', 'destroy': 'DELETE'}
+
+
+def _register_action_batches(app: Flask, store: StateStore) -> None:
+    """Execute action batches instead of storing them as plain resources.
+
+    ``POST /organizations/{organizationId}/actionBatches`` replays each
+    action through the app's own routes.  If any action fails, the
+    store is restored to its pre-batch snapshot (batches are atomic).
+    Batches always run to completion immediately, so asynchronous
+    batches report ``completed`` on the first status poll.
+
+    Args:
+        app: Flask application
+        store: State store instance
+    """
+    batches: Dict[str, Dict[str, Any]] = {}
+
+    @app.before_request
+    def handle_action_batch():
+        match = _ACTION_BATCH_RE.match(request.path)
+        if not match:
+            return None
+        org_id, batch_id = match.group('org'), match.group('batch')
+
+        if request.method == 'GET':
+            if batch_id:
+                batch = batches.get(batch_id)
+                if batch is None:
+                    return jsonify({'errors': ['Resource not found']}), 404
+                return jsonify(batch), 200
+            return jsonify([
+                b for b in batches.values() if b['organizationId'] == org_id
+            ]), 200
+
+        if request.method != 'POST' or batch_id:
+            return None
+
+        body = request.get_json(silent=True) or {}
+        actions = body.get('actions', [])
+        snapshot = copy.deepcopy(store._store)
+        client = app.test_client()
+        errors, created = [], []
+        for index, action in enumerate(actions):
+            method = _BATCH_METHODS.get(action.get('operation'))
+            if method is None:
+                errors.append(
+                    f"actions[{index}]: unsupported operation "
+                    f"'{action.get('operation')}'"
+                )
+                break
+            resp = client.open(
+                action.get('resource', ''), method=method,
+                json=action.get('body') if method != 'DELETE' else None,
+            )
+            if resp.status_code >= 400:
+                errors.append(
+                    f"actions[{index}]: {method} {action.get('resource')} "
+                    f"returned {resp.status_code}"
+                )
+                break
+            if method == 'POST':
+                data = resp.get_json(silent=True) or {}
+                created.append({
+                    'id': str(data.get('id', '')),
+                    'uri': action.get('resource'),
+                })
+
+        if errors:
+            store._store = snapshot
+
+        batch = {
+            'id': uuid.uuid4().hex[:12],
+            'organizationId': org_id,
+            'confirmed': body.get('confirmed', False),
+            'synchronous': body.get('synchronous', False),
+            'status': {
+                'completed': not errors,
+                'failed': bool(errors),
+                'errors': errors,
+                'createdResources': created if not errors else [],
+            },
+            'actions': actions,
+        }
+        batches[batch['id']] = batch
+        return jsonify(batch), 201
+
+
 def _register_spec_routes(
     app: Flask,
     loader: SpecLoader,